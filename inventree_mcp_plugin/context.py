@@ -1,15 +1,62 @@
-"""Thread-local storage for passing request context (user) to MCP tool handlers."""
+"""Request context (user, request id, start time) passed from the MCP view to tool handlers.
 
-import threading
+The context lives in a context variable rather than thread-local storage.
+asgiref copies context variables across async_to_sync / sync_to_async
+hops and asyncio tasks inherit them, so a tool sees the user of the
+request that invoked it whichever thread it runs on, and concurrent
+requests cannot observe each other's identity.
+"""
 
-_request_context = threading.local()
+import contextvars
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class RequestContext:
+    """Per-request state shared by every tool call made within one MCP request."""
+
+    user: object = None
+    request_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    started: float = field(default_factory=time.monotonic)
+    # Profile this request's tool calls (see tools.profiling); ids of the stored profiles
+    profile: bool = False
+    profile_ids: list = field(default_factory=list)
+
+
+_request_context = contextvars.ContextVar("inventree_mcp_request", default=None)
+
+
+def begin_request(user=None, request_id: str = "") -> contextvars.Token:
+    """Start a new request context. Pass the returned token to end_request()."""
+    ctx = RequestContext(user=user)
+    if request_id:
+        ctx.request_id = request_id
+    return _request_context.set(ctx)
+
+
+def end_request(token: contextvars.Token):
+    """Restore the context that was active before begin_request()."""
+    _request_context.reset(token)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    """Return the context of the current request, or None outside a request."""
+    return _request_context.get()
 
 
 def set_current_user(user):
-    """Store the authenticated user for the current request thread."""
-    _request_context.user = user
+    """Set the authenticated user on the current request context."""
+    ctx = _request_context.get()
+    if ctx is None:
+        _request_context.set(RequestContext(user=user))
+    else:
+        ctx.user = user
 
 
 def get_current_user():
-    """Retrieve the authenticated user for the current request thread."""
-    return getattr(_request_context, "user", None)
+    """Retrieve the authenticated user for the current request."""
+    ctx = _request_context.get()
+    return ctx.user if ctx is not None else None
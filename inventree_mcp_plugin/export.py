@@ -0,0 +1,166 @@
+"""Streaming exports of large result sets as NDJSON (or Server-Sent Events).
+
+MCP tool results are built in memory and buffered by the MCP transport,
+so list tools are meant for pages of tens to hundreds of rows. For bulk
+reads, GET /plugin/inventree-mcp/export/<resource> streams every matching
+row instead: the queryset is read with .iterator(chunk_size) and encoded
+into a buffer sent every CHUNK_BYTES, so memory stays flat however many
+rows match.
+
+Each line is one compact record, the same shape the list tools return;
+fields=a,b,c picks the keys like the tools' fields argument. The last
+line is {"done": true, "count": N}; a stream without it was cut short.
+"""
+
+import logging
+
+from .tools.encoding import ChunkWriter
+from .tools.queries import annotate_category_counts, annotate_location_counts, subtree_filter
+from .tools.search import filter_parts
+from .tools.serializers import (
+    PART_CATEGORY_COLUMNS,
+    PART_CATEGORY_COMPACT,
+    PART_COLUMNS,
+    PART_COMPACT,
+    STOCK_ITEM_COLUMNS,
+    STOCK_ITEM_COMPACT,
+    STOCK_LOCATION_COLUMNS,
+    STOCK_LOCATION_COMPACT,
+    project,
+    select_fields,
+    serialize_row,
+)
+
+logger = logging.getLogger("inventree_mcp_plugin.export")
+
+# Rows fetched from the database cursor at a time
+CHUNK_SIZE = 500
+
+# Bytes of encoded output sent per response chunk
+CHUNK_BYTES = 64 * 1024
+
+
+class ExportError(ValueError):
+    """Invalid export parameters (reported as HTTP 400)."""
+
+
+def _int_param(params, name: str) -> int:
+    value = params.get(name, "") or "0"
+    try:
+        return int(value)
+    except ValueError:
+        raise ExportError(f"Parameter '{name}' must be an integer, got '{value}'")
+
+
+def _bool_param(params, name: str) -> bool:
+    return str(params.get(name, "")).lower() in ("1", "true", "yes")
+
+
+def _parts(params):
+    from part.models import Part
+
+    qs = Part.objects.all()
+    ordering = ("pk",)
+    if search := params.get("search", ""):
+        qs, ordering = filter_parts(qs, search)
+    if category := _int_param(params, "category"):
+        qs = qs.filter(category_id=category)
+    return qs.order_by(*ordering), PART_COLUMNS, PART_COMPACT
+
+
+def _stock(params):
+    from stock.models import StockItem, StockLocation
+
+    qs = StockItem.objects.all()
+    if part := _int_param(params, "part"):
+        qs = qs.filter(part_id=part)
+    if location := _int_param(params, "location"):
+        if _bool_param(params, "sublocations"):
+            try:
+                qs = qs.filter(**subtree_filter(StockLocation.objects.get(pk=location), "location__"))
+            except StockLocation.DoesNotExist:
+                raise ExportError(f"Stock location {location} not found")
+        else:
+            qs = qs.filter(location_id=location)
+    return qs.order_by("pk"), STOCK_ITEM_COLUMNS, STOCK_ITEM_COMPACT
+
+
+def _locations(params):
+    from stock.models import StockLocation
+
+    qs = annotate_location_counts(StockLocation.objects.all())
+    if parent := _int_param(params, "parent"):
+        qs = qs.filter(parent_id=parent)
+    return qs.order_by("tree_id", "lft"), STOCK_LOCATION_COLUMNS, STOCK_LOCATION_COMPACT
+
+
+def _categories(params):
+    from part.models import PartCategory
+
+    qs = annotate_category_counts(PartCategory.objects.all())
+    if parent := _int_param(params, "parent"):
+        qs = qs.filter(parent_id=parent)
+    return qs.order_by("tree_id", "lft"), PART_CATEGORY_COLUMNS, PART_CATEGORY_COMPACT
+
+
+# resource -> (InvenTree role, query builder)
+RESOURCES = {
+    "parts": ("part", _parts),
+    "stock": ("stock", _stock),
+    "locations": ("stock_location", _locations),
+    "categories": ("part_category", _categories),
+}
+
+
+def export_role(resource: str) -> str:
+    """Return the InvenTree role needed to view `resource`. Raises ExportError if unknown."""
+    if resource not in RESOURCES:
+        raise ExportError(f"Unknown export '{resource}'. Available: {', '.join(RESOURCES)}")
+    return RESOURCES[resource][0]
+
+
+def export_rows(resource: str, params):
+    """Return an iterator over the compact records of `resource` matching `params`.
+
+    Raises ExportError for unknown resources or invalid parameters.
+    """
+    export_role(resource)
+    qs, columns, default = RESOURCES[resource][1](params)
+    fields = [f.strip() for f in params.get("fields", "").split(",") if f.strip()]
+    try:
+        keys = select_fields(columns, default, fields)
+    except ValueError as e:
+        raise ExportError(str(e))
+    rows = project(qs, columns, keys)
+    if params.get("limit", ""):
+        limit = _int_param(params, "limit")
+        if limit < 1:
+            raise ExportError(f"Parameter 'limit' must be at least 1, got {limit}")
+        rows = rows[:limit]
+    return (serialize_row(row, columns, keys) for row in rows.iterator(chunk_size=CHUNK_SIZE))
+
+
+def ndjson_stream(rows):
+    """Encode records as NDJSON, yielding about CHUNK_BYTES at a time."""
+    writer = ChunkWriter(CHUNK_BYTES)
+    count = 0
+    for row in rows:
+        writer.write(row)
+        count += 1
+        if writer.full():
+            yield writer.take()
+    writer.write({"done": True, "count": count})
+    yield writer.take()
+
+
+def sse_stream(rows):
+    """Encode records as Server-Sent Events: one "data:" event per record, then an "end" event."""
+    writer = ChunkWriter(CHUNK_BYTES)
+    count = 0
+    for row in rows:
+        writer.write(row, b"data: ", b"\n\n")
+        count += 1
+        if writer.full():
+            yield writer.take()
+    writer.write({"done": True, "count": count}, b"event: end\ndata: ", b"\n\n")
+    yield writer.take()
@@ -14,6 +14,9 @@ InvenTree MCP Server — inventory management via direct ORM access.
 - Use search tools BEFORE creating new items to avoid duplicates.
 - Search/list tools return 10 results by default. The `count` field shows the \
 total number of matches. Increase `limit` or paginate with `offset` to see more.
+- For long listings, pass the returned `next_cursor` back as `cursor` to fetch \
+the next page; `next_cursor` is null on the last page. Set `include_count=false` \
+when you do not need the total.
 - Search/list tools return compact results. Use get_part, get_stock_location, \
 or get_stock_item for full detail on a specific item.
 
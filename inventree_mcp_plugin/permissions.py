@@ -1,15 +1,119 @@
-"""Role-based permission checks for MCP tools using InvenTree's permission system."""
+"""Role-based permission checks for MCP tools using InvenTree's permission system.
+
+Role checks are cached in-process per (user id, role, action) for a short
+TTL. Group membership, group, RuleSet and user changes invalidate the cache
+through Django signals, so revoked permissions take effect immediately in
+the process that made the change and within the TTL everywhere else.
+"""
 
 import json
 import logging
+import threading
+import time
 from typing import Optional
 
-from asgiref.sync import sync_to_async
-
 from .context import get_current_user
 
 logger = logging.getLogger("inventree_mcp_plugin.permissions")
 
+# Seconds a cached role check stays valid
+PERMISSION_CACHE_TTL = 30.0
+
+_cache = {}
+_cache_lock = threading.Lock()
+_cache_generation = 0
+_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+_signals_connected = False
+
+
+def _invalidate(user_id=None):
+    """Drop cached checks for one user, or for everyone if user_id is None."""
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _cache_stats["invalidations"] += 1
+        if user_id is None:
+            _cache.clear()
+        else:
+            for key in [k for k in _cache if k[0] == user_id]:
+                del _cache[key]
+
+
+def _on_user_changed(sender, instance, **kwargs):
+    _invalidate(instance.pk)
+
+
+def _on_roles_changed(sender, **kwargs):
+    _invalidate()
+
+
+def _connect_signals():
+    """Connect invalidation handlers (idempotent; needs the app registry ready)."""
+    global _signals_connected
+    if _signals_connected:
+        return
+
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Group
+    from django.db.models.signals import m2m_changed, post_delete, post_save
+
+    User = get_user_model()
+    uid = "inventree_mcp_plugin.permissions"
+
+    m2m_changed.connect(_on_roles_changed, sender=User.groups.through, dispatch_uid=f"{uid}.groups")
+    post_save.connect(_on_user_changed, sender=User, dispatch_uid=f"{uid}.user_save")
+    post_delete.connect(_on_user_changed, sender=User, dispatch_uid=f"{uid}.user_delete")
+    post_save.connect(_on_roles_changed, sender=Group, dispatch_uid=f"{uid}.group_save")
+    post_delete.connect(_on_roles_changed, sender=Group, dispatch_uid=f"{uid}.group_delete")
+
+    try:
+        from users.models import RuleSet
+
+        post_save.connect(_on_roles_changed, sender=RuleSet, dispatch_uid=f"{uid}.ruleset_save")
+        post_delete.connect(_on_roles_changed, sender=RuleSet, dispatch_uid=f"{uid}.ruleset_delete")
+    except ImportError:
+        logger.warning("Could not import RuleSet — permission cache relies on TTL only")
+
+    _signals_connected = True
+
+
+def _check_user_role_cached(check_user_role, user, role: str, action: str) -> bool:
+    """Run check_user_role through the in-process TTL cache."""
+    _connect_signals()
+
+    key = (user.pk, role, action)
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[1] > now:
+            _cache_stats["hits"] += 1
+            return entry[0]
+        _cache_stats["misses"] += 1
+        generation = _cache_generation
+
+    allowed = bool(check_user_role(user, role, action))
+
+    with _cache_lock:
+        # Skip storing if an invalidation raced with the lookup
+        if generation == _cache_generation:
+            _cache[key] = (allowed, now + PERMISSION_CACHE_TTL)
+    return allowed
+
+
+def permission_cache_stats() -> dict:
+    """Return hit/miss counters and the current size of the permission cache."""
+    with _cache_lock:
+        hits = _cache_stats["hits"]
+        misses = _cache_stats["misses"]
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "entries": len(_cache),
+            "invalidations": _cache_stats["invalidations"],
+            "ttl_seconds": PERMISSION_CACHE_TTL,
+        }
+
 
 def require_permission(role: str, action: str) -> Optional[str]:
     """Check if the current user has the required role permission.
@@ -30,7 +134,7 @@ def require_permission(role: str, action: str) -> Optional[str]:
         logger.warning("Could not import check_user_role — failing open")
         return None
 
-    if not check_user_role(user, role, action):
+    if not _check_user_role_cached(check_user_role, user, role, action):
         return json.dumps(
             {
                 "error": f"Permission denied: user '{user.username}' lacks "
@@ -39,9 +143,3 @@ def require_permission(role: str, action: str) -> Optional[str]:
         )
 
     return None
-
-
-@sync_to_async
-def check_permission(role: str, action: str) -> Optional[str]:
-    """Async wrapper around require_permission for use in MCP tool functions."""
-    return require_permission(role, action)
@@ -25,14 +25,65 @@ class InvenTreeMCPPlugin(UrlsMixin, SettingsMixin, InvenTreePlugin):
             "description": "Custom Search Engine ID for image search (optional)",
             "default": "",
         },
+        "READ_POOL_SIZE": {
+            "name": "Read-only worker threads",
+            "description": "Run read-only tools on a dedicated pool of this many threads so they "
+            "don't queue behind writes (0 = run all tools on the shared sync thread). Restart required.",
+            "default": 0,
+            "validator": int,
+        },
+        "SEARCH_BACKEND": {
+            "name": "Part search backend",
+            "description": "'auto' uses the PostgreSQL full-text index when it exists (see INSTALL.md); "
+            "'basic' always uses substring matching",
+            "default": "auto",
+            "choices": [("auto", "Auto"), ("basic", "Basic")],
+        },
+        "RESULT_CACHE": {
+            "name": "Result cache",
+            "description": "Cache results of read-only tools: 'off', 'local' (per process, other "
+            "processes' writes seen after the TTL) or 'django' (InvenTree's shared cache). Restart required.",
+            "default": "off",
+            "choices": [("off", "Off"), ("local", "Local"), ("django", "Django cache")],
+        },
+        "RESULT_CACHE_SIZE": {
+            "name": "Result cache entries",
+            "description": "Maximum cached results per process for the 'local' result cache",
+            "default": 1000,
+            "validator": int,
+        },
+        "RESULT_CACHE_TTL": {
+            "name": "Result cache TTL",
+            "description": "Seconds a cached result may be served",
+            "default": 300,
+            "validator": int,
+        },
+        "SLOW_CALL_MS": {
+            "name": "Slow tool call threshold",
+            "description": "Log a warning with the timing breakdown of tool calls taking at least "
+            "this many milliseconds (0 = off). Restart required.",
+            "default": 1000,
+            "validator": int,
+        },
+        "PROFILING": {
+            "name": "Tool call profiling",
+            "description": "Let staff users profile the tool calls of an MCP request by sending the "
+            "X-MCP-Profile: 1 header; fetch the results with the get_profile tool",
+            "default": False,
+            "validator": bool,
+        },
     }
 
     def setup_urls(self):
         from django.urls import re_path
         from django.views.decorators.csrf import csrf_exempt
 
-        from .views import MCPView
+        from .tools.cache import connect_signals
+        from .views import ExportView, MCPView, MetricsView
 
+        connect_signals()
         return [
             re_path(r"^mcp/?$", csrf_exempt(MCPView.as_view()), name="mcp"),
+            re_path(r"^export/(?P<resource>[a-z_]+)/?$", ExportView.as_view(), name="export"),
+            re_path(r"^metrics/?$", MetricsView.as_view(), name="metrics"),
         ]
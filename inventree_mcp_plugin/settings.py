@@ -0,0 +1,38 @@
+"""Access to the plugin's own settings from tool code (sync context only)."""
+
+import logging
+
+logger = logging.getLogger("inventree_mcp_plugin.settings")
+
+PLUGIN_SLUG = "inventree-mcp"
+
+
+def get_plugin_setting(key: str, default=None):
+    """Return a plugin setting value, or `default` if the plugin/setting is unavailable."""
+    try:
+        from plugin.registry import registry
+
+        plugin = registry.get_plugin(PLUGIN_SLUG)
+        if plugin is None:
+            return default
+        value = plugin.get_setting(key)
+    except Exception as e:
+        logger.warning("Could not read plugin setting %s: %s", key, e)
+        return default
+    return default if value is None or value == "" else value
+
+
+def get_int_setting(key: str, default: int = 0) -> int:
+    """Return a plugin setting coerced to int, or `default` if unset or invalid."""
+    try:
+        return int(get_plugin_setting(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def get_bool_setting(key: str, default: bool = False) -> bool:
+    """Return a boolean plugin setting (InvenTree may store it as a string)."""
+    value = get_plugin_setting(key, default)
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
@@ -0,0 +1,115 @@
+"""Model change notifications for the plugin's in-process caches and indexes.
+
+Listeners register per model label (e.g. "part.Part"). Django's post_save
+and post_delete signals feed them automatically. Bulk code paths that
+bypass those signals (bulk_create / bulk_update) call notify_changed()
+themselves so listeners stay current.
+
+Listeners that need a changed row's previous field values (e.g. the stock
+location an item moved out of) read them with previous_values(). They are
+loaded before each save for fields registered with track_previous(), and
+bulk paths record them with remember_previous() before changing objects.
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger("inventree_mcp_plugin.signals")
+
+_listeners = {}
+_tracked = {}
+_lock = threading.Lock()
+
+
+def _label(model) -> str:
+    return model._meta.label
+
+
+def _dispatch(label, instances, deleted):
+    with _lock:
+        callbacks = list(_listeners.get(label, ()))
+    for callback in callbacks:
+        try:
+            callback(instances, deleted)
+        except Exception:
+            logger.exception("Model change listener %r failed for %s", callback, label)
+    for instance in instances:
+        instance.__dict__.pop("_mcp_previous", None)
+
+
+def _on_save(sender, instance, raw=False, **kwargs):
+    # Skip fixture loading (loaddata)
+    if not raw:
+        _dispatch(_label(sender), [instance], False)
+
+
+def _on_delete(sender, instance, **kwargs):
+    _dispatch(_label(sender), [instance], True)
+
+
+def _capture_previous(sender, instance, raw=False, **kwargs):
+    fields = _tracked.get(_label(sender))
+    if not fields or raw:
+        return
+    if instance._state.adding or instance.pk is None:
+        instance._mcp_previous = {}
+    else:
+        row = sender._base_manager.filter(pk=instance.pk).values(*fields).first()
+        instance._mcp_previous = row or {}
+
+
+def on_model_change(label: str, callback):
+    """Call callback(instances, deleted) whenever instances of model `label` change.
+
+    Must be called once the app registry is ready (e.g. from tool code).
+    """
+    from django.apps import apps
+    from django.db.models.signals import post_delete, post_save
+
+    with _lock:
+        callbacks = _listeners.setdefault(label, [])
+        if callback in callbacks:
+            return
+        callbacks.append(callback)
+
+    model = apps.get_model(label)
+    uid = f"inventree_mcp_plugin.signals.{label}"
+    post_save.connect(_on_save, sender=model, dispatch_uid=f"{uid}.save")
+    post_delete.connect(_on_delete, sender=model, dispatch_uid=f"{uid}.delete")
+
+
+def notify_changed(instances, deleted: bool = False):
+    """Notify listeners about instances written without model signals (bulk paths)."""
+    by_label = {}
+    for instance in instances:
+        by_label.setdefault(_label(type(instance)), []).append(instance)
+    for label, batch in by_label.items():
+        _dispatch(label, batch, deleted)
+
+
+def track_previous(label: str, fields):
+    """Load the stored values of `fields` before each save of model `label` (one query per save)."""
+    from django.apps import apps
+    from django.db.models.signals import pre_save
+
+    with _lock:
+        _tracked[label] = tuple(sorted(set(_tracked.get(label, ())) | set(fields)))
+    pre_save.connect(
+        _capture_previous,
+        sender=apps.get_model(label),
+        dispatch_uid=f"inventree_mcp_plugin.signals.{label}.previous",
+    )
+
+
+def remember_previous(instances, fields):
+    """Record the current values of `fields` before a bulk path changes instances."""
+    for instance in instances:
+        instance._mcp_previous = {f: instance.__dict__[f] for f in fields if f in instance.__dict__}
+
+
+def previous_values(instance):
+    """Field values from before the change being notified, or None if unknown.
+
+    New instances report an empty dict.
+    """
+    return getattr(instance, "_mcp_previous", None)
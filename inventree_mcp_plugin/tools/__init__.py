@@ -5,3 +5,5 @@ from . import stock  # noqa: F401
 from . import locations  # noqa: F401
 from . import categories  # noqa: F401
 from . import parameters  # noqa: F401
+from . import icons  # noqa: F401
+from . import server  # noqa: F401
@@ -0,0 +1,325 @@
+"""Result cache for read-only tools.
+
+Tools opt in with sync_tool(..., cache=tags), where `tags(args, result)`
+names the data a result depends on. Tags are model labels ("part.Part",
+any row changed), instance tags ("part.Part:5") and membership tags
+("stock.StockItem.location_id", some item entered or left a location).
+Model change signals (see ..signals) turn every saved or deleted Part,
+StockItem, StockLocation, PartCategory, PartParameter, parameter template
+and location type into the tags it affects, including the old and new
+targets of a moved foreign key.
+
+Results do not vary by user: the permission check still runs on every
+call, before the lookup. The RESULT_CACHE setting picks the backend:
+
+- "local": a per-process LRU. Invalidation evicts the exact entries holding
+  a tag. Writes made by other processes are seen after RESULT_CACHE_TTL.
+- "django": Django's default cache (e.g. Redis) shared by all processes.
+  Tags are versioned counters there, so invalidation is global.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from ..settings import get_int_setting, get_plugin_setting
+from ..signals import on_model_change, previous_values, track_previous
+from . import metrics
+
+logger = logging.getLogger("inventree_mcp_plugin.tools.cache")
+
+# Foreign keys whose targets are affected when a row changes, by model
+_RELATIONS = {
+    "part.Part": {"category_id": "part.PartCategory"},
+    "part.PartParameter": {"part_id": "part.Part"},
+    "part.PartCategory": {"parent_id": "part.PartCategory"},
+    "stock.StockItem": {"part_id": "part.Part", "location_id": "stock.StockLocation"},
+    "stock.StockLocation": {"parent_id": "stock.StockLocation"},
+}
+_WATCHED = (*_RELATIONS, "part.PartParameterTemplate", "stock.StockLocationType")
+
+_MISSING = object()
+
+_store = None
+_store_ready = False
+_store_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0, "evictions": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(stat: str, n: int = 1):
+    with _stats_lock:
+        _stats[stat] += n
+
+
+class _LocalStore:
+    """In-process LRU of (encoded result, rows, size) entries, with a tag -> keys index for eviction."""
+
+    backend = "local"
+
+    def __init__(self, size: int, ttl: float):
+        self.size = size
+        self.ttl = ttl
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._by_tag = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] < time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value: tuple, tags, generation):
+        with self._lock:
+            # An invalidation ran while the result was computed: it may be stale
+            if generation != self.generation:
+                return False
+            self._drop(key)
+            size = sys.getsizeof(value[0])
+            self._entries[key] = (value, tags, time.monotonic() + self.ttl, size)
+            self._bytes += size
+            for tag in tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.size:
+                self._drop(next(iter(self._entries)))
+                _count("evictions")
+            return True
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry[3]
+        for tag in entry[1]:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+    def current_generation(self):
+        return self.generation
+
+    def invalidate(self, tags):
+        with self._lock:
+            self.generation += 1
+            for tag in tags:
+                for key in list(self._by_tag.get(tag, ())):
+                    self._drop(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "tags": len(self._by_tag)}
+
+
+class _DjangoStore:
+    """Results in Django's default cache, checked against versioned tag counters."""
+
+    backend = "django"
+    _GENERATION = "mcp-rc-gen"
+
+    def __init__(self, ttl: float):
+        from django.core.cache import cache
+
+        self.cache = cache
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(key):
+        return "mcp-rc:" + hashlib.sha1(repr(key).encode()).hexdigest()
+
+    def _versions(self, tags):
+        keys = [f"mcp-tag:{tag}" for tag in tags]
+        found = self.cache.get_many(keys)
+        return tuple(found.get(k, 0) for k in keys)
+
+    def get(self, key):
+        entry = self.cache.get(self._key(key))
+        if entry is None:
+            return None
+        value, tags, versions = entry
+        if not isinstance(value, tuple):
+            # written by an older plugin version, without rows and size
+            return None
+        return value if self._versions(tags) == versions else None
+
+    def put(self, key, value: tuple, tags, generation):
+        if generation != self.current_generation():
+            return False
+        tags = tuple(sorted(tags))
+        self.cache.set(self._key(key), (value, tags, self._versions(tags)), self.ttl)
+        return True
+
+    def current_generation(self):
+        return self.cache.get(self._GENERATION, 0)
+
+    def _incr(self, key):
+        # Tag counters never expire; entries do (after the TTL)
+        if not self.cache.add(key, 1, None):
+            try:
+                self.cache.incr(key)
+            except ValueError:
+                self.cache.set(key, 1, None)
+
+    def invalidate(self, tags):
+        self._incr(self._GENERATION)
+        for tag in tags:
+            self._incr(f"mcp-tag:{tag}")
+
+    def stats(self) -> dict:
+        return {}
+
+
+def _tags_for(obj, deleted) -> set:
+    """Tags touched by saving or deleting obj."""
+    label = type(obj)._meta.label
+    tags = {label, f"{label}:{obj.pk}"}
+    previous = previous_values(obj)
+    for field, target in _RELATIONS.get(label, {}).items():
+        current = obj.__dict__.get(field, _MISSING)
+        if current is _MISSING and not deleted:
+            # Deferred, so this write (save or bulk_update) did not touch it
+            continue
+        old = _MISSING if previous is None else previous.get(field, _MISSING)
+        tags.update(f"{target}:{v}" for v in (current, old) if v is not None and v is not _MISSING)
+        if deleted or old is _MISSING or old != current:
+            tags.add(f"{label}.{field}")
+    return tags
+
+
+def _on_change(instances, deleted):
+    store = _get_store()
+    if store is None:
+        return
+    tags = set()
+    for obj in instances:
+        tags |= _tags_for(obj, deleted)
+    _invalidate(store, tags)
+
+    # Also after commit: another thread may have cached pre-commit data meanwhile
+    from django.db import connection, transaction
+
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: _invalidate(store, tags))
+
+
+def _invalidate(store, tags):
+    try:
+        store.invalidate(tags)
+        _count("invalidations")
+    except Exception as e:
+        logger.warning("Result cache invalidation failed: %s", e)
+
+
+def connect_signals():
+    """Invalidate on model changes in this process (idempotent; needs the app registry ready).
+
+    Called when the plugin's URLs load, so processes that only write (e.g. the
+    web UI) still invalidate a shared "django" cache.
+    """
+    for label in _WATCHED:
+        try:
+            on_model_change(label, _on_change)
+        except LookupError:
+            logger.info("Result cache: model %s not present, not watched", label)
+
+
+def _get_store():
+    """Create the configured store on first use (sync context; reads plugin settings)."""
+    global _store, _store_ready
+    if _store_ready:
+        return _store
+    with _store_lock:
+        if _store_ready:
+            return _store
+        backend = str(get_plugin_setting("RESULT_CACHE", "off")).lower()
+        ttl = max(1, get_int_setting("RESULT_CACHE_TTL", 300))
+        if backend == "local":
+            _store = _LocalStore(max(1, get_int_setting("RESULT_CACHE_SIZE", 1000)), ttl)
+        elif backend == "django":
+            _store = _DjangoStore(ttl)
+        if _store is not None:
+            connect_signals()
+            for label, fields in _RELATIONS.items():
+                try:
+                    track_previous(label, fields)
+                except LookupError:
+                    pass
+            logger.info("MCP result cache enabled (%s, ttl %ds)", backend, ttl)
+        _store_ready = True
+        return _store
+
+
+def _bind(signature, args, kwargs) -> dict:
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound.arguments
+
+
+def cached(fn, tags, encode):
+    """Wrap a tool body so encoded results are served from the result cache.
+
+    Error results are never stored. Entries keep the row count and size noted
+    for the call metrics (see .metrics), which hits report again.
+    """
+    signature = inspect.signature(fn)
+
+    def _cached(*args, **kwargs):
+        store = _get_store()
+        if store is None:
+            return encode(fn(*args, **kwargs))
+
+        arguments = _bind(signature, args, kwargs)
+        key = (fn.__name__, json.dumps(arguments, sort_keys=True, default=str))
+        try:
+            hit = store.get(key)
+        except Exception as e:
+            logger.warning("Result cache lookup failed: %s", e)
+            hit = None
+        if hit is not None:
+            _count("hits")
+            value, *info = hit
+            metrics.note_cached(info)
+            return value
+        _count("misses")
+
+        generation = store.current_generation()
+        result = fn(*args, **kwargs)
+        value = encode(result)
+        if isinstance(result, str) or (isinstance(result, dict) and "error" in result):
+            return value
+        try:
+            # The row count and size go along, so hits are measured like misses
+            entry = (value, *metrics.result_info())
+            if store.put(key, entry, frozenset(tags(arguments, result)), generation):
+                _count("stores")
+        except Exception as e:
+            logger.warning("Result cache store failed: %s", e)
+        return value
+
+    return _cached
+
+
+def result_cache_stats() -> dict:
+    """Return hit ratio, size and invalidation counters for the result cache."""
+    store = _store
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+    if store is None:
+        return {"enabled": False, **stats}
+    return {"enabled": True, "backend": store.backend, "ttl_seconds": store.ttl, **stats, **store.stats()}
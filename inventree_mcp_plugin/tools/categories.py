@@ -1,53 +1,119 @@
-"""Part category tools — search, list, create, update, delete."""
+"""Part category tools — search, tree, list, create, update, delete."""
 
 import json
 import logging
 from typing import Optional
 
-from asgiref.sync import sync_to_async
-
 from ..mcp_server import mcp
 from .icons import validate_icon
-from .serializers import serialize_part_category, serialize_part_category_compact, to_json
+from .queries import annotate_category_counts, paginate, subtree
+from .runner import sync_tool
+from .serializers import (
+    PART_CATEGORY_COLUMNS,
+    PART_CATEGORY_COMPACT,
+    project,
+    select_fields,
+    serialize_part_category,
+    serialize_row,
+)
 
 logger = logging.getLogger("inventree_mcp_plugin.tools.categories")
 
+# Most nodes get_category_tree returns in one call
+_TREE_MAX_NODES = 2000
+
 
 @mcp.tool()
-async def search_part_categories(search: str = "", parent: int = 0, limit: int = 10, offset: int = 0) -> str:
+@sync_tool(
+    "part_category",
+    "view",
+    cache=lambda args, result: {"part.PartCategory", "part.Part.category_id"},
+)
+def search_part_categories(
+    search: str = "",
+    parent: int = 0,
+    limit: int = 10,
+    offset: int = 0,
+    cursor: str = "",
+    include_count: bool = True,
+    fields: Optional[list[str]] = None,
+) -> str:
     """Search and list part categories. Returns compact results; use pathstring for hierarchy.
 
     Combine filters: search by name AND/OR filter by parent category.
     Set search="" and parent=0 to list all categories.
     Default limit is 10 — check the count field for total matches and
     increase limit or paginate with offset if needed.
+    For deep paging pass the returned next_cursor as cursor (offset is then ignored).
+    Set include_count=false to skip counting the total matches.
+    Set fields to choose the returned keys (pk is always included), e.g.
+    ["name", "part_count"]. Available: name, pathstring, parent, part_count,
+    subcategories, description, level, structural, default_location.
+    """
+    from part.models import PartCategory
+
+    try:
+        keys = select_fields(PART_CATEGORY_COLUMNS, PART_CATEGORY_COMPACT, fields)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    qs = PartCategory.objects.all()
+    if search:
+        from django.db.models import Q
+        qs = qs.filter(
+            Q(name__icontains=search) | Q(description__icontains=search)
+        )
+    if parent:
+        qs = qs.filter(parent_id=parent)
+    lim = limit if limit > 0 else 10
+    try:
+        categories, page = paginate(
+            qs, ("tree_id", "lft"), lim, offset, cursor, include_count,
+            annotate=lambda q: project(annotate_category_counts(q), PART_CATEGORY_COLUMNS, keys, ("tree_id", "lft")),
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    page["results"] = [serialize_row(c, PART_CATEGORY_COLUMNS, keys) for c in categories]
+    return page
+
+
+@mcp.tool()
+@sync_tool(
+    "part_category",
+    "view",
+    cache=lambda args, result: {"part.PartCategory", "part.Part.category_id"},
+)
+def get_category_tree(id: int = 0, max_depth: int = 3, limit: int = 500) -> str:
+    """Get a whole part category subtree in one call, with part counts per node.
+
+    Set id=0 for the full hierarchy from the top-level categories.
+    max_depth is the number of levels returned, counting the top one.
+    Each node has parts (directly in it), subtree_parts (it and everything
+    below), descendants, and nested children. has_more marks nodes whose
+    children were cut off by max_depth or limit; call again with that
+    node's id to expand it.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('part_category', 'view'):
-        return perm_err
-
-    @sync_to_async
-    def _query():
-        from part.models import PartCategory
-
-        qs = PartCategory.objects.all()
-        if search:
-            from django.db.models import Q
-            qs = qs.filter(
-                Q(name__icontains=search) | Q(description__icontains=search)
-            )
-        if parent:
-            qs = qs.filter(parent_id=parent)
-        lim = limit if limit > 0 else 10
-        total = qs.count()
-        categories = list(qs[offset : offset + lim])
-        return {"count": total, "results": [serialize_part_category_compact(c) for c in categories]}
-
-    return to_json(await _query())
+    from part.models import Part, PartCategory
+
+    tree = subtree(
+        PartCategory,
+        id,
+        max(1, max_depth),
+        min(limit if limit > 0 else 500, _TREE_MAX_NODES),
+        Part,
+        "category",
+        "parts",
+        fields=("name", "structural"),
+    )
+    if tree is None:
+        return {"error": f"Part category {id} not found"}
+    roots, total, truncated = tree
+    return {"count": total, "truncated": truncated, "tree": roots}
 
 
 @mcp.tool()
-async def create_part_category(
+@sync_tool("part_category", "add")
+def create_part_category(
     name: str,
     description: str = "",
     parent: int = 0,
@@ -61,38 +127,31 @@ async def create_part_category(
     Categories can be deeply nested; set parent to the parent category ID.
     Icon should be a Tabler icon string like 'ti:tool:outline' or 'ti:circle:outline'.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('part_category', 'add'):
-        return perm_err
-
     if icon:
         valid, err = validate_icon(icon)
         if not valid:
-            return to_json({"error": err})
-
-    @sync_to_async
-    def _create():
-        from part.models import PartCategory
-
-        fields = {"name": name}
-        if description:
-            fields["description"] = description
-        if parent:
-            fields["parent_id"] = parent
-        if default_location:
-            fields["default_location_id"] = default_location
-        if structural is not None:
-            fields["structural"] = structural
-        if icon:
-            fields["icon"] = icon
-        category = PartCategory.objects.create(**fields)
-        return serialize_part_category(category)
-
-    return to_json(await _create())
+            return {"error": err}
+
+    from part.models import PartCategory
+
+    fields = {"name": name}
+    if description:
+        fields["description"] = description
+    if parent:
+        fields["parent_id"] = parent
+    if default_location:
+        fields["default_location_id"] = default_location
+    if structural is not None:
+        fields["structural"] = structural
+    if icon:
+        fields["icon"] = icon
+    category = PartCategory.objects.create(**fields)
+    return serialize_part_category(category)
 
 
 @mcp.tool()
-async def update_part_category(
+@sync_tool("part_category", "change")
+def update_part_category(
     id: int,
     name: str = "",
     description: str = "",
@@ -105,64 +164,49 @@ async def update_part_category(
     Icon should be a Tabler icon string like 'ti:tool:outline' or 'ti:circle:outline'.
     Set icon to 'none' to clear an existing icon.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('part_category', 'change'):
-        return perm_err
-
     if icon and icon.lower() != "none":
         valid, err = validate_icon(icon)
         if not valid:
-            return to_json({"error": err})
-
-    @sync_to_async
-    def _update():
-        from part.models import PartCategory
-
-        try:
-            category = PartCategory.objects.get(pk=id)
-        except PartCategory.DoesNotExist:
-            return {"error": f"Part category {id} not found"}
-        updated = False
-        if name:
-            category.name = name
-            updated = True
-        if description:
-            category.description = description
-            updated = True
-        if parent:
-            category.parent_id = parent
-            updated = True
-        if default_location:
-            category.default_location_id = default_location
-            updated = True
-        if icon:
-            category.icon = "" if icon.lower() == "none" else icon
-            updated = True
-        if not updated:
-            return {"error": "No fields provided to update"}
-        category.save()
-        category.refresh_from_db()
-        return serialize_part_category(category)
-
-    return to_json(await _update())
+            return {"error": err}
+
+    from part.models import PartCategory
+
+    try:
+        category = PartCategory.objects.get(pk=id)
+    except PartCategory.DoesNotExist:
+        return {"error": f"Part category {id} not found"}
+    updated = False
+    if name:
+        category.name = name
+        updated = True
+    if description:
+        category.description = description
+        updated = True
+    if parent:
+        category.parent_id = parent
+        updated = True
+    if default_location:
+        category.default_location_id = default_location
+        updated = True
+    if icon:
+        category.icon = "" if icon.lower() == "none" else icon
+        updated = True
+    if not updated:
+        return {"error": "No fields provided to update"}
+    category.save()
+    category.refresh_from_db()
+    return serialize_part_category(category)
 
 
 @mcp.tool()
-async def delete_part_category(id: int) -> str:
+@sync_tool("part_category", "delete")
+def delete_part_category(id: int) -> str:
     """Delete a part category. Must have no parts or sub-categories."""
-    from ..permissions import check_permission
-    if perm_err := await check_permission('part_category', 'delete'):
-        return perm_err
-
-    @sync_to_async
-    def _delete():
-        from part.models import PartCategory
-
-        try:
-            category = PartCategory.objects.get(pk=id)
-        except PartCategory.DoesNotExist:
-            return f"Part category {id} not found."
-        category.delete()
-        return f"Category {id} deleted successfully."
-
-    return await _delete()
+    from part.models import PartCategory
+
+    try:
+        category = PartCategory.objects.get(pk=id)
+    except PartCategory.DoesNotExist:
+        return f"Part category {id} not found."
+    category.delete()
+    return f"Category {id} deleted successfully."
@@ -0,0 +1,271 @@
+"""JSON encoding for tool results and exports.
+
+Uses orjson or msgspec when one is installed (pip install
+inventree-mcp-plugin[fast]), else the standard library. The pick can be
+forced with the INVENTREE_MCP_JSON environment variable ("orjson",
+"msgspec" or "json"). All backends emit compact UTF-8 JSON that parses to
+the same values, and handle the same extra types:
+
+- Decimal -> number (msgspec keeps the Decimal's digits, e.g. 1.10 where
+  the others write 1.1)
+- datetime / date / time -> ISO 8601 string (msgspec writes a UTC offset as "Z")
+- set / frozenset -> list
+- NaN and Infinity (float or Decimal) -> null, never the invalid bare NaN
+- anything else (lazy translation strings, UUIDs, ...) -> str(value)
+
+ChunkWriter encodes many values into one growing buffer (e.g. NDJSON
+rows) without building a string per value. Compare the backends on this
+server with:
+
+    python manage.py shell -c "from inventree_mcp_plugin.tools.encoding import benchmark; print(benchmark())"
+"""
+
+import datetime
+import decimal
+import json
+import logging
+import math
+import os
+import time
+
+logger = logging.getLogger("inventree_mcp_plugin.tools.encoding")
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _default(value):
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        # msgspec encodes sets natively, as lists
+        return list(value)
+    return str(value)
+
+
+def _finite(data):
+    """Copy of `data` with NaN/Infinity floats and Decimals replaced by None."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, decimal.Decimal):
+        return data if data.is_finite() else None
+    if isinstance(data, dict):
+        return {k: _finite(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple, set, frozenset)):
+        return [_finite(v) for v in data]
+    return data
+
+
+def _maybe_nan(output) -> bool:
+    """True if encoded output may contain a bare NaN or Infinity token.
+
+    The one-byte finds are memchr-fast and rule out most outputs.
+    """
+    return (output.find(b"N") != -1 and output.find(b"NaN") != -1) or (
+        output.find(b"I") != -1 and output.find(b"Infinity") != -1
+    )
+
+
+def _json_encoder():
+    encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, allow_nan=False, default=_default)
+
+    def dumps(data):
+        try:
+            return encoder.encode(data)
+        except ValueError:
+            # NaN/Infinity somewhere: write null like orjson and msgspec
+            return encoder.encode(_finite(data))
+
+    return dumps, lambda data: dumps(data).encode(), None
+
+
+def _orjson_encoder():
+    import orjson
+
+    option = orjson.OPT_NON_STR_KEYS
+    stdlib_dumps = _json_encoder()[0]
+
+    def dumpb(data):
+        try:
+            return orjson.dumps(data, default=_default, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits
+            return stdlib_dumps(data).encode()
+
+    return lambda data: dumpb(data).decode(), dumpb, None
+
+
+def _msgspec_encoder():
+    import msgspec
+
+    try:
+        encoder = msgspec.json.Encoder(enc_hook=_default, decimal_format="number")
+    except TypeError:
+        # msgspec < 0.18 has no decimal_format and encodes Decimals as strings
+        encoder = msgspec.json.Encoder(enc_hook=_default)
+    stdlib_dumps = _json_encoder()[0]
+
+    # msgspec writes float NaN as null but a non-finite Decimal as a bare NaN /
+    # Infinity; such output is re-encoded with the stdlib encoder, which writes null
+    def dumpb(data):
+        try:
+            output = encoder.encode(data)
+        except (TypeError, msgspec.EncodeError):
+            return stdlib_dumps(data).encode()
+        return stdlib_dumps(data).encode() if _maybe_nan(output) else output
+
+    def encode_into(data, buffer):
+        # Not checked per value (too slow for NDJSON rows): ChunkWriter checks each chunk
+        end = len(buffer)
+        try:
+            encoder.encode_into(data, buffer, -1)
+        except (TypeError, msgspec.EncodeError):
+            del buffer[end:]
+            buffer += stdlib_dumps(data).encode()
+
+    return lambda data: dumpb(data).decode(), dumpb, encode_into
+
+
+_FACTORIES = {"orjson": _orjson_encoder, "msgspec": _msgspec_encoder, "json": _json_encoder}
+
+
+def get_encoder(backend: str):
+    """Return (dumps, dumpb, encode_into) for `backend`. Raises ImportError if it is not installed.
+
+    encode_into(data, buffer) appends to a bytearray, or is None if the
+    backend cannot write into a buffer directly. Unlike dumpb it may write a
+    non-finite Decimal as bare NaN; ChunkWriter repairs that.
+    """
+    return _FACTORIES[backend]()
+
+
+def _select():
+    wanted = os.environ.get("INVENTREE_MCP_JSON", "").strip().lower()
+    if wanted and wanted not in _FACTORIES:
+        logger.warning("Unknown INVENTREE_MCP_JSON '%s'; expected one of %s", wanted, ", ".join(BACKENDS))
+        wanted = ""
+    for backend in (wanted,) if wanted else BACKENDS:
+        try:
+            return backend, get_encoder(backend)
+        except ImportError:
+            if wanted:
+                logger.warning("INVENTREE_MCP_JSON=%s but %s is not installed; using json", backend, backend)
+    return "json", get_encoder("json")
+
+
+BACKEND, (dumps, dumpb, _encode_into) = _select()
+
+
+def utf8_size(text: str) -> int:
+    """Size of text in UTF-8 bytes; only non-ASCII text is encoded to find out."""
+    return len(text) if text.isascii() else len(text.encode())
+
+
+def dumps_sized(data):
+    """Return (dumps(data), its size in UTF-8 bytes), sized without another copy where the backend allows."""
+    if BACKEND == "json":
+        text = dumps(data)
+        return text, utf8_size(text)
+    output = dumpb(data)
+    return output.decode(), len(output)
+
+
+class ChunkWriter:
+    """Encode values into a byte buffer, handing it out in chunks of about chunk_size bytes.
+
+    write() the values, then take() the buffer whenever full() (and once at
+    the end).
+    """
+
+    def __init__(self, chunk_size: int = 64 * 1024):
+        self.chunk_size = chunk_size
+        self._buffer = bytearray()
+        # (data, prefix, suffix) written with encode_into since the last take()
+        self._written = []
+
+    def write(self, data, prefix: bytes = b"", suffix: bytes = b"\n"):
+        buffer = self._buffer
+        buffer += prefix
+        if _encode_into is not None:
+            _encode_into(data, buffer)
+            self._written.append((data, prefix, suffix))
+        else:
+            buffer += dumpb(data)
+        buffer += suffix
+
+    def full(self) -> bool:
+        return len(self._buffer) >= self.chunk_size
+
+    def take(self) -> bytes:
+        if self._written:
+            if _maybe_nan(self._buffer):
+                # encode_into wrote a bare NaN: redo this chunk with dumpb, which writes null
+                self._buffer = bytearray(b"".join(p + dumpb(d) + s for d, p, s in self._written))
+            self._written.clear()
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        return chunk
+
+
+def _sample_payloads():
+    """Tool-shaped results: a compact 500-row stock page and 200 detailed items."""
+    updated = datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+    page = {
+        "count": 12000,
+        "next_cursor": "WzUwMF0",
+        "results": [
+            {"pk": i, "part": 1000 + i % 300, "quantity": float(i % 50), "location": i % 40, "part_name": f"Resistor 10k 0603 #{i}"}
+            for i in range(500)
+        ],
+    }
+    detail = [
+        {
+            "pk": i,
+            "part": 1000 + i,
+            "quantity": decimal.Decimal(f"{i}.25"),
+            "serial": "",
+            "batch": f"B{i % 7}",
+            "location": i % 40,
+            "in_stock": True,
+            "status": 10,
+            "notes": "Received in good condition, µ-tested",
+            "updated": updated,
+            "part_detail": {"pk": 1000 + i, "name": f"Capacitor {i}nF", "full_name": f"Capacitor {i}nF | C-{i}"},
+        }
+        for i in range(200)
+    ]
+    return {"stock_page": page, "stock_detail": detail}
+
+
+def benchmark(repeat: int = 200) -> dict:
+    """Time each installed backend on tool-shaped payloads; returns microseconds per encode."""
+    payloads = _sample_payloads()
+    results = {"active": BACKEND}
+    for backend in BACKENDS:
+        try:
+            _, encode, encode_into = get_encoder(backend)
+        except ImportError:
+            results[backend] = "not installed"
+            continue
+        timings = {}
+        for name, data in payloads.items():
+            start = time.perf_counter()
+            for _ in range(repeat):
+                encode(data)
+            timings[name] = round((time.perf_counter() - start) / repeat * 1e6, 1)
+
+        # NDJSON rows, as the export endpoint writes them
+        rows = payloads["stock_page"]["results"]
+        start = time.perf_counter()
+        for _ in range(repeat):
+            buffer = bytearray()
+            for row in rows:
+                if encode_into is not None:
+                    encode_into(row, buffer)
+                else:
+                    buffer += encode(row)
+                buffer += b"\n"
+        timings["ndjson_500_rows"] = round((time.perf_counter() - start) / repeat * 1e6, 1)
+        results[backend] = timings
+    return results
@@ -0,0 +1,288 @@
+"""In-process fuzzy (trigram) search indexes.
+
+TrigramIndex maps short keys (pks, icon names) to the trigrams of their
+text. Matching uses trigram overlap, so it tolerates typos, missing
+punctuation and reordered words ("esp32s3wroom" finds "ESP32-S3-WROOM-1").
+
+Postings are stored as compact int arrays keyed by trigram, and documents as
+small integer ids. Removed or replaced documents are tombstoned and purged
+from the postings once they outnumber live ones.
+
+ModelIndex builds a TrigramIndex over a model lazily on first search and
+keeps it current through model change notifications (see ..signals). It is
+rebuilt in the background after MAX_INDEX_AGE seconds to pick up writes
+made by other processes.
+"""
+
+import heapq
+import logging
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+
+from ..signals import on_model_change
+
+logger = logging.getLogger("inventree_mcp_plugin.tools.fuzzy")
+
+# Seconds before a model index is rebuilt from the database
+MAX_INDEX_AGE = 900.0
+
+# Candidates scored per requested result, ranked by shared trigram count
+_CANDIDATE_FACTOR = 10
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def trigrams(text: str) -> set:
+    """Return the trigrams of each word in text plus those of the words run together.
+
+    Words are padded with a space on each side so short tokens like "m3"
+    still produce trigrams and word starts weigh more.
+    """
+    words = _WORD_RE.findall(text.lower())
+    grams = set()
+    for word in words:
+        padded = f" {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    if len(words) > 1:
+        joined = " " + "".join(words) + " "
+        grams.update(joined[i : i + 3] for i in range(len(joined) - 2))
+    return grams
+
+
+class TrigramIndex:
+    """Thread-safe trigram index from keys to text, ranked by trigram overlap."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = {}
+        self._doc_keys = []
+        self._doc_sizes = array("H")
+        self._key_docs = {}
+        self._dead = 0
+
+    def __len__(self):
+        return len(self._key_docs)
+
+    def add(self, key, text: str):
+        """Index (or re-index) key under text."""
+        grams = trigrams(text)
+        with self._lock:
+            self._remove(key)
+            if not grams:
+                return
+            doc = len(self._doc_keys)
+            self._doc_keys.append(key)
+            self._doc_sizes.append(min(len(grams), 0xFFFF))
+            self._key_docs[key] = doc
+            for gram in grams:
+                posting = self._postings.get(gram)
+                if posting is None:
+                    self._postings[gram] = array("i", (doc,))
+                else:
+                    posting.append(doc)
+
+    def remove(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key):
+        doc = self._key_docs.pop(key, None)
+        if doc is None:
+            return
+        self._doc_keys[doc] = None
+        self._dead += 1
+        if self._dead > 1000 and self._dead > len(self._key_docs):
+            self._compact()
+
+    def _compact(self):
+        """Drop tombstoned documents from the postings."""
+        live = self._doc_keys
+        for gram in list(self._postings):
+            posting = array("i", (doc for doc in self._postings[gram] if live[doc] is not None))
+            if posting:
+                self._postings[gram] = posting
+            else:
+                del self._postings[gram]
+        self._dead = 0
+
+    def search(self, query: str, limit: int = 20, min_score: float = 0.3) -> list:
+        """Return up to limit (key, score) pairs, best first.
+
+        The score is mostly the share of the query's trigrams found in the
+        document, with a smaller Dice term so tighter matches rank higher.
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+
+        counts = Counter()
+        with self._lock:
+            for gram in grams:
+                counts.update(self._postings.get(gram, ()))
+
+            # Overlap dominates the score, so only the docs with the most
+            # shared trigrams can make the cut; skip scoring the long tail.
+            # Keep every doc tied at the cutoff so shorter ones can win on Dice.
+            top = counts.most_common(limit * _CANDIDATE_FACTOR)
+            floor = top[-1][1] if len(top) < len(counts) else 0
+            q = len(grams)
+            scored = []
+            for doc, hits in counts.items():
+                if hits < floor:
+                    continue
+                key = self._doc_keys[doc]
+                if key is None:
+                    continue
+                score = 0.85 * hits / q + 0.15 * 2 * hits / (q + self._doc_sizes[doc])
+                if score >= min_score:
+                    scored.append((score, -doc, key))
+
+        best = heapq.nlargest(limit, scored)
+        return [(key, score) for score, _, key in best]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._key_docs),
+                "tombstones": self._dead,
+                "trigrams": len(self._postings),
+                "postings": sum(len(p) for p in self._postings.values()),
+            }
+
+
+class ModelIndex:
+    """A TrigramIndex over some text fields of a model, built on first use.
+
+    The first search builds the index in the calling thread. Once it is
+    older than MAX_INDEX_AGE, searches keep using it while a background
+    thread builds its replacement; changes notified during that build are
+    applied to both.
+    """
+
+    def __init__(self, label: str, fields: tuple):
+        self.label = label
+        self.fields = fields
+        self._index = None
+        self._built = 0.0
+        self._build_lock = threading.Lock()
+        # (pk, text or None for removed) changes seen while a rebuild runs, else None
+        self._pending = None
+        self._pending_lock = threading.Lock()
+
+    def _text(self, values) -> str:
+        return " ".join(str(v) for v in values if v)
+
+    def _build(self) -> TrigramIndex:
+        from django.apps import apps
+
+        start = time.monotonic()
+        index = TrigramIndex()
+        rows = apps.get_model(self.label).objects.values_list("pk", *self.fields)
+        for pk, *values in rows.iterator(chunk_size=2000):
+            index.add(pk, self._text(values))
+        logger.info(
+            "Built fuzzy index for %s: %d entries in %.0fms",
+            self.label,
+            len(index),
+            (time.monotonic() - start) * 1000,
+        )
+        return index
+
+    def _get(self) -> TrigramIndex:
+        index = self._index
+        if index is not None:
+            if time.monotonic() - self._built >= MAX_INDEX_AGE:
+                self._start_rebuild()
+            return index
+
+        with self._build_lock:
+            if self._index is None:
+                on_model_change(self.label, self._on_change)
+                self._index = self._build()
+                self._built = time.monotonic()
+            return self._index
+
+    def _start_rebuild(self):
+        with self._pending_lock:
+            if self._pending is not None:
+                return
+            self._pending = []
+        threading.Thread(target=self._rebuild, name=f"mcp-fuzzy-{self.label}", daemon=True).start()
+
+    def _rebuild(self):
+        from django.db import connections
+
+        try:
+            index = self._build()
+        except Exception:
+            logger.exception("Rebuilding the fuzzy index for %s failed; keeping the current one", self.label)
+            with self._pending_lock:
+                self._pending = None
+            return
+        finally:
+            connections.close_all()
+
+        with self._pending_lock:
+            self._apply(index, self._pending)
+            self._index = index
+            self._built = time.monotonic()
+            self._pending = None
+
+    @staticmethod
+    def _apply(index: TrigramIndex, changes):
+        for pk, text in changes:
+            if text is None:
+                index.remove(pk)
+            else:
+                index.add(pk, text)
+
+    def _on_change(self, instances, deleted):
+        if self._index is None:
+            return
+        if deleted:
+            changes = [(obj.pk, None) for obj in instances]
+        else:
+            # Bulk paths may hand over instances loaded with .only(); re-read
+            # those in one query instead of one per deferred field access.
+            stale = {obj.pk for obj in instances if obj.get_deferred_fields() & set(self.fields)}
+            changes = [
+                (obj.pk, self._text(getattr(obj, f) for f in self.fields)) for obj in instances if obj.pk not in stale
+            ]
+            if stale:
+                from django.apps import apps
+
+                rows = apps.get_model(self.label).objects.filter(pk__in=stale).values_list("pk", *self.fields)
+                changes += [(pk, self._text(values)) for pk, *values in rows]
+
+        with self._pending_lock:
+            index = self._index
+            if self._pending is not None:
+                # a rebuild is running: replay these on the new index before it replaces this one
+                self._pending.extend(changes)
+        self._apply(index, changes)
+
+    def search(self, query: str, limit: int = 20) -> list:
+        """Return up to limit (pk, score) pairs, best first."""
+        return self._get().search(query, limit=limit)
+
+    def stats(self) -> dict:
+        index = self._index
+        if index is None:
+            return {"built": False}
+        return {
+            "built": True,
+            "age_seconds": round(time.monotonic() - self._built, 1),
+            "rebuilding": self._pending is not None,
+            **index.stats(),
+        }
+
+
+part_index = ModelIndex("part.Part", ("name", "IPN", "keywords"))
+template_index = ModelIndex("part.PartParameterTemplate", ("name",))
+
+
+def fuzzy_index_stats() -> dict:
+    return {"parts": part_index.stats(), "parameter_templates": template_index.stats()}
@@ -1,10 +1,17 @@
-"""Tabler icon validation using InvenTree's bundled icons.json."""
+"""Tabler icon validation and search using InvenTree's bundled icons.json."""
 
+import hashlib
 import json
 import logging
 import os
+import stat
+import tempfile
 from functools import lru_cache
 
+from ..mcp_server import mcp
+from .fuzzy import TrigramIndex
+from .runner import sync_tool
+
 logger = logging.getLogger("inventree_mcp_plugin.tools.icons")
 
 # Possible locations for icons.json (PKG install, source install, Docker)
@@ -15,41 +22,215 @@ _ICON_PATHS = [
 ]
 
 
-@lru_cache(maxsize=1)
-def _load_icons() -> dict:
-    """Load and cache the Tabler icons registry.
+# Bumped whenever the cache file layout changes
+_CACHE_FORMAT = "tabler-icons-v1"
 
-    Returns a dict mapping icon name -> set of valid variants.
-    """
+
+class IconRegistry:
+    """Icon names with their valid variants packed into one bitmask per name."""
+
+    __slots__ = ("_masks", "_variants")
+
+    def __init__(self, masks: dict, variants: tuple):
+        self._masks = masks
+        self._variants = variants
+
+    def __contains__(self, name):
+        return name in self._masks
+
+    def __iter__(self):
+        return iter(self._masks)
+
+    def __len__(self):
+        return len(self._masks)
+
+    def variants(self, name: str) -> list:
+        """Sorted variant names valid for icon name (empty if unknown)."""
+        mask = self._masks.get(name, 0)
+        return [v for bit, v in enumerate(self._variants) if mask >> bit & 1]
+
+
+def _find_icons_json():
+    """Return the path of InvenTree's icons.json, or None."""
+    paths = list(_ICON_PATHS)
     # Try Django's static file finders first
     try:
         from django.contrib.staticfiles import finders
 
-        path = finders.find("tabler-icons/icons.json")
-        if path:
-            _ICON_PATHS.insert(0, path)
+        found = finders.find("tabler-icons/icons.json")
+        if found:
+            paths.insert(0, found)
     except Exception:
         pass
+    return next((path for path in paths if os.path.isfile(path)), None)
+
+
+def _cache_dir():
+    """Return the icon cache directory, creating it private to this user, or None if it isn't safe to use.
+
+    The default lives in the shared temp directory, so a directory that is a
+    symlink, belongs to another user or is writable by others is refused:
+    anyone who could write there could plant a cache file.
+    """
+    cache_dir = os.environ.get("INVENTREE_MCP_CACHE_DIR")
+    if not cache_dir:
+        suffix = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+        cache_dir = os.path.join(tempfile.gettempdir(), f"inventree-mcp{suffix}")
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        st = os.lstat(cache_dir)
+    except OSError as e:
+        logger.warning("Icon cache directory %s is not usable: %s", cache_dir, e)
+        return None
+    if not stat.S_ISDIR(st.st_mode):
+        logger.warning("Icon cache directory %s is not a directory; not caching icons", cache_dir)
+        return None
+    if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+        logger.warning("Icon cache directory %s is not private to this user; not caching icons", cache_dir)
+        return None
+    return cache_dir
+
+
+def _cache_path(cache_dir: str, source: str) -> str:
+    digest = hashlib.sha1(os.path.abspath(source).encode()).hexdigest()[:12]
+    return os.path.join(cache_dir, f"tabler-icons-{digest}.txt")
+
+
+def _file_hash(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _parse_icons_json(path: str) -> IconRegistry:
+    """Extract icon names and variants from the full icons.json (several MB of SVG)."""
+    with open(path) as f:
+        data = json.load(f)
+    names = {}
+    for name, info in data.items():
+        variants = info.get("variants", {})
+        names[name] = sorted(variants) if isinstance(variants, dict) else []
+    all_variants = tuple(sorted({v for vs in names.values() for v in vs}))
+    bits = {v: 1 << i for i, v in enumerate(all_variants)}
+    masks = {name: sum(bits[v] for v in vs) for name, vs in sorted(names.items())}
+    return IconRegistry(masks, all_variants)
+
+
+def _read_cache(cache: str, source_stat, source: str):
+    """Return (header, registry) from the cache file, or None if missing/stale/corrupt.
+
+    A cache whose recorded mtime/size differ from the source is still used
+    if the source's content hash is unchanged.
+    """
+    try:
+        with open(cache) as f:
+            if f.readline().rstrip("\n") != _CACHE_FORMAT:
+                return None
+            header = json.loads(f.readline())
+            if not isinstance(header, dict) or not all(isinstance(v, str) for v in header["variants"]):
+                return None
+            if (header["mtime_ns"], header["size"]) != (source_stat.st_mtime_ns, source_stat.st_size):
+                if header["sha256"] != _file_hash(source):
+                    return None
+                header.update(mtime_ns=source_stat.st_mtime_ns, size=source_stat.st_size, touched=True)
+            masks = {}
+            for line in f:
+                name, _, mask = line.rstrip("\n").partition("\t")
+                masks[name] = int(mask, 16)
+        return header, IconRegistry(masks, tuple(header["variants"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        # TypeError: valid JSON of the wrong shape
+        return None
+
+
+def _write_cache(cache: str, header: dict, registry: IconRegistry):
+    """Atomically write the compact registry: a header, then one 'name<TAB>hexmask' line per icon."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(cache), prefix=".icons-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(_CACHE_FORMAT + "\n")
+            f.write(json.dumps({k: v for k, v in header.items() if k != "touched"}) + "\n")
+            f.writelines(f"{name}\t{mask:x}\n" for name, mask in registry._masks.items())
+        os.replace(tmp, cache)
+    except OSError:
+        os.unlink(tmp)
+        raise
+
+
+@lru_cache(maxsize=1)
+def _load_icons() -> IconRegistry:
+    """Load and cache the Tabler icons registry.
+
+    The names and variants extracted from icons.json are kept in a compact
+    cache file (under $INVENTREE_MCP_CACHE_DIR, or a private directory in the
+    temp directory), so only the first process after an InvenTree upgrade
+    parses the full file.
+    """
+    path = _find_icons_json()
+    if path is None:
+        logger.warning("Could not find tabler-icons/icons.json — icon validation disabled")
+        return IconRegistry({}, ())
 
-    for path in _ICON_PATHS:
-        if os.path.isfile(path):
+    source_stat = os.stat(path)
+    cache_dir = _cache_dir()
+    cache = _cache_path(cache_dir, path) if cache_dir else None
+    cached = _read_cache(cache, source_stat, path) if cache else None
+    if cached is not None:
+        header, registry = cached
+        if header.get("touched"):
+            # Content unchanged but the file was touched: record the new mtime
             try:
-                with open(path) as f:
-                    data = json.load(f)
-                icons = {}
-                for name, info in data.items():
-                    variants = info.get("variants", {})
-                    if isinstance(variants, dict):
-                        icons[name] = set(variants.keys())
-                    else:
-                        icons[name] = set()
-                logger.info("Loaded %d Tabler icons from %s", len(icons), path)
-                return icons
-            except Exception as e:
-                logger.warning("Failed to load icons from %s: %s", path, e)
-
-    logger.warning("Could not find tabler-icons/icons.json — icon validation disabled")
-    return {}
+                _write_cache(cache, header, registry)
+            except OSError as e:
+                logger.warning("Could not write icon cache %s: %s", cache, e)
+        logger.info("Loaded %d Tabler icons from cache %s", len(registry), cache)
+        return registry
+
+    try:
+        registry = _parse_icons_json(path)
+    except Exception as e:
+        logger.warning("Failed to load icons from %s: %s", path, e)
+        return IconRegistry({}, ())
+    logger.info("Loaded %d Tabler icons from %s", len(registry), path)
+
+    if cache is None:
+        return registry
+    header = {
+        "source": path,
+        "mtime_ns": source_stat.st_mtime_ns,
+        "size": source_stat.st_size,
+        "sha256": _file_hash(path),
+        "variants": list(registry._variants),
+    }
+    try:
+        _write_cache(cache, header, registry)
+    except OSError as e:
+        logger.warning("Could not write icon cache %s: %s", cache, e)
+    return registry
+
+
+@lru_cache(maxsize=1)
+def _icon_index() -> TrigramIndex:
+    """Trigram index over icon names, for ranked suggestions and search_icons."""
+    index = TrigramIndex()
+    for name in _load_icons():
+        index.add(name, name)
+    return index
+
+
+def _icon_ref(name: str, variant: str = "") -> str:
+    """Format name as an icon string, keeping variant if the icon has it."""
+    variants = _load_icons().variants(name) or ["outline"]
+    if variant not in variants:
+        variant = "outline" if "outline" in variants else variants[0]
+    return f"ti:{name}:{variant}"
+
+
+def suggest_icons(name: str, limit: int = 5) -> list:
+    """Return up to limit (icon name, score) pairs most similar to name."""
+    return _icon_index().search(name, limit=limit)
 
 
 def validate_icon(icon_str: str) -> tuple[bool, str]:
@@ -74,16 +255,41 @@ def validate_icon(icon_str: str) -> tuple[bool, str]:
     variant = parts[2]
 
     if name not in icons:
-        # Find similar names for a helpful suggestion
-        suggestions = [n for n in icons if name in n or n in name][:5]
+        suggestions = suggest_icons(name)
         msg = f"Unknown Tabler icon '{name}'."
         if suggestions:
-            formatted = ", ".join(f"ti:{s}:outline" for s in suggestions)
+            formatted = ", ".join(_icon_ref(s, variant) for s, _ in suggestions)
             msg += f" Similar: {formatted}"
         return False, msg
 
-    if variant not in icons[name]:
-        valid_variants = ", ".join(sorted(icons[name]))
+    if variant not in icons.variants(name):
+        valid_variants = ", ".join(icons.variants(name))
         return False, f"Icon '{name}' exists but variant '{variant}' is invalid. Valid variants: {valid_variants}"
 
     return True, ""
+
+
+@mcp.tool()
+@sync_tool()
+def search_icons(query: str, limit: int = 10) -> str:
+    """Find Tabler icon names for category/location icons, best match first.
+
+    Matching tolerates typos and missing hyphens (e.g. 'toolbox' finds 'tool-box').
+    Each result gives a ready-to-use icon string ('ti:<name>:<variant>') and
+    the variants the icon supports.
+    """
+    icons = _load_icons()
+    if not icons:
+        return {"error": "Icon registry not available on this server; icons are not validated"}
+
+    lim = limit if limit > 0 else 10
+    results = [
+        {
+            "icon": _icon_ref(name),
+            "name": name,
+            "variants": icons.variants(name),
+            "score": round(score, 3),
+        }
+        for name, score in suggest_icons(query, limit=lim)
+    ]
+    return {"count": len(results), "results": results}
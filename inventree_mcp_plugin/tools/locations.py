@@ -1,72 +1,140 @@
-"""Stock location tools — search, get, list, create, update, delete."""
+"""Stock location tools — search, get, tree, list, create, update, delete."""
 
 import json
 import logging
 from typing import Optional
 
-from asgiref.sync import sync_to_async
-
 from ..mcp_server import mcp
 from .icons import validate_icon
-from .serializers import serialize_stock_location, serialize_stock_location_compact, to_json
+from .queries import annotate_location_counts, paginate, subtree
+from .runner import sync_tool
+from .serializers import (
+    STOCK_LOCATION_COLUMNS,
+    STOCK_LOCATION_COMPACT,
+    project,
+    select_fields,
+    serialize_row,
+    serialize_stock_location,
+)
 
 logger = logging.getLogger("inventree_mcp_plugin.tools.locations")
 
+# Most nodes get_location_tree returns in one call
+_TREE_MAX_NODES = 2000
+
 
 @mcp.tool()
-async def search_stock_locations(search: str = "", parent: int = 0, limit: int = 10, offset: int = 0) -> str:
+@sync_tool(
+    "stock_location",
+    "view",
+    cache=lambda args, result: {"stock.StockLocation", "stock.StockItem.location_id", "stock.StockLocationType"},
+)
+def search_stock_locations(
+    search: str = "",
+    parent: int = 0,
+    limit: int = 10,
+    offset: int = 0,
+    cursor: str = "",
+    include_count: bool = True,
+    fields: Optional[list[str]] = None,
+) -> str:
     """Search and list stock locations. Returns compact results; use get_stock_location(id) for full detail.
 
     Combine filters: search by name AND/OR filter by parent location.
     Set search="" and parent=0 to list all locations.
     Default limit is 10 — check the count field for total matches and
     increase limit or paginate with offset if needed.
+    For deep paging pass the returned next_cursor as cursor (offset is then ignored).
+    Set include_count=false to skip counting the total matches.
+    Set fields to choose the returned keys (pk is always included), e.g.
+    ["name", "items"]. Available: name, pathstring, parent, location_type,
+    items, sublocations, description, level, structural, external.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock_location', 'view'):
-        return perm_err
-
-    @sync_to_async
-    def _query():
-        from stock.models import StockLocation
-
-        qs = StockLocation.objects.all()
-        if search:
-            from django.db.models import Q
-            qs = qs.filter(
-                Q(name__icontains=search) | Q(description__icontains=search)
-            )
-        if parent:
-            qs = qs.filter(parent_id=parent)
-        lim = limit if limit > 0 else 10
-        total = qs.count()
-        locations = list(qs[offset : offset + lim])
-        return {"count": total, "results": [serialize_stock_location_compact(loc) for loc in locations]}
-
-    return to_json(await _query())
+    from stock.models import StockLocation
+
+    try:
+        keys = select_fields(STOCK_LOCATION_COLUMNS, STOCK_LOCATION_COMPACT, fields)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    qs = StockLocation.objects.all()
+    if search:
+        from django.db.models import Q
+        qs = qs.filter(
+            Q(name__icontains=search) | Q(description__icontains=search)
+        )
+    if parent:
+        qs = qs.filter(parent_id=parent)
+    lim = limit if limit > 0 else 10
+    try:
+        locations, page = paginate(
+            qs, ("tree_id", "lft"), lim, offset, cursor, include_count,
+            annotate=lambda q: project(annotate_location_counts(q), STOCK_LOCATION_COLUMNS, keys, ("tree_id", "lft")),
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    page["results"] = [serialize_row(loc, STOCK_LOCATION_COLUMNS, keys) for loc in locations]
+    return page
 
 
 @mcp.tool()
-async def get_stock_location(id: int) -> str:
+@sync_tool(
+    "stock_location",
+    "view",
+    cache=lambda args, result: {
+        "stock.StockLocation",
+        f"stock.StockLocation:{args['id']}",
+        "stock.StockLocationType",
+    },
+)
+def get_stock_location(id: int) -> str:
     """Get detailed information about a specific stock location by its ID (pk)."""
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock_location', 'view'):
-        return perm_err
+    from stock.models import StockLocation
 
-    @sync_to_async
-    def _query():
-        from stock.models import StockLocation
+    try:
+        qs = annotate_location_counts(StockLocation.objects.select_related("location_type"))
+        return serialize_stock_location(qs.get(pk=id))
+    except StockLocation.DoesNotExist:
+        return {"error": f"Stock location {id} not found"}
 
-        try:
-            return serialize_stock_location(StockLocation.objects.get(pk=id))
-        except StockLocation.DoesNotExist:
-            return {"error": f"Stock location {id} not found"}
 
-    return to_json(await _query())
+@mcp.tool()
+@sync_tool(
+    "stock_location",
+    "view",
+    cache=lambda args, result: {"stock.StockLocation", "stock.StockItem.location_id"},
+)
+def get_location_tree(id: int = 0, max_depth: int = 3, limit: int = 500) -> str:
+    """Get a whole stock location subtree in one call, with stock item counts per node.
+
+    Set id=0 for the full hierarchy from the top-level locations.
+    max_depth is the number of levels returned, counting the top one.
+    Each node has items (directly in it), subtree_items (it and everything
+    below), descendants, and nested children. has_more marks nodes whose
+    children were cut off by max_depth or limit; call again with that
+    node's id to expand it.
+    """
+    from stock.models import StockItem, StockLocation
+
+    tree = subtree(
+        StockLocation,
+        id,
+        max(1, max_depth),
+        min(limit if limit > 0 else 500, _TREE_MAX_NODES),
+        StockItem,
+        "location",
+        "items",
+        fields=("name", "structural"),
+    )
+    if tree is None:
+        return {"error": f"Stock location {id} not found"}
+    roots, total, truncated = tree
+    return {"count": total, "truncated": truncated, "tree": roots}
 
 
 @mcp.tool()
-async def create_stock_location(
+@sync_tool("stock_location", "add")
+def create_stock_location(
     name: str,
     description: str = "",
     parent: int = 0,
@@ -81,38 +149,31 @@ async def create_stock_location(
     Icon should be a Tabler icon string like 'ti:tool:outline' or 'ti:circle:outline'.
     Set location_type to a StockLocationType ID to classify this location (use list_location_types).
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock_location', 'add'):
-        return perm_err
-
     if icon:
         valid, err = validate_icon(icon)
         if not valid:
-            return to_json({"error": err})
-
-    @sync_to_async
-    def _create():
-        from stock.models import StockLocation
+            return {"error": err}
 
-        fields = {"name": name}
-        if description:
-            fields["description"] = description
-        if parent:
-            fields["parent_id"] = parent
-        if structural is not None:
-            fields["structural"] = structural
-        if icon:
-            fields["icon"] = icon
-        if location_type:
-            fields["location_type_id"] = location_type
-        location = StockLocation.objects.create(**fields)
-        return serialize_stock_location(location)
+    from stock.models import StockLocation
 
-    return to_json(await _create())
+    fields = {"name": name}
+    if description:
+        fields["description"] = description
+    if parent:
+        fields["parent_id"] = parent
+    if structural is not None:
+        fields["structural"] = structural
+    if icon:
+        fields["icon"] = icon
+    if location_type:
+        fields["location_type_id"] = location_type
+    location = StockLocation.objects.create(**fields)
+    return serialize_stock_location(location)
 
 
 @mcp.tool()
-async def update_stock_location(
+@sync_tool("stock_location", "change")
+def update_stock_location(
     id: int,
     name: str = "",
     description: str = "",
@@ -127,67 +188,52 @@ async def update_stock_location(
     Set location_type to a StockLocationType ID to classify this location.
     Set location_type to -1 to clear the location type.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock_location', 'change'):
-        return perm_err
-
     if icon and icon.lower() != "none":
         valid, err = validate_icon(icon)
         if not valid:
-            return to_json({"error": err})
-
-    @sync_to_async
-    def _update():
-        from stock.models import StockLocation
-
-        try:
-            location = StockLocation.objects.get(pk=id)
-        except StockLocation.DoesNotExist:
-            return {"error": f"Stock location {id} not found"}
-        updated = False
-        if name:
-            location.name = name
-            updated = True
-        if description:
-            location.description = description
-            updated = True
-        if parent:
-            location.parent_id = parent
-            updated = True
-        if icon:
-            location.icon = "" if icon.lower() == "none" else icon
-            updated = True
-        if location_type == -1:
-            location.location_type = None
-            updated = True
-        elif location_type:
-            location.location_type_id = location_type
-            updated = True
-        if not updated:
-            return {"error": "No fields provided to update"}
-        location.save()
-        location.refresh_from_db()
-        return serialize_stock_location(location)
-
-    return to_json(await _update())
+            return {"error": err}
+
+    from stock.models import StockLocation
+
+    try:
+        location = StockLocation.objects.get(pk=id)
+    except StockLocation.DoesNotExist:
+        return {"error": f"Stock location {id} not found"}
+    updated = False
+    if name:
+        location.name = name
+        updated = True
+    if description:
+        location.description = description
+        updated = True
+    if parent:
+        location.parent_id = parent
+        updated = True
+    if icon:
+        location.icon = "" if icon.lower() == "none" else icon
+        updated = True
+    if location_type == -1:
+        location.location_type = None
+        updated = True
+    elif location_type:
+        location.location_type_id = location_type
+        updated = True
+    if not updated:
+        return {"error": "No fields provided to update"}
+    location.save()
+    location.refresh_from_db()
+    return serialize_stock_location(location)
 
 
 @mcp.tool()
-async def delete_stock_location(id: int) -> str:
+@sync_tool("stock_location", "delete")
+def delete_stock_location(id: int) -> str:
     """Delete a stock location. The location must be empty (no items or sub-locations)."""
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock_location', 'delete'):
-        return perm_err
-
-    @sync_to_async
-    def _delete():
-        from stock.models import StockLocation
-
-        try:
-            location = StockLocation.objects.get(pk=id)
-        except StockLocation.DoesNotExist:
-            return f"Stock location {id} not found."
-        location.delete()
-        return f"Location {id} deleted successfully."
-
-    return await _delete()
+    from stock.models import StockLocation
+
+    try:
+        location = StockLocation.objects.get(pk=id)
+    except StockLocation.DoesNotExist:
+        return f"Stock location {id} not found."
+    location.delete()
+    return f"Location {id} deleted successfully."
@@ -0,0 +1,237 @@
+"""Per-tool call metrics: latency, database work and response size.
+
+sync_tool measures every call in the thread that runs it: wall time, the
+time and number of database queries (through a connection execute
+wrapper), the rows in the result and the encoded response size in bytes
+(as reported by the encoder). Results served from the result cache report
+the rows and size stored with them. Each is kept as a histogram labelled by
+tool and user, and exposed in the Prometheus text format at
+/plugin/inventree-mcp/metrics (see render_prometheus).
+
+Calls slower than the SLOW_CALL_MS plugin setting are logged with their
+breakdown. Metrics are kept per process; with several web workers each
+scrape reports the worker that served it.
+"""
+
+import logging
+import threading
+import time
+
+from ..context import get_current_user, get_request_context
+from ..settings import get_int_setting
+from .encoding import utf8_size
+
+logger = logging.getLogger("inventree_mcp_plugin.tools.metrics")
+
+# name -> (help, bucket upper bounds)
+_HISTOGRAMS = {
+    "mcp_tool_duration_seconds": (
+        "Wall time of MCP tool calls",
+        (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+    ),
+    "mcp_tool_db_seconds": (
+        "Time MCP tool calls spent in database queries",
+        (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    ),
+    "mcp_tool_queries": (
+        "Database queries per MCP tool call",
+        (0, 1, 2, 5, 10, 25, 50, 100, 250, 1000),
+    ),
+    "mcp_tool_rows": (
+        "Rows in MCP tool results",
+        (0, 1, 10, 50, 100, 500, 1000, 5000, 10000),
+    ),
+    "mcp_tool_response_bytes": (
+        "Encoded size of MCP tool results",
+        (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+    ),
+}
+
+_lock = threading.Lock()
+_histograms = {name: {} for name in _HISTOGRAMS}
+_calls = {}
+_local = threading.local()
+
+_slow_ms = None
+
+
+class _Call:
+    """Measurements of one tool call, filled in while it runs."""
+
+    __slots__ = ("queries", "db_seconds", "rows", "size", "status")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.rows = None
+        self.size = None
+        self.status = "ok"
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper hook
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += time.perf_counter() - start
+            self.queries += 1
+
+
+def _slow_call_ms() -> int:
+    """SLOW_CALL_MS, read once per process (sync context)."""
+    global _slow_ms
+    if _slow_ms is None:
+        _slow_ms = max(0, get_int_setting("SLOW_CALL_MS", 1000))
+    return _slow_ms
+
+
+def _observe(name: str, labels: tuple, value: float):
+    bounds = _HISTOGRAMS[name][1]
+    series = _histograms[name].get(labels)
+    if series is None:
+        # bucket counts, then sum and count
+        series = _histograms[name][labels] = [0] * len(bounds) + [0.0, 0]
+    for i, bound in enumerate(bounds):
+        if value <= bound:
+            series[i] += 1
+            break
+    series[-2] += value
+    series[-1] += 1
+
+
+def note_result(result):
+    """Record the row count and error status of the result being encoded, if a call is measured."""
+    call = getattr(_local, "call", None)
+    if call is None:
+        return
+    if isinstance(result, dict):
+        if "error" in result:
+            call.status = "error"
+            return
+        rows = result.get("results")
+        call.rows = len(rows) if isinstance(rows, list) else 1
+    elif isinstance(result, list):
+        call.rows = len(result)
+
+
+def note_size(size: int):
+    """Record the encoded size in bytes of the result, if a call is measured."""
+    call = getattr(_local, "call", None)
+    if call is not None:
+        call.size = size
+
+
+def result_info():
+    """(rows, size) noted so far for the measured call, to store alongside a cached result."""
+    call = getattr(_local, "call", None)
+    return (None, None) if call is None else (call.rows, call.size)
+
+
+def note_cached(info):
+    """Record the (rows, size) stored with a result served from the cache."""
+    call = getattr(_local, "call", None)
+    if call is not None:
+        call.rows, call.size = info
+
+
+def note_denied():
+    """Mark the measured call as refused by the permission check."""
+    call = getattr(_local, "call", None)
+    if call is not None:
+        call.status = "denied"
+
+
+def measured(tool: str, run):
+    """Wrap a synchronous tool runner so each call is timed and recorded."""
+    from django.db import connection
+
+    def _measured(*args, **kwargs):
+        call = _Call()
+        previous, _local.call = getattr(_local, "call", None), call
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(call):
+                result = run(*args, **kwargs)
+            if call.size is None and isinstance(result, str):
+                # not sized by the encoder, e.g. a permission error
+                call.size = utf8_size(result)
+            return result
+        except Exception:
+            call.status = "exception"
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            _local.call = previous
+            _record(tool, call, elapsed, call.size or 0)
+
+    return _measured
+
+
+def _record(tool: str, call: _Call, elapsed: float, size: int):
+    user = get_current_user()
+    username = getattr(user, "username", "") or "anonymous"
+    labels = (tool, username)
+    with _lock:
+        key = (tool, username, call.status)
+        _calls[key] = _calls.get(key, 0) + 1
+        _observe("mcp_tool_duration_seconds", labels, elapsed)
+        _observe("mcp_tool_db_seconds", labels, call.db_seconds)
+        _observe("mcp_tool_queries", labels, call.queries)
+        _observe("mcp_tool_response_bytes", labels, size)
+        if call.rows is not None:
+            _observe("mcp_tool_rows", labels, call.rows)
+
+    threshold = _slow_call_ms()
+    if threshold and elapsed * 1000 >= threshold:
+        ctx = get_request_context()
+        logger.warning(
+            "Slow MCP tool call: %s by %s took %.0fms (%d queries, %.0fms in DB, %s rows, %d bytes, status %s) [request %s]",
+            tool,
+            username,
+            elapsed * 1000,
+            call.queries,
+            call.db_seconds * 1000,
+            "-" if call.rows is None else call.rows,
+            size,
+            call.status,
+            ctx.request_id if ctx is not None else "-",
+        )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus() -> str:
+    """Return all tool metrics in the Prometheus text exposition format."""
+    with _lock:
+        calls = dict(_calls)
+        histograms = {name: {labels: list(series) for labels, series in h.items()} for name, h in _histograms.items()}
+
+    lines = [
+        "# HELP mcp_tool_calls_total MCP tool calls by outcome (ok, error, denied, exception)",
+        "# TYPE mcp_tool_calls_total counter",
+    ]
+    for (tool, user, status), n in sorted(calls.items()):
+        lines.append(f"mcp_tool_calls_total{{{_labels(tool=tool, user=user, status=status)}}} {n}")
+
+    for name, (help_text, bounds) in _HISTOGRAMS.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for (tool, user), series in sorted(histograms[name].items()):
+            base = _labels(tool=tool, user=user)
+            cumulative = 0
+            for bound, n in zip(bounds, series):
+                cumulative += n
+                lines.append(f'{name}_bucket{{{base},le="{_number(bound)}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{base},le="+Inf"}} {series[-1]}')
+            lines.append(f"{name}_sum{{{base}}} {_number(series[-2])}")
+            lines.append(f"{name}_count{{{base}}} {series[-1]}")
+    return "\n".join(lines) + "\n"
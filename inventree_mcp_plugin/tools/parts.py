@@ -1,74 +1,115 @@
-"""Part tools — search, get, create, update, delete, list, set_image, search_images."""
+"""Part tools — search, get, create, bulk_create, update, bulk_update, delete, list, set_image, search_images."""
 
 import json
 import logging
 from typing import Optional
 
-from asgiref.sync import sync_to_async
-
 from ..mcp_server import mcp
-from .serializers import serialize_part, serialize_part_compact, to_json
+from ..signals import notify_changed, remember_previous
+from .fuzzy import part_index
+from .queries import paginate
+from .runner import sync_tool
+from .search import filter_parts
+from .serializers import (
+    PART_COLUMNS,
+    PART_COMPACT,
+    bulk_summary,
+    project,
+    select_fields,
+    serialize_part,
+    serialize_row,
+)
 
 logger = logging.getLogger("inventree_mcp_plugin.tools.parts")
 
+# Best fuzzy matches fetched before the category filter and paging apply
+_FUZZY_CANDIDATES = 200
+
 
 @mcp.tool()
-async def search_parts(search: str = "", category: int = 0, limit: int = 10, offset: int = 0) -> str:
+@sync_tool("part", "view", cache=lambda args, result: {"part.Part"})
+def search_parts(
+    search: str = "",
+    category: int = 0,
+    limit: int = 10,
+    offset: int = 0,
+    cursor: str = "",
+    include_count: bool = True,
+    fuzzy: bool = False,
+    fields: Optional[list[str]] = None,
+) -> str:
     """Search and list parts. Returns compact results; use get_part(id) for full detail.
 
     Combine filters: search by keyword AND/OR filter by category.
     Set search="" and category=0 to list all parts.
     Default limit is 10 — check the count field for total matches and
     increase limit or paginate with offset if needed.
+    For deep paging pass the returned next_cursor as cursor (offset is then ignored).
+    Set include_count=false to skip counting the total matches.
+    When the server has a full-text index, every search word is prefix-matched
+    and results are ranked by relevance.
+    Set fuzzy=true to tolerate typos and missing punctuation in name, IPN
+    or keywords (e.g. "esp32s3wroom"); results then carry a match score and
+    page with offset only.
+    Set fields to choose the returned keys (pk is always included), e.g.
+    ["name", "IPN", "units"]. Available: name, description, category, IPN,
+    keywords, units, minimum_stock, purchaseable, component, assembly,
+    trackable, virtual, active.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('part', 'view'):
-        return perm_err
-
-    @sync_to_async
-    def _query():
-        from part.models import Part
-
-        qs = Part.objects.all()
-        if search:
-            from django.db.models import Q
-            qs = qs.filter(
-                Q(name__icontains=search)
-                | Q(description__icontains=search)
-                | Q(IPN__icontains=search)
-                | Q(keywords__icontains=search)
-            )
+    from part.models import Part
+
+    try:
+        keys = select_fields(PART_COLUMNS, PART_COMPACT, fields)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    qs = Part.objects.all()
+    ordering = ("pk",)
+    if search and fuzzy:
+        matches = part_index.search(search, limit=_FUZZY_CANDIDATES)
+        qs = qs.filter(pk__in=[pk for pk, _ in matches])
         if category:
             qs = qs.filter(category_id=category)
+        found = {row["pk"]: row for row in project(qs, PART_COLUMNS, keys, ("pk",))}
+        ranked = [(found[pk], score) for pk, score in matches if pk in found]
         lim = limit if limit > 0 else 10
-        total = qs.count()
-        parts = list(qs[offset : offset + lim])
-        return {"count": total, "results": [serialize_part_compact(p) for p in parts]}
-
-    return to_json(await _query())
+        results = []
+        for part, score in ranked[offset : offset + lim]:
+            row = serialize_row(part, PART_COLUMNS, keys)
+            row["score"] = round(score, 3)
+            results.append(row)
+        return {"count": len(ranked), "next_cursor": None, "results": results}
+    if search:
+        qs, ordering = filter_parts(qs, search)
+    if category:
+        qs = qs.filter(category_id=category)
+    lim = limit if limit > 0 else 10
+    try:
+        parts, page = paginate(
+            qs, ordering, lim, offset, cursor, include_count,
+            annotate=lambda q: project(q, PART_COLUMNS, keys, [f.lstrip("-") for f in ordering]),
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    page["results"] = [serialize_row(p, PART_COLUMNS, keys) for p in parts]
+    return page
 
 
 @mcp.tool()
-async def get_part(id: int) -> str:
+@sync_tool("part", "view", cache=lambda args, result: {f"part.Part:{args['id']}"})
+def get_part(id: int) -> str:
     """Get detailed information about a specific part by its ID (pk)."""
-    from ..permissions import check_permission
-    if perm_err := await check_permission('part', 'view'):
-        return perm_err
-
-    @sync_to_async
-    def _query():
-        from part.models import Part
+    from part.models import Part
 
-        try:
-            return serialize_part(Part.objects.get(pk=id))
-        except Part.DoesNotExist:
-            return {"error": f"Part {id} not found"}
-
-    return to_json(await _query())
+    try:
+        return serialize_part(Part.objects.get(pk=id))
+    except Part.DoesNotExist:
+        return {"error": f"Part {id} not found"}
 
 
 @mcp.tool()
-async def create_part(
+@sync_tool("part", "add")
+def create_part(
     name: str,
     description: str = "",
     category: int = 0,
@@ -92,54 +133,314 @@ async def create_part(
     Set category=0 or omit for uncategorized. image_url is a URL that InvenTree
     will download the image from server-side.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('part', 'add'):
-        return perm_err
+    from part.models import Part
+
+    fields = {"name": name}
+    if description:
+        fields["description"] = description
+    if category:
+        fields["category_id"] = category
+    if IPN:
+        fields["IPN"] = IPN
+    if keywords:
+        fields["keywords"] = keywords
+    if units:
+        fields["units"] = units
+    if minimum_stock:
+        fields["minimum_stock"] = minimum_stock
+    if purchaseable is not None:
+        fields["purchaseable"] = purchaseable
+    if component is not None:
+        fields["component"] = component
+    if assembly is not None:
+        fields["assembly"] = assembly
+    if trackable is not None:
+        fields["trackable"] = trackable
+    if virtual is not None:
+        fields["virtual"] = virtual
+
+    part = Part.objects.create(**fields)
+
+    if image_url:
+        try:
+            part.remote_image = image_url
+            part.save()
+        except Exception as e:
+            logger.warning(f"Failed to set image for part {part.pk}: {e}")
+
+    return serialize_part(part)
+
 
-    @sync_to_async
-    def _create():
-        from part.models import Part
+# Optional create_part fields accepted per row by bulk_create_parts
+_BULK_PART_FIELDS = (
+    "description",
+    "IPN",
+    "keywords",
+    "units",
+    "minimum_stock",
+    "purchaseable",
+    "component",
+    "assembly",
+    "trackable",
+    "virtual",
+)
+
+# Rows per INSERT statement in bulk_create_parts
+_BULK_CREATE_BATCH = 500
+
+
+def _lock_tree_ids(model, tree_attr: str) -> int:
+    """Return the highest tree id, blocking other inserts into model's table until the transaction ends.
+
+    On PostgreSQL the table is locked in SHARE ROW EXCLUSIVE mode (reads go on,
+    writes wait); on MySQL the row with the highest tree id is locked, and its
+    next-key lock blocks inserts above it. SQLite serializes writers itself.
+    """
+    from django.db import connection
+    from django.db.models import Max
 
-        fields = {"name": name}
-        if description:
-            fields["description"] = description
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {connection.ops.quote_name(model._meta.db_table)} IN SHARE ROW EXCLUSIVE MODE")
+    elif connection.vendor == "mysql":
+        top = model.objects.select_for_update().order_by(f"-{tree_attr}").values_list(tree_attr, flat=True).first()
+        return top or 0
+    return model.objects.aggregate(m=Max(tree_attr))["m"] or 0
+
+
+def _assign_root_trees(model, objs):
+    """Give each unsaved node its own MPTT root tree, which bulk_create won't do.
+
+    Must run in the transaction that inserts objs. Returns the tree ids assigned,
+    in order, or None if the model isn't an MPTT model.
+
+    A concurrent save() (MPTT reads the highest tree id without a lock) cannot
+    insert until this transaction ends, so it sees the same highest id and takes
+    the next one. The ids handed out here start one above that, so the two never
+    meet; _check_root_trees() verifies it after the insert.
+    """
+    opts = getattr(model, "_mptt_meta", None)
+    if opts is None:
+        return None
+    if not objs:
+        return []
+    next_id = _lock_tree_ids(model, opts.tree_id_attr) + 2
+    tree_ids = []
+    for offset, obj in enumerate(objs):
+        setattr(obj, opts.tree_id_attr, next_id + offset)
+        setattr(obj, opts.left_attr, 1)
+        setattr(obj, opts.right_attr, 2)
+        setattr(obj, opts.level_attr, 0)
+        tree_ids.append(next_id + offset)
+    return tree_ids
+
+
+def _check_root_trees(model, tree_ids):
+    """Raise if a tree id handed out by _assign_root_trees ended up shared with another node."""
+    opts = model._mptt_meta
+    if model.objects.filter(**{f"{opts.tree_id_attr}__in": tree_ids}).count() != len(tree_ids):
+        raise RuntimeError("tree id allocation collided with a concurrent write; retry")
+
+
+def _part_value(attr: str, value):
+    """Convert a JSON value for Part field `attr` with the field's to_python(). Raises ValidationError."""
+    from django.core.exceptions import ValidationError
+    from part.models import Part
+
+    # to_python() would store an object or list as its str()
+    if isinstance(value, (dict, list)):
+        raise ValidationError("Expected a single value, not an object or list")
+    return Part._meta.get_field(attr).to_python(value)
+
+
+def _clean_part_fields(part, attrs):
+    """Run Part field validation (max lengths, validators such as the IPN pattern) on `attrs` only.
+
+    Foreign keys are checked set-based by the callers, so no query is made per row.
+    Raises ValidationError.
+    """
+    from part.models import Part
+
+    part.clean_fields(exclude=[f.name for f in Part._meta.fields if f.attname not in attrs or f.is_relation])
+
+
+def _validation_message(e) -> str:
+    if hasattr(e, "error_dict"):
+        return "; ".join(f"{field}: {' '.join(messages)}" for field, messages in e.message_dict.items())
+    return "; ".join(e.messages)
+
+
+def _allow_duplicate_ipn() -> bool:
+    """InvenTree's PART_ALLOW_DUPLICATE_IPN global setting, which Part.validate_unique enforces."""
+    try:
+        from common.settings import get_global_setting
+    except ImportError:
+        # InvenTree < 0.16
+        from common.models import InvenTreeSetting
+
+        return bool(InvenTreeSetting.get_setting("PART_ALLOW_DUPLICATE_IPN", True, cache=False))
+    return bool(get_global_setting("PART_ALLOW_DUPLICATE_IPN", True, cache=False))
+
+
+@mcp.tool()
+@sync_tool("part", "add")
+def bulk_create_parts(parts: list[dict]) -> str:
+    """Create many parts in one call (e.g. importing a BOM) instead of one create_part per part.
+
+    Each entry takes the same fields as create_part: 'name' (required), 'description',
+    'category', 'IPN', 'keywords', 'units', 'minimum_stock', 'purchaseable',
+    'component', 'assembly', 'trackable', 'virtual'.
+
+    Example:
+      parts = [
+        {"name": "M3x8 SHCS", "category": 12, "IPN": "HW-0001"},
+        {"name": "M3 Hex Nut", "category": 12, "IPN": "HW-0002"},
+      ]
+
+    Rows whose IPN, or whose name + IPN pair, already exists (in the database or
+    earlier in the batch) are skipped. Rows with missing names, invalid values,
+    unknown/structural categories or an IPN InvenTree's settings do not allow
+    are errors. All other rows are inserted in one transaction.
+    Returns counts plus per-row results (created pk or skip reason) and error_details.
+
+    Rows are written with bulk_create, so Part.save() is not run: its clean()
+    and validation hooks beyond the checks above, its post_save handlers and
+    InvenTree's plugin events (e.g. part created) are skipped for these parts.
+    """
+    from django.core.exceptions import ValidationError
+    from django.db import transaction
+    from django.db.models.functions import Lower
+    from part.models import Part, PartCategory
+
+    from ..context import get_current_user
+
+    results = []
+    rows = []
+    for i, entry in enumerate(parts):
+        if not isinstance(entry, dict):
+            results.append({"index": i, "error": "Entry must be an object"})
+            continue
+        try:
+            name = (_part_value("name", entry.get("name")) or "").strip()
+        except ValidationError as e:
+            results.append({"index": i, "error": f"Invalid value for 'name': {_validation_message(e)}"})
+            continue
+        if not name:
+            results.append({"index": i, "error": "Missing 'name'"})
+            continue
+        unknown = set(entry) - {"name", "category", *_BULK_PART_FIELDS}
+        if unknown:
+            results.append({"index": i, "name": name, "error": f"Unknown fields: {', '.join(sorted(unknown))}"})
+            continue
+        try:
+            category = int(entry.get("category") or 0)
+        except (TypeError, ValueError):
+            results.append({"index": i, "name": name, "error": f"Invalid category {entry.get('category')!r}"})
+            continue
+        values = {"name": name}
+        try:
+            for key in _BULK_PART_FIELDS:
+                if entry.get(key) not in (None, ""):
+                    values[key] = _part_value(key, entry[key])
+        except ValidationError as e:
+            results.append({"index": i, "name": name, "error": f"Invalid value for '{key}': {_validation_message(e)}"})
+            continue
+        if values.get("IPN"):
+            values["IPN"] = values["IPN"].strip()
+        rows.append((i, category, values))
+
+    # Set-based validation: one query each for categories, names and IPNs
+    category_ids = {category for _, category, _ in rows if category}
+    structural = dict(
+        PartCategory.objects.filter(pk__in=category_ids).values_list("pk", "structural")
+    )
+    ipns = {v["IPN"] for _, _, v in rows if v.get("IPN")}
+    taken_ipns = set(
+        Part.objects.annotate(ipn_lower=Lower("IPN"))
+        .filter(ipn_lower__in={ipn.lower() for ipn in ipns})
+        .values_list("IPN", flat=True)
+    )
+    # Compared case-insensitively unless duplicate IPNs are allowed, like Part.validate_unique
+    allow_duplicate_ipn = _allow_duplicate_ipn()
+    taken_ipns_lower = {ipn.lower() for ipn in taken_ipns}
+    taken_pairs = {
+        (n, ipn or "")
+        for n, ipn in Part.objects.filter(name__in={v["name"] for _, _, v in rows}).values_list("name", "IPN")
+    }
+
+    user = get_current_user()
+    has_creator = any(f.name == "creation_user" for f in Part._meta.get_fields())
+    to_create = []
+    for i, category, values in rows:
+        name = values["name"]
+        ipn = values.get("IPN") or ""
+        if category and category not in structural:
+            results.append({"index": i, "name": name, "error": f"Category {category} not found"})
+            continue
+        if category and structural[category]:
+            results.append({"index": i, "name": name, "error": f"Category {category} is structural"})
+            continue
+        if ipn and ipn in taken_ipns:
+            results.append({"index": i, "name": name, "action": "skipped", "reason": f"IPN '{ipn}' already exists"})
+            continue
+        if (name, ipn) in taken_pairs:
+            results.append({"index": i, "name": name, "action": "skipped", "reason": f"Part '{name}' already exists"})
+            continue
+        if ipn and not allow_duplicate_ipn and ipn.lower() in taken_ipns_lower:
+            results.append({"index": i, "name": name, "error": f"Duplicate IPN '{ipn}' not allowed in part settings"})
+            continue
+
+        part = Part(**values)
+        try:
+            _clean_part_fields(part, values)
+        except ValidationError as e:
+            results.append({"index": i, "name": name, "error": _validation_message(e)})
+            continue
         if category:
-            fields["category_id"] = category
-        if IPN:
-            fields["IPN"] = IPN
-        if keywords:
-            fields["keywords"] = keywords
-        if units:
-            fields["units"] = units
-        if minimum_stock:
-            fields["minimum_stock"] = minimum_stock
-        if purchaseable is not None:
-            fields["purchaseable"] = purchaseable
-        if component is not None:
-            fields["component"] = component
-        if assembly is not None:
-            fields["assembly"] = assembly
-        if trackable is not None:
-            fields["trackable"] = trackable
-        if virtual is not None:
-            fields["virtual"] = virtual
-
-        part = Part.objects.create(**fields)
-
-        if image_url:
-            try:
-                part.remote_image = image_url
-                part.save()
-            except Exception as e:
-                logger.warning(f"Failed to set image for part {part.pk}: {e}")
-
-        return serialize_part(part)
-
-    return to_json(await _create())
+            part.category_id = category
+        if has_creator and user is not None:
+            part.creation_user = user
+
+        # Prevent dupes within the batch
+        taken_pairs.add((name, ipn))
+        if ipn:
+            taken_ipns.add(ipn)
+            taken_ipns_lower.add(ipn.lower())
+        to_create.append(part)
+        results.append({"index": i, "name": name, "action": "created", "_obj": part})
+
+    try:
+        with transaction.atomic():
+            tree_ids = _assign_root_trees(Part, to_create)
+            Part.objects.bulk_create(to_create, batch_size=_BULK_CREATE_BATCH)
+            if tree_ids:
+                _check_root_trees(Part, tree_ids)
+            if to_create and to_create[0].pk is None and tree_ids:
+                # Backends that can't return ids from bulk INSERT: map them back by tree id
+                tree_attr = Part._mptt_meta.tree_id_attr
+                pks = dict(
+                    Part.objects.filter(**{f"{tree_attr}__in": tree_ids}).values_list(tree_attr, "pk")
+                )
+                for part, tree_id in zip(to_create, tree_ids):
+                    part.pk = pks.get(tree_id)
+    except Exception as e:
+        return {"error": f"Failed to create parts, none were created: {e}"}
+    notify_changed(to_create)
+
+    for r in results:
+        if "_obj" in r:
+            r["pk"] = r.pop("_obj").pk
+    return bulk_summary(
+        len(parts),
+        results,
+        created=len(to_create),
+        skipped=sum(1 for r in results if r.get("action") == "skipped"),
+    )
 
 
 @mcp.tool()
-async def update_part(
+@sync_tool("part", "change")
+def update_part(
     id: int,
     name: str = "",
     description: str = "",
@@ -155,176 +456,376 @@ async def update_part(
 
     Set image_url to a URL and InvenTree will download the image server-side.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('part', 'change'):
-        return perm_err
-
-    @sync_to_async
-    def _update():
-        from part.models import Part
+    from part.models import Part
+
+    try:
+        part = Part.objects.get(pk=id)
+    except Part.DoesNotExist:
+        return {"error": f"Part {id} not found"}
+
+    updated = False
+    if name:
+        part.name = name
+        updated = True
+    if description:
+        part.description = description
+        updated = True
+    if category:
+        part.category_id = category
+        updated = True
+    if active is not None:
+        part.active = active
+        updated = True
+    if IPN:
+        part.IPN = IPN
+        updated = True
+    if keywords:
+        part.keywords = keywords
+        updated = True
+    if units:
+        part.units = units
+        updated = True
+    if minimum_stock:
+        part.minimum_stock = minimum_stock
+        updated = True
+
+    if not updated and not image_url:
+        return {"error": "No fields provided to update"}
+
+    if updated:
+        part.save()
 
+    if image_url:
         try:
-            part = Part.objects.get(pk=id)
-        except Part.DoesNotExist:
-            return {"error": f"Part {id} not found"}
-
-        updated = False
-        if name:
-            part.name = name
-            updated = True
-        if description:
-            part.description = description
-            updated = True
-        if category:
-            part.category_id = category
-            updated = True
-        if active is not None:
-            part.active = active
-            updated = True
-        if IPN:
-            part.IPN = IPN
-            updated = True
-        if keywords:
-            part.keywords = keywords
-            updated = True
-        if units:
-            part.units = units
-            updated = True
-        if minimum_stock:
-            part.minimum_stock = minimum_stock
-            updated = True
-
-        if not updated and not image_url:
-            return {"error": "No fields provided to update"}
-
-        if updated:
+            part.remote_image = image_url
             part.save()
+        except Exception as e:
+            logger.warning(f"Failed to set image for part {part.pk}: {e}")
 
-        if image_url:
-            try:
-                part.remote_image = image_url
-                part.save()
-            except Exception as e:
-                logger.warning(f"Failed to set image for part {part.pk}: {e}")
+    part.refresh_from_db()
+    return serialize_part(part)
 
-        part.refresh_from_db()
-        return serialize_part(part)
 
-    return to_json(await _update())
+# Fields bulk_update_parts may change, mapped to Part model attributes
+_BULK_UPDATE_FIELDS = {
+    "name": "name",
+    "description": "description",
+    "category": "category_id",
+    "active": "active",
+    "IPN": "IPN",
+    "keywords": "keywords",
+    "units": "units",
+    "minimum_stock": "minimum_stock",
+}
 
 
-@mcp.tool()
-async def delete_part(id: int) -> str:
-    """Delete a part. The part is first deactivated, then deleted.
+# Part fields in InvenTree's unique_together ("name", "IPN", "revision")
+_IDENTITY_FIELDS = {"name", "IPN", "revision"}
 
-    The part must have no stock items before it can be deleted.
+
+def _identity_conflicts(pending) -> dict:
+    """Find bulk_update_parts rows whose new name/IPN would collide; returns {index: error}.
+
+    `pending` holds (index, part with new values set, changed attrs, previous
+    (name, IPN, revision) or None if unchanged). A new identity must not match
+    another part's (name, IPN, revision), nor, unless PART_ALLOW_DUPLICATE_IPN,
+    its IPN case-insensitively. Other parts are read in one query; within the
+    batch the first row to claim an identity wins. A rejected row keeps its
+    old identity, which can in turn reject rows that wanted it, so this
+    repeats until no new conflicts are found. NULL IPNs and revisions never
+    collide, as in the database constraint.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('part', 'delete'):
-        return perm_err
+    from django.db.models import Q
+    from django.db.models.functions import Lower
+    from part.models import Part
+
+    moving = [row for row in pending if row[3] is not None]
+    if not moving:
+        return {}
+    allow_duplicate_ipn = _allow_duplicate_ipn()
+
+    def ipn_key(ipn):
+        return ipn.lower() if ipn else None
+
+    query = Q(name__in={part.name for _, part, _, _ in moving})
+    if not allow_duplicate_ipn:
+        query |= Q(ipn_lower__in={ipn_key(part.IPN) for _, part, _, _ in moving if part.IPN})
+    others = (
+        Part.objects.annotate(ipn_lower=Lower("IPN"))
+        .filter(query)
+        .exclude(pk__in=[part.pk for _, part, _, _ in moving])
+        .values_list("name", "IPN", "revision")
+    )
+    held = [(name, ipn, revision) for name, ipn, revision in others]
+
+    conflicts = {}
+    while True:
+        identities = {identity for identity in held if None not in identity}
+        ipns = {ipn_key(ipn) for _, ipn, _ in held if ipn}
+        for i, _, _, previous in moving:
+            if i in conflicts:
+                identities.add(previous)
+                ipns.add(ipn_key(previous[1]))
+        found = {}
+        for i, part, _, _ in moving:
+            if i in conflicts:
+                continue
+            identity = (part.name, part.IPN, part.revision)
+            if None not in identity and identity in identities:
+                found[i] = f"A part named '{part.name}' with IPN '{part.IPN or ''}' already exists"
+            elif part.IPN and not allow_duplicate_ipn and ipn_key(part.IPN) in ipns:
+                found[i] = f"Duplicate IPN '{part.IPN}' not allowed in part settings"
+            else:
+                identities.add(identity)
+                if part.IPN:
+                    ipns.add(ipn_key(part.IPN))
+        if not found:
+            return conflicts
+        conflicts.update(found)
+
+
+def _restore(part, values: dict):
+    for attr, value in values.items():
+        setattr(part, attr, value)
 
-    @sync_to_async
-    def _delete():
-        from part.models import Part
 
+@mcp.tool()
+@sync_tool("part", "change")
+def bulk_update_parts(updates: list[dict], only_failures: bool = False) -> str:
+    """Update fields on many parts in one call (e.g. mass recategorization or keyword clean-up).
+
+    Each entry is {"id": <part ID>, "fields": {...}} where fields may contain
+    name, description, category, active, IPN, keywords, units, minimum_stock.
+
+    Example:
+      updates = [
+        {"id": 10, "fields": {"category": 7}},
+        {"id": 11, "fields": {"category": 7, "keywords": "M3 screw"}},
+      ]
+
+    Values equal to the current ones are ignored. Rows with invalid values, whose
+    name/IPN would duplicate another part's, or that repeat an earlier entry's id
+    are errors; all other changes are written in one transaction. Returns counts
+    and, per part, the fields that changed; set only_failures=true to return
+    just the counts and error_details.
+    """
+    from django.core.exceptions import ValidationError
+    from django.db import transaction
+    from part.models import Part, PartCategory
+
+    results = []
+    entries = []
+    first_index = {}
+    for i, entry in enumerate(updates):
+        if not isinstance(entry, dict) or not isinstance(entry.get("fields"), dict) or not entry["fields"]:
+            results.append({"index": i, "error": "Entry must be an object with 'id' and non-empty 'fields'"})
+            continue
         try:
-            part = Part.objects.get(pk=id)
-        except Part.DoesNotExist:
-            return f"Part {id} not found."
-        part.active = False
-        part.save()
-        part.delete()
-        return f"Part {id} deleted successfully."
-
-    return await _delete()
+            part_id = int(entry.get("id") or entry.get("pk"))
+        except (TypeError, ValueError):
+            results.append({"index": i, "error": f"Invalid part id {entry.get('id')!r}"})
+            continue
+        if part_id in first_index:
+            error = f"Part {part_id} is already updated by entry {first_index[part_id]}"
+            results.append({"index": i, "id": part_id, "error": error})
+            continue
+        first_index[part_id] = i
+        unknown = set(entry["fields"]) - set(_BULK_UPDATE_FIELDS)
+        if unknown:
+            results.append({"index": i, "id": part_id, "error": f"Unknown fields: {', '.join(sorted(unknown))}"})
+            continue
+        values = {}
+        try:
+            for key, value in entry["fields"].items():
+                values[_BULK_UPDATE_FIELDS[key]] = _part_value(_BULK_UPDATE_FIELDS[key], value)
+        except ValidationError as e:
+            results.append({"index": i, "id": part_id, "error": f"Invalid value for '{key}': {_validation_message(e)}"})
+            continue
+        if isinstance(values.get("name"), str):
+            values["name"] = values["name"].strip()
+        if isinstance(values.get("IPN"), str):
+            values["IPN"] = values["IPN"].strip()
+        if "name" in values and not values["name"]:
+            results.append({"index": i, "id": part_id, "error": "Part name cannot be empty"})
+            continue
+        entries.append((i, part_id, values))
+
+    # One query for the targets (only the columns being updated) and one for categories
+    attrs = {attr for _, _, values in entries for attr in values}
+    if attrs & _IDENTITY_FIELDS:
+        # The uniqueness check needs each renamed part's whole (name, IPN, revision)
+        attrs |= _IDENTITY_FIELDS
+    targets = Part.objects.only("pk", *attrs).in_bulk({part_id for _, part_id, _ in entries})
+    remember_previous(targets.values(), ("category_id",))
+    category_ids = {v["category_id"] for _, _, v in entries if v.get("category_id")}
+    structural = dict(
+        PartCategory.objects.filter(pk__in=category_ids).values_list("pk", "structural")
+    )
+
+    pending = []
+    # index -> the values a row replaced, put back if the row is rejected
+    originals = {}
+    unchanged = 0
+    for i, part_id, values in entries:
+        part = targets.get(part_id)
+        if part is None:
+            results.append({"index": i, "id": part_id, "error": f"Part {part_id} not found"})
+            continue
+        category = values.get("category_id")
+        if category and category not in structural:
+            results.append({"index": i, "id": part_id, "error": f"Category {category} not found"})
+            continue
+        if category and structural[category]:
+            results.append({"index": i, "id": part_id, "error": f"Category {category} is structural"})
+            continue
+
+        changed = [attr for attr, value in values.items() if getattr(part, attr) != value]
+        if not changed:
+            unchanged += 1
+            results.append({"index": i, "id": part_id, "action": "unchanged"})
+            continue
+        previous = (part.name, part.IPN, part.revision) if _IDENTITY_FIELDS & set(changed) else None
+        originals[i] = {attr: getattr(part, attr) for attr in changed}
+        for attr in changed:
+            setattr(part, attr, values[attr])
+        try:
+            _clean_part_fields(part, changed)
+        except ValidationError as e:
+            _restore(part, originals[i])
+            results.append({"index": i, "id": part_id, "error": _validation_message(e)})
+            continue
+        pending.append((i, part, changed, previous))
+
+    conflicts = _identity_conflicts(pending)
+    groups = {}
+    for i, part, changed, _ in pending:
+        part_id = part.pk
+        if i in conflicts:
+            _restore(part, originals[i])
+            results.append({"index": i, "id": part_id, "error": conflicts[i]})
+            continue
+        groups.setdefault(frozenset(changed), {})[part_id] = part
+        results.append(
+            {
+                "index": i,
+                "id": part_id,
+                "action": "updated",
+                "changed": sorted(k for k, a in _BULK_UPDATE_FIELDS.items() if a in changed),
+            }
+        )
+
+    try:
+        with transaction.atomic():
+            # One UPDATE batch per distinct set of changed fields
+            for fields, parts_by_id in groups.items():
+                Part.objects.bulk_update(list(parts_by_id.values()), sorted(fields))
+    except Exception as e:
+        return {"error": f"Failed to update parts, no changes were saved: {e}"}
+    for parts_by_id in groups.values():
+        notify_changed(parts_by_id.values())
+
+    summary = bulk_summary(
+        len(updates),
+        results,
+        updated=sum(1 for r in results if r.get("action") == "updated"),
+        unchanged=unchanged,
+    )
+    if only_failures:
+        summary.pop("results")
+    return summary
 
 
 @mcp.tool()
-async def set_part_image(id: int, image_url: str) -> str:
-    """Set a part's image by URL. InvenTree downloads the image server-side.
+@sync_tool("part", "delete")
+def delete_part(id: int) -> str:
+    """Delete a part. The part is first deactivated, then deleted.
 
-    Use search_part_images to find image URLs, then pass one here.
+    The part must have no stock items before it can be deleted.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('part', 'change'):
-        return perm_err
+    from part.models import Part
 
-    @sync_to_async
-    def _set_image():
-        from part.models import Part
+    try:
+        part = Part.objects.get(pk=id)
+    except Part.DoesNotExist:
+        return f"Part {id} not found."
+    part.active = False
+    part.save()
+    part.delete()
+    return f"Part {id} deleted successfully."
 
-        try:
-            part = Part.objects.get(pk=id)
-        except Part.DoesNotExist:
-            return {"error": f"Part {id} not found"}
-        try:
-            part.remote_image = image_url
-            part.save()
-        except Exception as e:
-            return {"error": f"Failed to set image: {e}"}
-        part.refresh_from_db()
-        return serialize_part(part)
 
-    return to_json(await _set_image())
+@mcp.tool()
+@sync_tool("part", "change")
+def set_part_image(id: int, image_url: str) -> str:
+    """Set a part's image by URL. InvenTree downloads the image server-side.
+
+    Use search_part_images to find image URLs, then pass one here.
+    """
+    from part.models import Part
+
+    try:
+        part = Part.objects.get(pk=id)
+    except Part.DoesNotExist:
+        return {"error": f"Part {id} not found"}
+    try:
+        part.remote_image = image_url
+        part.save()
+    except Exception as e:
+        return {"error": f"Failed to set image: {e}"}
+    part.refresh_from_db()
+    return serialize_part(part)
 
 
 @mcp.tool()
-async def search_part_images(query: str, num: int = 5) -> str:
+@sync_tool("part", "view")
+def search_part_images(query: str, num: int = 5) -> str:
     """Search Google Images for part photos. Requires GOOGLE_API_KEY and GOOGLE_CSE_ID plugin settings.
 
     Returns image URLs that can be passed to set_part_image or create_part(image_url=...).
     Tip: include manufacturer name or 'datasheet' in query for better results.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('part', 'view'):
-        return perm_err
-
-    @sync_to_async
-    def _search():
-        import requests
-
-        from plugin.registry import registry
-
-        n = max(1, min(10, num))
-        plugin = registry.get_plugin("inventree-mcp")
-        if plugin is None:
-            return {"error": "Plugin not found in registry"}
-        api_key = plugin.get_setting("GOOGLE_API_KEY")
-        cse_id = plugin.get_setting("GOOGLE_CSE_ID")
-        if not api_key or not cse_id:
-            return {
-                "error": "Image search is not configured. Set GOOGLE_API_KEY and GOOGLE_CSE_ID in plugin settings."
+    import requests
+
+    from plugin.registry import registry
+
+    n = max(1, min(10, num))
+    plugin = registry.get_plugin("inventree-mcp")
+    if plugin is None:
+        return {"error": "Plugin not found in registry"}
+    api_key = plugin.get_setting("GOOGLE_API_KEY")
+    cse_id = plugin.get_setting("GOOGLE_CSE_ID")
+    if not api_key or not cse_id:
+        return {
+            "error": "Image search is not configured. Set GOOGLE_API_KEY and GOOGLE_CSE_ID in plugin settings."
+        }
+    try:
+        resp = requests.get(
+            "https://www.googleapis.com/customsearch/v1",
+            params={
+                "key": api_key,
+                "cx": cse_id,
+                "q": query,
+                "searchType": "image",
+                "num": n,
+            },
+            timeout=10,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+    except Exception as e:
+        return {"error": f"Image search failed: {e}"}
+
+    results = []
+    for item in data.get("items", []):
+        img = item.get("image", {})
+        results.append(
+            {
+                "title": item.get("title", ""),
+                "link": item.get("link", ""),
+                "thumbnail_url": img.get("thumbnailLink", ""),
+                "context_url": img.get("contextLink", ""),
+                "width": img.get("width", 0),
+                "height": img.get("height", 0),
             }
-        try:
-            resp = requests.get(
-                "https://www.googleapis.com/customsearch/v1",
-                params={
-                    "key": api_key,
-                    "cx": cse_id,
-                    "q": query,
-                    "searchType": "image",
-                    "num": n,
-                },
-                timeout=10,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception as e:
-            return {"error": f"Image search failed: {e}"}
-
-        results = []
-        for item in data.get("items", []):
-            img = item.get("image", {})
-            results.append(
-                {
-                    "title": item.get("title", ""),
-                    "link": item.get("link", ""),
-                    "thumbnail_url": img.get("thumbnailLink", ""),
-                    "context_url": img.get("contextLink", ""),
-                    "width": img.get("width", 0),
-                    "height": img.get("height", 0),
-                }
-            )
-        return {"query": query, "count": len(results), "results": results}
-
-    return to_json(await _search())
+        )
+    return {"query": query, "count": len(results), "results": results}
@@ -0,0 +1,152 @@
+"""On-demand profiling of individual tool calls.
+
+With the PROFILING plugin setting on, a staff user can send the header
+X-MCP-Profile: 1 with an MCP request. Every tool call in that request then
+runs uncached under a profiler (pyinstrument if installed, else cProfile)
+with its SQL queries captured. The results are stored as artifacts in
+Django's cache for PROFILE_TTL seconds. Their ids are random and made by
+the server (the client's request id is only recorded in the artifact), so
+clients reusing an X-Request-Id cannot overwrite or guess each other's
+profiles. The ids are returned in the X-MCP-Profile-Id response header, and
+the get_profile tool fetches them.
+
+Without the header a tool call only checks a flag on the request context;
+no profiler, query log or setting lookup is involved.
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+
+from ..context import get_request_context
+
+logger = logging.getLogger("inventree_mcp_plugin.tools.profiling")
+
+PROFILE_TTL = 3600
+CACHE_PREFIX = "inventree-mcp:profile:"
+
+# Limits on what one artifact keeps
+MAX_STATEMENTS = 200
+MAX_FUNCTIONS = 40
+
+# cProfile (sys.monitoring on Python 3.12+) allows one active profiler per
+# process, so profiled calls run one at a time; others run unprofiled.
+_profiler_lock = threading.Lock()
+
+
+def requested() -> bool:
+    """True if the current request asked for its tool calls to be profiled."""
+    ctx = get_request_context()
+    return ctx is not None and ctx.profile
+
+
+class _QueryLog:
+    """connection.execute_wrapper hook recording each statement and its time."""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.statements.append((sql, time.perf_counter() - start))
+
+    def summary(self) -> dict:
+        total = sum(seconds for _, seconds in self.statements)
+        repeated = Counter(sql for sql, _ in self.statements)
+        data = {
+            "count": len(self.statements),
+            "time_ms": round(total * 1000, 2),
+            "statements": [{"sql": sql, "ms": round(seconds * 1000, 3)} for sql, seconds in self.statements[:MAX_STATEMENTS]],
+            # identical SQL run more than once, e.g. a query per row
+            "repeated": [{"sql": sql, "count": n} for sql, n in repeated.most_common(10) if n > 1],
+        }
+        if len(self.statements) > MAX_STATEMENTS:
+            data["truncated"] = len(self.statements) - MAX_STATEMENTS
+        return data
+
+
+def _pyinstrument():
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        return None
+    return Profiler(async_mode="disabled")
+
+
+def _run_profiled(run, args, kwargs):
+    """Run `run` under a profiler; returns (result, profiler name, report text)."""
+    profiler = _pyinstrument()
+    if profiler is not None:
+        profiler.start()
+        try:
+            result = run(*args, **kwargs)
+        finally:
+            profiler.stop()
+        return result, "pyinstrument", profiler.output_text(unicode=False, color=False)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = run(*args, **kwargs)
+    finally:
+        profiler.disable()
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(MAX_FUNCTIONS)
+    return result, "cProfile", out.getvalue()
+
+
+def profile(tool: str, run, args, kwargs):
+    """Run one tool call under the profiler and store the artifact; returns the call's result."""
+    from django.core.cache import cache
+    from django.db import connection
+
+    if not _profiler_lock.acquire(blocking=False):
+        logger.info("Profiler busy; running %s unprofiled", tool)
+        return run(*args, **kwargs)
+
+    ctx = get_request_context()
+    queries = _QueryLog()
+    start = time.perf_counter()
+    try:
+        with connection.execute_wrapper(queries):
+            result, profiler, report = _run_profiled(run, args, kwargs)
+    finally:
+        _profiler_lock.release()
+    elapsed = time.perf_counter() - start
+
+    profile_id = uuid.uuid4().hex
+    ctx.profile_ids.append(profile_id)
+    cache.set(
+        CACHE_PREFIX + profile_id,
+        {
+            "id": profile_id,
+            "request_id": ctx.request_id,
+            "tool": tool,
+            "user": getattr(ctx.user, "username", ""),
+            "created": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(elapsed * 1000, 2),
+            "arguments": [repr(a)[:200] for a in args] + [f"{k}={v!r}"[:200] for k, v in kwargs.items()],
+            "profiler": profiler,
+            "queries": queries.summary(),
+            "profile": report,
+        },
+        PROFILE_TTL,
+    )
+    logger.info("Profiled %s in %.0fms (%d queries): profile %s", tool, elapsed * 1000, len(queries.statements), profile_id)
+    return result
+
+
+def get_profile_artifact(profile_id: str):
+    """Return the stored profile `profile_id`, or None if it is unknown or expired."""
+    from django.core.cache import cache
+
+    return cache.get(CACHE_PREFIX + profile_id)
@@ -0,0 +1,241 @@
+"""Queryset helpers shared by the list tools.
+
+Annotations here let serializers read per-row counts from the row itself
+instead of issuing one COUNT query per related manager. Annotation names
+carry an ``mcp_`` prefix so they never collide with InvenTree's own
+``item_count``/``partcount`` properties on the models.
+
+List tools page through `paginate`, which supports both the original
+offset paging and opaque keyset cursors. Tree tools use `subtree`, which
+reads a whole MPTT subtree with its counts in two queries.
+"""
+
+import base64
+import json
+from bisect import bisect_left, bisect_right
+
+
+def _subquery_count(model, field: str):
+    """Correlated COUNT(*) of `model` rows whose `field` points at the outer row."""
+    from django.db.models import Count, IntegerField, OuterRef, Subquery
+    from django.db.models.functions import Coalesce
+
+    counts = (
+        model.objects.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def annotate_location_counts(qs):
+    """Annotate StockLocation rows with `mcp_item_count` and `mcp_sublocation_count`."""
+    from stock.models import StockItem, StockLocation
+
+    return qs.annotate(
+        mcp_item_count=_subquery_count(StockItem, "location"),
+        mcp_sublocation_count=_subquery_count(StockLocation, "parent"),
+    )
+
+
+def annotate_category_counts(qs):
+    """Annotate PartCategory rows with `mcp_part_count` and `mcp_subcategory_count`."""
+    from part.models import Part, PartCategory
+
+    return qs.annotate(
+        mcp_part_count=_subquery_count(Part, "category"),
+        mcp_subcategory_count=_subquery_count(PartCategory, "parent"),
+    )
+
+
+def subtree_filter(root, prefix: str = "") -> dict:
+    """Filter kwargs selecting rows in the MPTT subtree of `root`, root included.
+
+    `prefix` reaches the tree through a relation, e.g. "location__" on StockItem.
+    """
+    meta = root._mptt_meta
+    tree, left, right = meta.tree_id_attr, meta.left_attr, meta.right_attr
+    return {
+        f"{prefix}{tree}": getattr(root, tree),
+        f"{prefix}{left}__gte": getattr(root, left),
+        f"{prefix}{right}__lte": getattr(root, right),
+    }
+
+
+def in_stock_filter():
+    """InvenTree's definition of available stock (StockItem.IN_STOCK_FILTER) as a Q object."""
+    from django.db.models import Q
+    from stock.models import StockItem
+
+    q = getattr(StockItem, "IN_STOCK_FILTER", None)
+    return q if q is not None else Q(quantity__gt=0)
+
+
+def annotate_in_stock(qs):
+    """Annotate StockItem rows with `mcp_in_stock`, InvenTree's in-stock test evaluated in SQL.
+
+    The in_stock property instead follows sales order, customer and parent
+    item relations, which costs a query per row for items that have them.
+    """
+    from django.db.models import BooleanField, ExpressionWrapper
+
+    return qs.annotate(mcp_in_stock=ExpressionWrapper(in_stock_filter(), output_field=BooleanField()))
+
+
+def subtree(
+    model, root_id: int, max_depth: int, limit: int, count_model, count_field: str, count_name: str, fields=("name",)
+):
+    """Fetch a depth-limited MPTT subtree of `model` with per-node counts of `count_model`.
+
+    Returns (roots, total, truncated). Each node is a dict with `fields`,
+    the direct (`count_name`) and whole-subtree (`subtree_<count_name>`)
+    counts of `count_model` rows whose `count_field` points into it, its number of descendants, and nested
+    `children`. max_depth counts levels including the top one; with
+    root_id=0 the top level is every tree root. At most `limit` nodes are
+    returned, shallowest first. Returns None if root_id does not exist.
+
+    One query reads the nodes (bounded by the root's lft/rght), one groups
+    the counted rows by the lft of their node over the full subtree.
+    """
+    from django.db.models import Count, Subquery
+
+    meta = model._mptt_meta
+    tree, left, right, level = meta.tree_id_attr, meta.left_attr, meta.right_attr, meta.level_attr
+
+    nodes = model.objects.all()
+    counted = count_model.objects.filter(**{f"{count_field}__isnull": False})
+    if root_id:
+        root = model.objects.filter(pk=root_id)
+
+        def col(name):
+            return Subquery(root.values(name)[:1])
+
+        nodes = nodes.filter(
+            **{tree: col(tree), f"{left}__gte": col(left), f"{right}__lte": col(right), f"{level}__lt": col(level) + max_depth}
+        )
+        counted = counted.filter(
+            **{
+                f"{count_field}__{tree}": col(tree),
+                f"{count_field}__{left}__gte": col(left),
+                f"{count_field}__{right}__lte": col(right),
+            }
+        )
+    else:
+        nodes = nodes.filter(**{f"{level}__lt": max_depth})
+
+    rows = list(nodes.order_by(level, tree, left).values("pk", "parent", tree, left, right, level, *fields)[: limit + 1])
+    truncated = len(rows) > limit
+    rows = rows[:limit]
+    if root_id and not rows:
+        return None
+
+    # Counted rows per node, as sorted (lft, n) per tree, for range sums over lft..rght
+    tree_key, left_key = f"{count_field}__{tree}", f"{count_field}__{left}"
+    per_tree = {}
+    for row in counted.order_by().values(tree_key, left_key).annotate(n=Count("pk")):
+        per_tree.setdefault(row[tree_key], []).append((row[left_key], row["n"]))
+    ranges = {}
+    for tree_id, counts in per_tree.items():
+        counts.sort()
+        prefix = [0]
+        for _, n in counts:
+            prefix.append(prefix[-1] + n)
+        ranges[tree_id] = ([lft for lft, _ in counts], prefix, dict(counts))
+
+    by_pk = {}
+    roots = []
+    for row in rows:
+        lefts, prefix, direct = ranges.get(row[tree], ([], [0], {}))
+        lo, hi = bisect_left(lefts, row[left]), bisect_right(lefts, row[right])
+        node = {
+            "pk": row["pk"],
+            **{f: row[f] for f in fields},
+            "level": row[level],
+            count_name: direct.get(row[left], 0),
+            f"subtree_{count_name}": prefix[hi] - prefix[lo],
+            "descendants": (row[right] - row[left] - 1) // 2,
+            "children": [],
+        }
+        by_pk[row["pk"]] = node
+        parent = by_pk.get(row["parent"])
+        (parent["children"] if parent is not None else roots).append(node)
+
+    # Nodes whose children were cut off by max_depth or limit
+    for node in by_pk.values():
+        if node["descendants"] and not node["children"]:
+            node["has_more"] = True
+    return roots, len(rows), truncated
+
+
+def encode_cursor(values) -> str:
+    """Encode the ordering-key values of the last row into an opaque cursor."""
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """Decode a cursor from encode_cursor. Raises ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except Exception:
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    # Ordering keys are scalars; anything else would reach the ORM as a lookup value
+    if not all(v is None or isinstance(v, (str, int, float)) for v in values):
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    return values
+
+
+def _keyset_filter(ordering, values):
+    """Build a Q selecting rows strictly after `values` in `ordering` ("-field" = descending)."""
+    from django.db.models import Q
+
+    condition = Q()
+    for i in reversed(range(len(ordering))):
+        field = ordering[i].lstrip("-")
+        lookup = "lt" if ordering[i].startswith("-") else "gt"
+        after = Q(**{f"{field}__{lookup}": values[i]})
+        if i < len(ordering) - 1:
+            after |= Q(**{field: values[i]}) & condition
+        condition = after
+    return condition
+
+
+def paginate(qs, ordering, limit, offset=0, cursor="", include_count=True, annotate=None):
+    """Fetch one page of `qs`, by keyset cursor if given, else by offset.
+
+    `ordering` must be a tuple of indexed fields that uniquely orders the rows
+    (e.g. ("pk",) or ("tree_id", "lft")); the cursor seeks on those fields so
+    deep pages cost the same as the first one. A "-" prefix sorts descending
+    and may name an annotation already on `qs` (e.g. a search rank). `annotate` is applied to the
+    page query only, keeping the COUNT free of per-row subqueries. It may
+    return a .values() queryset, as long as the ordering fields are included.
+
+    Returns (rows, page) where page holds `count` (unless include_count is
+    False) and `next_cursor` (None on the last page).
+    """
+    page = {}
+    if include_count:
+        page["count"] = qs.count()
+
+    qs = qs.order_by(*ordering)
+    if cursor:
+        qs = qs.filter(_keyset_filter(ordering, decode_cursor(cursor, len(ordering))))
+        offset = 0
+    if annotate is not None:
+        qs = annotate(qs)
+
+    rows = list(qs[offset : offset + limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if has_more:
+        last = rows[-1]
+        get = last.get if isinstance(last, dict) else lambda f: getattr(last, f)
+        page["next_cursor"] = encode_cursor(get(f.lstrip("-")) for f in ordering)
+    else:
+        page["next_cursor"] = None
+    return rows, page
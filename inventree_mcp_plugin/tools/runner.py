@@ -0,0 +1,148 @@
+"""Tool runner — executes each MCP tool in a single sync_to_async hop.
+
+Tool bodies are plain synchronous functions. The permission check, the ORM
+work and the to_json encoding all happen inside one sync execution, so a
+tool call queues on the sync thread once instead of once per await.
+
+Write tools always run on asgiref's thread-sensitive sync thread, which
+serializes them. Read-only tools (action "view") can instead run on a
+bounded dedicated pool, sized by the READ_POOL_SIZE plugin setting, so
+they do not queue behind slow writes.
+
+Read-only tools can also opt into the result cache (see .cache) with
+sync_tool(..., cache=tags).
+
+Every call is measured (time, queries, rows, response size; see .metrics).
+Requests that ask for profiling run each call uncached under a profiler
+(see .profiling).
+"""
+
+import functools
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+
+from ..context import get_current_user
+from ..permissions import require_permission
+from ..settings import get_int_setting
+from . import metrics, profiling
+from .cache import cached
+from .encoding import dumps_sized, utf8_size
+
+logger = logging.getLogger("inventree_mcp_plugin.tools.runner")
+
+_pool = None
+_pool_size = None
+_pool_lock = threading.Lock()
+_pool_stats = {"submitted": 0, "queued": 0, "active": 0, "completed": 0, "max_queued": 0}
+
+
+def _get_read_pool():
+    """Create the read-only pool on first use (sync context; reads plugin settings)."""
+    global _pool, _pool_size
+    with _pool_lock:
+        if _pool_size is None:
+            _pool_size = max(0, get_int_setting("READ_POOL_SIZE", 0))
+            if _pool_size:
+                _pool = ThreadPoolExecutor(max_workers=_pool_size, thread_name_prefix="mcp-read")
+                logger.info("MCP read-only tools use a pool of %d threads", _pool_size)
+        return _pool
+
+
+def read_pool_stats() -> dict:
+    """Return size and queue-depth counters for the read-only tool pool."""
+    with _pool_lock:
+        return {"enabled": bool(_pool), "size": _pool_size or 0, **_pool_stats}
+
+
+def _pooled(run):
+    """Wrap a tool body for the read pool: count queueing and manage DB connections."""
+
+    def _run_in_pool(*args, **kwargs):
+        from django.db import close_old_connections
+
+        with _pool_lock:
+            _pool_stats["queued"] -= 1
+            _pool_stats["active"] += 1
+        # Pool threads keep their own DB connection; drop it when it's stale
+        # or past CONN_MAX_AGE, the same way Django does around a request.
+        close_old_connections()
+        try:
+            return run(*args, **kwargs)
+        finally:
+            close_old_connections()
+            with _pool_lock:
+                _pool_stats["active"] -= 1
+                _pool_stats["completed"] += 1
+
+    return _run_in_pool
+
+
+def _encode(result):
+    metrics.note_result(result)
+    if isinstance(result, str):
+        metrics.note_size(utf8_size(result))
+        return result
+    text, size = dumps_sized(result)
+    metrics.note_size(size)
+    return text
+
+
+def sync_tool(role=None, action=None, cache=None):
+    """Wrap a synchronous tool body as an async MCP tool.
+
+    Apply below @mcp.tool() so the tool keeps the body's signature and
+    docstring. With role=None only an authenticated user is required.
+    Bodies may return a dict/list (encoded with to_json) or a ready string.
+    Tools with action "view" are read-only and may run on the read pool.
+    cache, for read-only tools, is a callable (arguments, result) -> tags
+    naming what the result depends on; see .cache.
+    """
+
+    def decorator(fn):
+        def uncached(*args, **kwargs):
+            return _encode(fn(*args, **kwargs))
+
+        body = cached(fn, cache, _encode) if cache is not None else uncached
+
+        def _run(*args, **kwargs):
+            if role is not None:
+                if perm_err := require_permission(role, action):
+                    metrics.note_denied()
+                    return perm_err
+            elif get_current_user() is None:
+                metrics.note_denied()
+                return json.dumps({"error": "Permission denied: no authenticated user"})
+
+            if profiling.requested():
+                return profiling.profile(fn.__name__, uncached, args, kwargs)
+            return body(*args, **kwargs)
+
+        _run = metrics.measured(fn.__name__, _run)
+        run_serialized = sync_to_async(_run)
+        run_pooled = None
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            nonlocal run_pooled
+            if action != "view":
+                return await run_serialized(*args, **kwargs)
+
+            pool = _pool if _pool_size is not None else await sync_to_async(_get_read_pool)()
+            if pool is None:
+                return await run_serialized(*args, **kwargs)
+            if run_pooled is None:
+                run_pooled = sync_to_async(_pooled(_run), thread_sensitive=False, executor=pool)
+
+            with _pool_lock:
+                _pool_stats["submitted"] += 1
+                _pool_stats["queued"] += 1
+                _pool_stats["max_queued"] = max(_pool_stats["max_queued"], _pool_stats["queued"])
+            return await run_pooled(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
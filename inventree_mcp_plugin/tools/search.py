@@ -0,0 +1,217 @@
+"""Part search backends for search_parts.
+
+The basic backend ORs icontains across name, description, IPN and keywords,
+which works everywhere but scans the whole table. On PostgreSQL, once
+ensure_search_index() has created the indexes below, search_parts instead
+matches a GIN-indexed tsvector expression (every search term is prefix
+matched) and, if pg_trgm is installed, trigram indexes on name and IPN,
+and ranks results by relevance.
+
+The indexes are plain expression indexes, so PostgreSQL keeps them up to
+date on every write; no signal handlers are needed. Create them once with:
+
+    python manage.py shell -c "from inventree_mcp_plugin.tools.search import ensure_search_index; ensure_search_index()"
+
+Compare both backends on this server's parts with:
+
+    python manage.py shell -c "from inventree_mcp_plugin.tools.search import benchmark; print(benchmark())"
+"""
+
+import logging
+import re
+import statistics
+import threading
+import time
+
+from ..settings import get_plugin_setting
+
+logger = logging.getLogger("inventree_mcp_plugin.tools.search")
+
+TSV_INDEX = "mcp_part_search_tsv"
+NAME_TRGM_INDEX = "mcp_part_name_trgm"
+IPN_TRGM_INDEX = "mcp_part_ipn_trgm"
+
+# Seconds between checks for whether the indexes exist
+_INDEX_CHECK_INTERVAL = 300.0
+
+_index_state = {"checked": 0.0, "fulltext": False, "trigram": False}
+_index_lock = threading.Lock()
+
+
+def _columns(qualified: bool):
+    """Quoted Part column names, optionally table-qualified."""
+    from django.db import connection
+    from part.models import Part
+
+    qn = connection.ops.quote_name
+    prefix = f"{qn(Part._meta.db_table)}." if qualified else ""
+    return {name: prefix + qn(name) for name in ("name", "description", "IPN", "keywords")}
+
+
+def _tsvector_sql(qualified: bool = True) -> str:
+    """The indexed tsvector expression. Queries must use exactly this to hit the index."""
+    c = _columns(qualified)
+    return (
+        f"to_tsvector('simple', coalesce({c['name']}, '') || ' ' || coalesce({c['description']}, '') "
+        f"|| ' ' || coalesce({c['IPN']}, '') || ' ' || coalesce({c['keywords']}, ''))"
+    )
+
+
+def ensure_search_index(concurrently: bool = True) -> dict:
+    """Create the PostgreSQL full-text and trigram indexes used by search_parts.
+
+    Safe to re-run. Use concurrently=False inside a transaction. Returns which
+    indexes are available afterwards.
+    """
+    from django.db import DatabaseError, connection
+    from part.models import Part
+
+    if connection.vendor != "postgresql":
+        logger.info("Full-text part search needs PostgreSQL; using basic search on %s", connection.vendor)
+        return {"fulltext": False, "trigram": False}
+
+    qn = connection.ops.quote_name
+    table = qn(Part._meta.db_table)
+    c = _columns(qualified=False)
+    how = "CONCURRENTLY " if concurrently else ""
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE INDEX {how}IF NOT EXISTS {TSV_INDEX} ON {table} USING gin (({_tsvector_sql(False)}))"
+        )
+        try:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            cursor.execute(
+                f"CREATE INDEX {how}IF NOT EXISTS {NAME_TRGM_INDEX} ON {table} USING gin ({c['name']} gin_trgm_ops)"
+            )
+            cursor.execute(
+                f"CREATE INDEX {how}IF NOT EXISTS {IPN_TRGM_INDEX} ON {table} USING gin ({c['IPN']} gin_trgm_ops)"
+            )
+        except DatabaseError as e:
+            logger.warning("Could not create trigram indexes (pg_trgm unavailable?): %s", e)
+
+    with _index_lock:
+        _index_state["checked"] = 0.0
+    return _available_indexes()
+
+
+def _available_indexes() -> dict:
+    """Return which valid search indexes exist, re-checking every few minutes."""
+    from django.db import connection
+
+    if connection.vendor != "postgresql":
+        return {"fulltext": False, "trigram": False}
+
+    now = time.monotonic()
+    with _index_lock:
+        if now - _index_state["checked"] < _INDEX_CHECK_INTERVAL:
+            return {"fulltext": _index_state["fulltext"], "trigram": _index_state["trigram"]}
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+            "WHERE c.relname IN (%s, %s, %s) AND i.indisvalid",
+            [TSV_INDEX, NAME_TRGM_INDEX, IPN_TRGM_INDEX],
+        )
+        found = {row[0] for row in cursor.fetchall()}
+
+    with _index_lock:
+        _index_state["checked"] = now
+        _index_state["fulltext"] = TSV_INDEX in found
+        _index_state["trigram"] = {NAME_TRGM_INDEX, IPN_TRGM_INDEX} <= found
+        return {"fulltext": _index_state["fulltext"], "trigram": _index_state["trigram"]}
+
+
+def search_backend() -> str:
+    """Return "fulltext" if the indexed PostgreSQL search can be used, else "basic"."""
+    if str(get_plugin_setting("SEARCH_BACKEND", "auto")).lower() == "basic":
+        return "basic"
+    return "fulltext" if _available_indexes()["fulltext"] else "basic"
+
+
+def _basic_search(qs, search: str):
+    from django.db.models import Q
+
+    return qs.filter(
+        Q(name__icontains=search)
+        | Q(description__icontains=search)
+        | Q(IPN__icontains=search)
+        | Q(keywords__icontains=search)
+    )
+
+
+def filter_parts(qs, search: str):
+    """Filter a Part queryset by `search` using the best available backend.
+
+    Returns (qs, ordering) where ordering is the keyset ordering to page with:
+    ("-search_rank", "pk") for ranked full-text results, ("pk",) otherwise.
+    """
+    terms = re.findall(r"\w+", search.lower())
+    if not terms or search_backend() != "fulltext":
+        return _basic_search(qs, search), ("pk",)
+    return _fulltext_search(qs, search, terms), ("-search_rank", "pk")
+
+
+def _fulltext_search(qs, search: str, terms: list):
+    from django.db.models import BooleanField, FloatField
+    from django.db.models.expressions import RawSQL
+
+    tsv = _tsvector_sql()
+    tsquery = " & ".join(f"{term}:*" for term in terms)
+    match_sql = f"{tsv} @@ to_tsquery('simple', %s)"
+    rank_sql = f"ts_rank({tsv}, to_tsquery('simple', %s))"
+    match_params = [tsquery]
+    rank_params = [tsquery]
+
+    if _available_indexes()["trigram"]:
+        c = _columns(qualified=True)
+        # "%%" is pg_trgm's similarity operator, escaped for parameter substitution
+        match_sql = f"({match_sql} OR {c['name']} %% %s OR {c['IPN']} %% %s)"
+        rank_sql = f"greatest({rank_sql}, similarity({c['name']}, %s), similarity({c['IPN']}, %s))"
+        match_params += [search, search]
+        rank_params += [search, search]
+
+    # float8 so the rank survives the cursor round-trip exactly
+    return qs.annotate(
+        search_rank=RawSQL(f"({rank_sql})::float8", rank_params, output_field=FloatField())
+    ).filter(RawSQL(match_sql, match_params, output_field=BooleanField()))
+
+
+BENCHMARK_TERMS = ("resistor", "10k 0603", "capacitor 100n", "esp32", "connector")
+
+
+def benchmark(terms=BENCHMARK_TERMS, repeat: int = 20, limit: int = 10) -> dict:
+    """Time the basic and full-text search paths on this server's parts.
+
+    For each term, runs both paths on the same data the way search_parts
+    does (first page of `limit` rows, plus the COUNT) and reports the median
+    milliseconds and the number of matches. The full-text path is timed even
+    if SEARCH_BACKEND is "basic", as long as its index exists.
+    """
+    from django.db import connection
+    from part.models import Part
+
+    indexes = _available_indexes()
+    results = {"database": connection.vendor, "parts": Part.objects.count(), "active": search_backend(), **indexes}
+
+    def timed(make):
+        qs, ordering = make()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            list(qs.order_by(*ordering).values_list("pk", flat=True)[:limit])
+            count = qs.count()
+            timings.append(time.perf_counter() - start)
+        return {"ms": round(statistics.median(timings) * 1000, 2), "matches": count}
+
+    for search in terms:
+        words = re.findall(r"\w+", search.lower())
+        timings = {"basic": timed(lambda: (_basic_search(Part.objects.all(), search), ("pk",)))}
+        if indexes["fulltext"] and words:
+            timings["fulltext"] = timed(
+                lambda: (_fulltext_search(Part.objects.all(), search, words), ("-search_rank", "pk"))
+            )
+        else:
+            timings["fulltext"] = "not available"
+        results[search] = timings
+    return results
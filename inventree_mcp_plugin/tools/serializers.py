@@ -1,9 +1,25 @@
 """Serialization helpers for converting InvenTree ORM objects to dicts.
 
 Output format matches the Go MCP server for client compatibility.
+
+Detail tools serialize model instances. List tools read only the columns
+their compact records need with .values() and serialize those dict rows
+through the *_COLUMNS maps below, which also define the keys a client may
+pick with fields=[...].
 """
 
-import json
+from .encoding import dumps
+
+
+def _related_count(obj, annotation, related_name):
+    """Read a count annotated by tools.queries, falling back to a COUNT query."""
+    value = getattr(obj, annotation, None)
+    if value is not None:
+        return value
+    try:
+        return getattr(obj, related_name).count() if hasattr(obj, related_name) else 0
+    except Exception:
+        return 0
 
 
 def serialize_part(part):
@@ -37,18 +53,40 @@ def serialize_part(part):
     return data
 
 
-def serialize_part_compact(part):
-    """Compact part serialization for list/search results."""
-    return {
-        "pk": part.pk,
-        "name": part.name,
-        "description": part.description or "",
-        "category": part.category_id,
-    }
-
-
-def serialize_stock_item(item):
-    """Serialize a StockItem model instance to a dict (full detail)."""
+def _status_text(item, labels):
+    """The item's status label, computed once per distinct status in a batch."""
+    key = (item.status, getattr(item, "status_custom_key", None))
+    text = labels.get(key)
+    if text is None:
+        try:
+            text = str(item.status_label) if hasattr(item, "status_label") else ""
+        except Exception:
+            text = ""
+        labels[key] = text
+    return text
+
+
+def _part_detail(part, names):
+    """Nested part summary; full_name is rendered once per part in a batch."""
+    full_name = names.get(part.pk)
+    if full_name is None:
+        full_name = names[part.pk] = getattr(part, "full_name", part.name)
+    return {"pk": part.pk, "name": part.name, "full_name": full_name}
+
+
+def serialize_stock_item(item, lookups=None):
+    """Serialize a StockItem model instance to a dict (full detail).
+
+    Load the part with the item (select_related) and, for lists, annotate
+    `mcp_in_stock` (tools.queries.annotate_in_stock) so no row needs a query
+    of its own. `lookups` memoizes status labels and part names across a
+    batch; see serialize_stock_items.
+    """
+    if lookups is None:
+        lookups = {"labels": {}, "names": {}}
+    in_stock = item.__dict__.get("mcp_in_stock")
+    if in_stock is None:
+        in_stock = item.in_stock if hasattr(item, "in_stock") else True
     data = {
         "pk": item.pk,
         "part": item.part_id,
@@ -56,45 +94,31 @@ def serialize_stock_item(item):
         "serial": getattr(item, "serial", None) or "",
         "batch": item.batch or "",
         "location": item.location_id,
-        "in_stock": bool(item.in_stock) if hasattr(item, "in_stock") else True,
+        "in_stock": bool(in_stock),
         "status": item.status,
         "notes": item.notes or "",
     }
 
     # Timestamp
-    if hasattr(item, "updated") and item.updated:
-        data["updated"] = item.updated.isoformat()
-    else:
-        data["updated"] = ""
+    updated = getattr(item, "updated", None)
+    data["updated"] = updated.isoformat() if updated else ""
 
     # Status text
-    try:
-        data["status_text"] = str(item.status_label) if hasattr(item, "status_label") else ""
-    except Exception:
-        data["status_text"] = ""
+    data["status_text"] = _status_text(item, lookups["labels"])
 
     # Part detail (nested)
     try:
-        data["part_detail"] = {
-            "pk": item.part.pk,
-            "name": item.part.name,
-            "full_name": item.part.full_name if hasattr(item.part, "full_name") else item.part.name,
-        }
+        data["part_detail"] = _part_detail(item.part, lookups["names"])
     except Exception:
         data["part_detail"] = None
 
     return data
 
 
-def serialize_stock_item_compact(item):
-    """Compact stock item serialization for list results."""
-    return {
-        "pk": item.pk,
-        "part": item.part_id,
-        "quantity": float(item.quantity),
-        "location": item.location_id,
-        "part_name": item.part.name if hasattr(item, "part") and item.part else "",
-    }
+def serialize_stock_items(items):
+    """Serialize many StockItems, resolving each status label and part name once."""
+    lookups = {"labels": {}, "names": {}}
+    return [serialize_stock_item(item, lookups) for item in items]
 
 
 def serialize_stock_location(location):
@@ -119,41 +143,12 @@ def serialize_stock_location(location):
         data["location_type"] = None
 
     # Count items and sublocations
-    try:
-        data["items"] = location.stock_items.count() if hasattr(location, "stock_items") else 0
-    except Exception:
-        data["items"] = 0
-
-    try:
-        data["sublocations"] = location.children.count() if hasattr(location, "children") else 0
-    except Exception:
-        data["sublocations"] = 0
+    data["items"] = _related_count(location, "mcp_item_count", "stock_items")
+    data["sublocations"] = _related_count(location, "mcp_sublocation_count", "children")
 
     return data
 
 
-def serialize_stock_location_compact(location):
-    """Compact location serialization for list/search results."""
-    data = {
-        "pk": location.pk,
-        "name": location.name,
-        "pathstring": location.pathstring if hasattr(location, "pathstring") else location.name,
-        "parent": location.parent_id,
-    }
-    loc_type = getattr(location, "location_type", None)
-    if loc_type:
-        data["location_type"] = loc_type.name
-    try:
-        data["items"] = location.stock_items.count() if hasattr(location, "stock_items") else 0
-    except Exception:
-        data["items"] = 0
-    try:
-        data["sublocations"] = location.children.count() if hasattr(location, "children") else 0
-    except Exception:
-        data["sublocations"] = 0
-    return data
-
-
 def serialize_part_category(category):
     """Serialize a PartCategory model instance to a dict (full detail)."""
     data = {
@@ -170,38 +165,12 @@ def serialize_part_category(category):
     }
 
     # Counts
-    try:
-        data["part_count"] = category.parts.count() if hasattr(category, "parts") else 0
-    except Exception:
-        data["part_count"] = 0
-
-    try:
-        data["subcategories"] = category.children.count() if hasattr(category, "children") else 0
-    except Exception:
-        data["subcategories"] = 0
+    data["part_count"] = _related_count(category, "mcp_part_count", "parts")
+    data["subcategories"] = _related_count(category, "mcp_subcategory_count", "children")
 
     return data
 
 
-def serialize_part_category_compact(category):
-    """Compact category serialization for list/search results."""
-    data = {
-        "pk": category.pk,
-        "name": category.name,
-        "pathstring": category.pathstring if hasattr(category, "pathstring") else category.name,
-        "parent": category.parent_id,
-    }
-    try:
-        data["part_count"] = category.parts.count() if hasattr(category, "parts") else 0
-    except Exception:
-        data["part_count"] = 0
-    try:
-        data["subcategories"] = category.children.count() if hasattr(category, "children") else 0
-    except Exception:
-        data["subcategories"] = 0
-    return data
-
-
 def serialize_parameter_template(tmpl):
     """Serialize a PartParameterTemplate (part.models) to a dict."""
     return {
@@ -262,6 +231,133 @@ def serialize_location_type(loc_type):
     return data
 
 
+def _text(value):
+    return value or ""
+
+
+def _float(value):
+    return float(value) if value is not None else 0.0
+
+
+def _iso(value):
+    return value.isoformat() if value else ""
+
+
+_OMIT = object()
+
+
+def _if_set(value):
+    return _OMIT if value is None else value
+
+
+# Compact list records: output key -> (column read with .values(), converter).
+# The *_COMPACT tuples are the keys returned by default.
+PART_COLUMNS = {
+    "pk": ("pk", None),
+    "name": ("name", None),
+    "description": ("description", _text),
+    "category": ("category_id", None),
+    "IPN": ("IPN", _text),
+    "keywords": ("keywords", _text),
+    "units": ("units", _text),
+    "minimum_stock": ("minimum_stock", _float),
+    "purchaseable": ("purchaseable", None),
+    "component": ("component", None),
+    "assembly": ("assembly", None),
+    "trackable": ("trackable", None),
+    "virtual": ("virtual", None),
+    "active": ("active", None),
+}
+PART_COMPACT = ("pk", "name", "description", "category")
+
+STOCK_ITEM_COLUMNS = {
+    "pk": ("pk", None),
+    "part": ("part_id", None),
+    "quantity": ("quantity", _float),
+    "location": ("location_id", None),
+    "part_name": ("part__name", _text),
+    "serial": ("serial", _text),
+    "batch": ("batch", _text),
+    "status": ("status", None),
+    "updated": ("updated", _iso),
+    "notes": ("notes", _text),
+}
+STOCK_ITEM_COMPACT = ("pk", "part", "quantity", "location", "part_name")
+
+# Counts come from the annotations added by tools.queries
+STOCK_LOCATION_COLUMNS = {
+    "pk": ("pk", None),
+    "name": ("name", None),
+    "pathstring": ("pathstring", None),
+    "parent": ("parent_id", None),
+    "location_type": ("location_type__name", _if_set),
+    "items": ("mcp_item_count", None),
+    "sublocations": ("mcp_sublocation_count", None),
+    "description": ("description", _text),
+    "level": ("level", None),
+    "structural": ("structural", None),
+    "external": ("external", None),
+}
+STOCK_LOCATION_COMPACT = ("pk", "name", "pathstring", "parent", "location_type", "items", "sublocations")
+
+PART_CATEGORY_COLUMNS = {
+    "pk": ("pk", None),
+    "name": ("name", None),
+    "pathstring": ("pathstring", None),
+    "parent": ("parent_id", None),
+    "part_count": ("mcp_part_count", None),
+    "subcategories": ("mcp_subcategory_count", None),
+    "description": ("description", _text),
+    "level": ("level", None),
+    "structural": ("structural", None),
+    "default_location": ("default_location_id", None),
+}
+PART_CATEGORY_COMPACT = ("pk", "name", "pathstring", "parent", "part_count", "subcategories")
+
+
+def select_fields(columns, default, fields):
+    """Return the keys to serialize: `default`, or "pk" plus the requested `fields`.
+
+    Raises ValueError naming the available fields if one is unknown.
+    """
+    if not fields:
+        return default
+    unknown = [f for f in fields if f not in columns]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(columns)}")
+    return ("pk", *dict.fromkeys(f for f in fields if f != "pk"))
+
+
+def project(qs, columns, keys, extra=()):
+    """Restrict qs to the columns `keys` are read from (plus `extra`, e.g. ordering fields) as dict rows."""
+    return qs.values(*dict.fromkeys([*(columns[k][0] for k in keys), *extra]))
+
+
+def serialize_row(row, columns, keys):
+    """Serialize a .values() row from `project` to a compact record."""
+    data = {}
+    for key in keys:
+        column, convert = columns[key]
+        value = row[column]
+        if convert is not None:
+            value = convert(value)
+            if value is _OMIT:
+                continue
+        data[key] = value
+    return data
+
+
+def bulk_summary(total, results, **counts):
+    """Summarize per-entry bulk results: counts, non-error results, then error_details."""
+    results.sort(key=lambda r: r["index"])
+    error_details = [r for r in results if "error" in r]
+    summary = {"total": total, **counts, "errors": len(error_details)}
+    summary["results"] = [r for r in results if "error" not in r]
+    if error_details:
+        summary["error_details"] = error_details
+    return summary
+
+
 def to_json(data):
-    """Serialize data to compact JSON string."""
-    return json.dumps(data, separators=(",", ":"), default=str)
+    """Serialize data to compact JSON string (with the fastest installed encoder, see .encoding)."""
+    return dumps(data)
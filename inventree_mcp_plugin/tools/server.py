@@ -0,0 +1,45 @@
+"""Server tools — runtime statistics for the MCP plugin itself."""
+
+import logging
+
+from ..mcp_server import mcp
+from .runner import sync_tool
+
+logger = logging.getLogger("inventree_mcp_plugin.tools.server")
+
+
+@mcp.tool()
+@sync_tool()
+def get_server_stats() -> str:
+    """Report MCP server internals (permission cache hit rates, read pool queue depth, fuzzy indexes, result cache). Staff users only."""
+    from ..context import get_current_user
+    from ..permissions import permission_cache_stats
+    from .cache import result_cache_stats
+    from .fuzzy import fuzzy_index_stats
+    from .runner import read_pool_stats
+
+    user = get_current_user()
+    if not (user.is_staff or user.is_superuser):
+        return {"error": "Permission denied: staff access required"}
+    return {
+        "permission_cache": permission_cache_stats(),
+        "read_pool": read_pool_stats(),
+        "fuzzy_index": fuzzy_index_stats(),
+        "result_cache": result_cache_stats(),
+    }
+
+
+@mcp.tool()
+@sync_tool()
+def get_profile(profile_id: str) -> str:
+    """Fetch a tool call profile: timings, SQL queries (with repeated statements) and a profiler report. Profile ids come from the X-MCP-Profile-Id response header of a request sent with X-MCP-Profile: 1. Staff users only."""
+    from ..context import get_current_user
+    from .profiling import get_profile_artifact
+
+    user = get_current_user()
+    if not (user.is_staff or user.is_superuser):
+        return {"error": "Permission denied: staff access required"}
+    artifact = get_profile_artifact(profile_id)
+    if artifact is None:
+        return {"error": f"Profile '{profile_id}' not found (profiles expire after an hour)"}
+    return artifact
@@ -1,74 +1,475 @@
-"""Stock tools — get, get_item, add, add_qty, remove_qty, transfer, delete."""
+"""Stock tools — get, get_item, summary, low_stock, add, add_qty, remove_qty, transfer, delete."""
 
 import json
 import logging
 from typing import Optional
 
-from asgiref.sync import sync_to_async
-
 from ..mcp_server import mcp
-from .serializers import serialize_stock_item, serialize_stock_item_compact, to_json
+from ..signals import notify_changed, remember_previous
+from .queries import annotate_in_stock, in_stock_filter, paginate, subtree_filter
+from .runner import sync_tool
+from .serializers import (
+    STOCK_ITEM_COLUMNS,
+    STOCK_ITEM_COMPACT,
+    bulk_summary,
+    project,
+    select_fields,
+    serialize_row,
+    serialize_stock_item,
+    serialize_stock_items,
+)
 
 logger = logging.getLogger("inventree_mcp_plugin.tools.stock")
 
 
+# ---------------------------------------------------------------------------
+# Bulk helpers
+# ---------------------------------------------------------------------------
+
+
+def _history_codes():
+    """Return InvenTree's StockHistoryCode (its module moved between releases)."""
+    try:
+        from stock.status_codes import StockHistoryCode
+    except ImportError:
+        from InvenTree.status_codes import StockHistoryCode
+    return StockHistoryCode
+
+
+def _tracking_entry(item, code, user, notes, deltas):
+    """Build an unsaved StockItemTracking row, as StockItem.add_tracking_entry would."""
+    from django.utils import timezone
+    from stock.models import StockItemTracking
+
+    return StockItemTracking(
+        item=item,
+        tracking_type=getattr(code, "value", code),
+        user=user,
+        date=timezone.now(),
+        notes=notes,
+        deltas=deltas,
+    )
+
+
+def _lock_items(pks, in_stock=False):
+    """Fetch stock items by pk in one query, locking the rows until the transaction ends.
+
+    Their part and location are recorded for change listeners (see ..signals).
+    With in_stock=True each item also gets `mcp_in_stock` (see
+    .queries.annotate_in_stock) instead of querying per item for in_stock.
+    """
+    from django.db import connection
+    from stock.models import StockItem
+
+    qs = StockItem.objects.filter(pk__in=pks).prefetch_related(None)
+    if in_stock:
+        qs = annotate_in_stock(qs)
+    if connection.features.has_select_for_update_of:
+        qs = qs.select_for_update(of=("self",))
+    else:
+        qs = qs.select_for_update()
+    items = {item.pk: item for item in qs}
+    remember_previous(items.values(), ("part_id", "location_id"))
+    return items
+
+
+def _bulk_save_items(items, fields):
+    """bulk_update stock items, bumping their auto_now 'updated' timestamp too.
+
+    Change listeners are notified once the surrounding transaction commits.
+    """
+    from django.core.exceptions import FieldDoesNotExist
+    from django.db import transaction
+    from stock.models import StockItem
+
+    if not items:
+        return
+    fields = list(fields)
+    try:
+        updated = StockItem._meta.get_field("updated")
+    except FieldDoesNotExist:
+        updated = None
+    if updated is not None and getattr(updated, "auto_now", False):
+        for item in items:
+            updated.pre_save(item, add=False)
+        fields.append("updated")
+    StockItem.objects.bulk_update(items, fields)
+    transaction.on_commit(lambda: notify_changed(items))
+
+
+def _with_detail(qs):
+    """Load what serialize_stock_item reads in the item query itself.
+
+    Drops the default manager's prefetches, which the detail record does not use.
+    """
+    return annotate_in_stock(qs.prefetch_related(None).select_related("part"))
+
+
+def _int_pk(value):
+    """Return `value` (e.g. 2 or "2") as a positive integer pk, or None if it is not one.
+
+    Locked items are looked up by integer pk, so string pks must be converted.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value)
+    return value if isinstance(value, int) and value > 0 else None
+
+
+def _parse_adjustments(items, results, quantity_required=True):
+    """Validate [{pk, quantity}] entries; append errors to results, return (index, pk, qty).
+
+    With quantity_required=False a missing quantity is returned as None.
+    """
+    from decimal import Decimal, InvalidOperation
+
+    parsed = []
+    for i, adj in enumerate(items):
+        if not isinstance(adj, dict):
+            results.append({"index": i, "error": "Entry must be an object with 'pk' and 'quantity'"})
+            continue
+        raw_pk = adj.get("pk") or adj.get("id")
+        if not raw_pk:
+            results.append({"index": i, "error": "Missing stock item 'pk'"})
+            continue
+        pk = _int_pk(raw_pk)
+        if pk is None:
+            results.append({"index": i, "pk": raw_pk, "error": f"Invalid stock item pk {raw_pk!r}"})
+            continue
+        if not quantity_required and adj.get("quantity") is None:
+            parsed.append((i, pk, None))
+            continue
+        try:
+            qty = Decimal(str(adj.get("quantity", 0)))
+        except (InvalidOperation, ValueError):
+            results.append({"index": i, "pk": pk, "error": f"Invalid quantity {adj.get('quantity')!r}"})
+            continue
+        if not qty.is_finite() or qty <= 0:
+            results.append({"index": i, "pk": pk, "error": "Quantity must be greater than zero"})
+            continue
+        parsed.append((i, pk, qty))
+    return parsed
+
+
+def _adjust_quantities(items, notes, remove):
+    """Add or remove quantity on many stock items in one locked, atomic batch."""
+    from django.db import transaction
+    from stock.models import StockItem, StockItemTracking
+
+    from ..context import get_current_user
+
+    user = get_current_user()
+    codes = _history_codes()
+    code = codes.STOCK_REMOVE if remove else codes.STOCK_ADD
+    action = "removed" if remove else "added"
+
+    results = []
+    adjustments = _parse_adjustments(items, results)
+
+    try:
+        with transaction.atomic():
+            locked = _lock_items({pk for _, pk, _ in adjustments})
+            changed = {}
+            tracking = []
+            for i, pk, qty in adjustments:
+                item = locked.get(pk)
+                if item is None:
+                    results.append({"index": i, "pk": pk, "error": f"Stock item {pk} not found"})
+                    continue
+                if item.serialized:
+                    results.append(
+                        {"index": i, "pk": pk, "error": f"Stock item {pk} is serialized; quantity cannot be adjusted"}
+                    )
+                    continue
+                new_qty = item.quantity - qty if remove else item.quantity + qty
+                if new_qty < 0:
+                    results.append(
+                        {"index": i, "pk": pk, "error": f"Cannot remove {qty} from stock item {pk}: only {item.quantity} in stock"}
+                    )
+                    continue
+                item.quantity = new_qty
+                changed[pk] = item
+                tracking.append(
+                    _tracking_entry(item, code, user, notes, {action: float(qty), "quantity": float(new_qty)})
+                )
+                results.append({"index": i, "pk": pk, "quantity": float(new_qty), "action": action})
+
+            # Mirror StockItem.updateQuantity: depleted delete_on_deplete items are removed
+            depleted = {
+                pk for pk, item in changed.items()
+                if item.quantity <= 0
+                and getattr(item, "delete_on_deplete", False)
+                and (not hasattr(item, "can_delete") or item.can_delete())
+            }
+            _bulk_save_items([item for pk, item in changed.items() if pk not in depleted], ["quantity"])
+            StockItemTracking.objects.bulk_create([t for t in tracking if t.item.pk not in depleted])
+            for pk in depleted:
+                changed[pk].delete()
+    except Exception as e:
+        return {"error": f"Failed to {'remove' if remove else 'add'} stock, no items were changed: {e}"}
+
+    for r in results:
+        if r.get("pk") in depleted and "error" not in r:
+            r["deleted"] = True
+    return bulk_summary(len(items), results, updated=len(changed))
+
+
 @mcp.tool()
-async def get_stock(
+@sync_tool("stock", "view")
+def get_stock(
     part: int = 0,
     location: int = 0,
     limit: int = 10,
     offset: int = 0,
+    cursor: str = "",
+    include_count: bool = True,
+    fields: Optional[list[str]] = None,
+    detail: bool = False,
 ) -> str:
     """List stock items, optionally filtered by part ID and/or location ID.
 
     Set part=0 and location=0 to list all stock. Returns compact results;
-    use get_stock_item(id) for full detail.
+    use get_stock_item(id) for full detail, or set detail=true to get full
+    records for the whole page (fine for pages of up to 1000 items).
     Default limit is 10 — check the count field for total matches and
     increase limit or paginate with offset if needed.
+    For deep paging pass the returned next_cursor as cursor (offset is then ignored).
+    Set include_count=false to skip counting the total matches.
+    Set fields to choose the returned keys (pk is always included), e.g.
+    ["quantity", "batch"]. Available: part, quantity, location, part_name,
+    serial, batch, status, updated, notes.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock', 'view'):
-        return perm_err
+    from stock.models import StockItem
+
+    if detail and fields:
+        return {"error": "Set either fields or detail=true, not both"}
+    try:
+        keys = select_fields(STOCK_ITEM_COLUMNS, STOCK_ITEM_COMPACT, fields)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    qs = StockItem.objects.all()
+    if part:
+        qs = qs.filter(part_id=part)
+    if location:
+        qs = qs.filter(location_id=location)
+    lim = limit if limit > 0 else 10
+    try:
+        items, page = paginate(
+            qs, ("pk",), lim, offset, cursor, include_count,
+            annotate=_with_detail if detail else lambda q: project(q, STOCK_ITEM_COLUMNS, keys, ("pk",)),
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    if detail:
+        page["results"] = serialize_stock_items(items)
+    else:
+        page["results"] = [serialize_row(i, STOCK_ITEM_COLUMNS, keys) for i in items]
+    return page
 
-    @sync_to_async
-    def _query():
-        from stock.models import StockItem
 
-        qs = StockItem.objects.all()
-        if part:
-            qs = qs.filter(part_id=part)
-        if location:
-            qs = qs.filter(location_id=location)
-        lim = limit if limit > 0 else 10
-        total = qs.count()
-        items = list(qs.select_related("part")[offset : offset + lim])
-        return {"count": total, "results": [serialize_stock_item_compact(i) for i in items]}
+@mcp.tool()
+@sync_tool(
+    "stock",
+    "view",
+    cache=lambda args, result: {f"stock.StockItem:{args['id']}", f"part.Part:{result['part']}"},
+)
+def get_stock_item(id: int) -> str:
+    """Get detailed information about a specific stock item by its ID (pk)."""
+    from stock.models import StockItem
 
-    return to_json(await _query())
+    try:
+        item = _with_detail(StockItem.objects.filter(pk=id)).get()
+        return serialize_stock_item(item)
+    except StockItem.DoesNotExist:
+        return {"error": f"Stock item {id} not found"}
 
 
 @mcp.tool()
-async def get_stock_item(id: int) -> str:
-    """Get detailed information about a specific stock item by its ID (pk)."""
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock', 'view'):
-        return perm_err
+@sync_tool("stock", "view", cache=lambda args, result: {"stock.StockItem", "stock.StockLocation", "part.Part"})
+def stock_summary(
+    location: int = 0,
+    part: int = 0,
+    group_by: str = "part",
+    limit: int = 20,
+    in_stock_only: bool = True,
+) -> str:
+    """Total stock quantities across a location and all its sublocations, in one call.
+
+    Answers questions like "how much of part P is in Building 2?" without
+    paging through stock items.
+    - location: location ID to total under, sublocations included (0 = all stock)
+    - part: only count this part ID (0 = all parts)
+    - group_by: 'part' for totals per part, or 'location' for totals per child
+      location of `location` (per top-level location when location=0).
+      Stock held directly in `location` is reported as a group with direct=true.
+    - limit: number of groups returned, largest quantity first; `groups` is
+      the total number of groups (parts, or child locations plus the direct
+      group) holding stock
+    - in_stock_only: count only available stock (default), as InvenTree does
+    """
+    from django.db.models import Count, OuterRef, Subquery, Sum, Value
+    from django.db.models.functions import Coalesce
+    from stock.models import StockItem, StockLocation
+
+    if group_by not in ("part", "location"):
+        return {"error": f"Invalid group_by '{group_by}'. Use 'part' or 'location'."}
+
+    qs = StockItem.objects.all()
+    if in_stock_only:
+        qs = qs.filter(in_stock_filter())
+    if part:
+        qs = qs.filter(part_id=part)
+    root = None
+    if location:
+        try:
+            root = StockLocation.objects.get(pk=location)
+        except StockLocation.DoesNotExist:
+            return {"error": f"Stock location {location} not found"}
+        qs = qs.filter(**subtree_filter(root, "location__"))
+
+    if group_by == "part":
+        key = "part"
+        groups = qs.values("part", "part__name", "part__IPN").annotate(locations=Count("location", distinct=True))
+    else:
+        # The ancestor one level below the root (or the top-level location) containing each item
+        key = "group"
+        child = StockLocation.objects.filter(
+            level=root.level + 1 if root else 0,
+            tree_id=OuterRef("location__tree_id"),
+            lft__lte=OuterRef("location__lft"),
+            rght__gte=OuterRef("location__rght"),
+        ).values("pk")[:1]
+        qs = qs.annotate(group=Subquery(child))
+        groups = qs.values("group").annotate(parts=Count("part", distinct=True))
+
+    lim = limit if limit > 0 else 20
+    rows = list(
+        groups.annotate(quantity=Sum("quantity"), items=Count("pk")).order_by("-quantity", key)[:lim]
+    )
+    # Stock held directly in the root (or without a location) is a group too: count NULL as one
+    totals = qs.aggregate(
+        quantity=Sum("quantity"), items=Count("pk"), groups=Count(Coalesce(key, Value(0)), distinct=True)
+    )
+
+    results = []
+    if group_by == "part":
+        for row in rows:
+            results.append(
+                {
+                    "part": row["part"],
+                    "name": row["part__name"],
+                    "IPN": row["part__IPN"] or "",
+                    "quantity": float(row["quantity"]),
+                    "items": row["items"],
+                    "locations": row["locations"],
+                }
+            )
+    else:
+        names = dict(
+            StockLocation.objects.filter(pk__in=[r["group"] for r in rows if r["group"]]).values_list("pk", "name")
+        )
+        for row in rows:
+            if row["group"] is not None:
+                entry = {"location": row["group"], "name": names.get(row["group"], "")}
+            elif root is not None:
+                entry = {"location": root.pk, "name": root.name, "direct": True}
+            else:
+                entry = {"location": None, "name": "(no location)"}
+            entry.update(quantity=float(row["quantity"]), items=row["items"], parts=row["parts"])
+            results.append(entry)
+
+    return {
+        "location": {"pk": root.pk, "name": root.name} if root else None,
+        "group_by": group_by,
+        "total_quantity": float(totals["quantity"] or 0),
+        "total_items": totals["items"],
+        "groups": totals["groups"],
+        "results": results,
+    }
 
-    @sync_to_async
-    def _query():
-        from stock.models import StockItem
 
-        try:
-            item = StockItem.objects.select_related("part").get(pk=id)
-            return serialize_stock_item(item)
-        except StockItem.DoesNotExist:
-            return {"error": f"Stock item {id} not found"}
+@mcp.tool()
+@sync_tool(
+    "stock",
+    "view",
+    cache=lambda args, result: {"part.Part", "stock.StockItem", "part.PartCategory", "stock.StockLocation"},
+)
+def low_stock_report(
+    category: int = 0,
+    location: int = 0,
+    limit: int = 50,
+    cursor: str = "",
+    include_count: bool = False,
+) -> str:
+    """List active parts whose stock is below their minimum_stock, largest shortfall first.
+
+    Replaces checking parts one by one with get_stock.
+    - category: only parts in this category or its subcategories (0 = all)
+    - location: only count stock in this location or its sublocations (0 = all)
+    - limit / cursor: page size; pass the returned next_cursor to continue
+    - include_count: also return the total number of low parts
+    Stock counts available stock only, including stock of variant parts, as
+    InvenTree does for minimum stock.
+    """
+    from django.db.models import F, FloatField, OuterRef, Subquery, Sum, Value
+    from django.db.models.functions import Cast, Coalesce
+    from part.models import Part, PartCategory
+    from stock.models import StockItem, StockLocation
 
-    return to_json(await _query())
+    parts = Part.objects.filter(active=True, minimum_stock__gt=0)
+    if category:
+        try:
+            parts = parts.filter(**subtree_filter(PartCategory.objects.get(pk=category), "category__"))
+        except PartCategory.DoesNotExist:
+            return {"error": f"Part category {category} not found"}
+
+    # Available stock of each part and its variants (the part's MPTT subtree)
+    stock = StockItem.objects.filter(
+        in_stock_filter(),
+        part__tree_id=OuterRef("tree_id"),
+        part__lft__gte=OuterRef("lft"),
+        part__rght__lte=OuterRef("rght"),
+    )
+    if location:
+        try:
+            stock = stock.filter(**subtree_filter(StockLocation.objects.get(pk=location), "location__"))
+        except StockLocation.DoesNotExist:
+            return {"error": f"Stock location {location} not found"}
+    total = stock.order_by().values("part__tree_id").annotate(total=Sum("quantity")).values("total")
+
+    # Float annotations, so the shortfall survives the cursor round-trip exactly
+    parts = (
+        parts.only("pk", "name", "IPN", "category", "units", "minimum_stock")
+        .annotate(in_stock=Coalesce(Cast(Subquery(total), FloatField()), Value(0.0)))
+        .annotate(shortfall=Cast("minimum_stock", FloatField()) - F("in_stock"))
+        .filter(shortfall__gt=0)
+    )
+    lim = limit if limit > 0 else 50
+    try:
+        rows, page = paginate(parts, ("-shortfall", "pk"), lim, 0, cursor, include_count)
+    except ValueError as e:
+        return {"error": str(e)}
+    page["results"] = [
+        {
+            "pk": p.pk,
+            "name": p.name,
+            "IPN": p.IPN or "",
+            "category": p.category_id,
+            "units": p.units or "",
+            "minimum_stock": float(p.minimum_stock),
+            "in_stock": p.in_stock,
+            "shortfall": p.shortfall,
+        }
+        for p in rows
+    ]
+    return page
 
 
 @mcp.tool()
-async def add_stock(
+@sync_tool("stock", "add")
+def add_stock(
     part: int,
     quantity: float,
     location: int = 0,
@@ -80,168 +481,160 @@ async def add_stock(
 
     For trackable parts, provide a serial number. Set location=0 to leave unassigned.
     """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock', 'add'):
-        return perm_err
-
-    @sync_to_async
-    def _create():
-        from stock.models import StockItem
-
-        from ..context import get_current_user
-
-        fields = {"part_id": part, "quantity": quantity}
-        if location:
-            fields["location_id"] = location
-        if batch:
-            fields["batch"] = batch
-        if serial:
-            fields["serial"] = serial
-        if notes:
-            fields["notes"] = notes
-
-        user = get_current_user()
-        item = StockItem(**fields)
-        item.save(user=user)
-        return serialize_stock_item(item)
+    from stock.models import StockItem
+
+    from ..context import get_current_user
 
-    return to_json(await _create())
+    fields = {"part_id": part, "quantity": quantity}
+    if location:
+        fields["location_id"] = location
+    if batch:
+        fields["batch"] = batch
+    if serial:
+        fields["serial"] = serial
+    if notes:
+        fields["notes"] = notes
+
+    user = get_current_user()
+    item = StockItem(**fields)
+    item.save(user=user)
+    return serialize_stock_item(item)
 
 
 @mcp.tool()
-async def stock_add_quantity(items: list, notes: str = "") -> str:
+@sync_tool("stock", "change")
+def stock_add_quantity(items: list, notes: str = "") -> str:
     """Add quantity to existing stock items. Increases stock levels without creating new entries.
 
     items: list of objects, each with 'pk' (stock item ID) and 'quantity' (amount to add).
     Example: [{"pk": 1, "quantity": 10}, {"pk": 2, "quantity": 5}]
-    """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock', 'change'):
-        return perm_err
-
-    @sync_to_async
-    def _add():
-        from stock.models import StockItem
-
-        from ..context import get_current_user
-
-        user = get_current_user()
-        for adj in items:
-            pk = adj.get("pk") or adj.get("id")
-            qty = adj.get("quantity", 0)
-            if not pk or not qty:
-                continue
-            try:
-                stock_item = StockItem.objects.get(pk=pk)
-                stock_item.add_stock(qty, user, notes=notes)
-            except StockItem.DoesNotExist:
-                return {"error": f"Stock item {pk} not found"}
-            except Exception as e:
-                return {"error": f"Failed to add stock to item {pk}: {e}"}
-        return None
 
-    err = await _add()
-    if err:
-        return to_json(err)
-    return "Stock quantity updated successfully."
+    All valid entries are applied in one transaction; invalid entries are skipped
+    and reported in error_details. Returns the new quantity of each adjusted item.
+    """
+    return _adjust_quantities(items, notes, remove=False)
 
 
 @mcp.tool()
-async def stock_remove_quantity(items: list, notes: str = "") -> str:
+@sync_tool("stock", "change")
+def stock_remove_quantity(items: list, notes: str = "") -> str:
     """Remove quantity from existing stock items. Decreases stock levels.
 
     items: list of objects, each with 'pk' (stock item ID) and 'quantity' (amount to remove).
     Example: [{"pk": 1, "quantity": 5}]
-    """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock', 'change'):
-        return perm_err
-
-    @sync_to_async
-    def _remove():
-        from stock.models import StockItem
-
-        from ..context import get_current_user
-
-        user = get_current_user()
-        for adj in items:
-            pk = adj.get("pk") or adj.get("id")
-            qty = adj.get("quantity", 0)
-            if not pk or not qty:
-                continue
-            try:
-                stock_item = StockItem.objects.get(pk=pk)
-                stock_item.take_stock(qty, user, notes=notes)
-            except StockItem.DoesNotExist:
-                return {"error": f"Stock item {pk} not found"}
-            except Exception as e:
-                return {"error": f"Failed to remove stock from item {pk}: {e}"}
-        return None
 
-    err = await _remove()
-    if err:
-        return to_json(err)
-    return "Stock quantity removed successfully."
+    All valid entries are applied in one transaction; invalid entries (e.g. removing
+    more than is in stock) are skipped and reported in error_details.
+    """
+    return _adjust_quantities(items, notes, remove=True)
 
 
 @mcp.tool()
-async def stock_transfer(items: list, location: int, notes: str = "") -> str:
+@sync_tool("stock", "change")
+def stock_transfer(items: list, location: int, notes: str = "") -> str:
     """Transfer stock items to a different location.
 
-    items: list of objects, each with 'pk' (stock item ID) and 'quantity' (amount to transfer).
+    items: list of objects, each with 'pk' (stock item ID) and optional 'quantity' (amount to transfer).
+    Omit quantity (or pass the item's full quantity) to move the whole item; a smaller
+    quantity splits that amount off into a new stock item at the destination.
     location: destination stock location ID.
-    Example: stock_transfer(items=[{"pk": 1, "quantity": 5}], location=3)
-    """
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock', 'change'):
-        return perm_err
-
-    @sync_to_async
-    def _transfer():
-        from stock.models import StockItem, StockLocation
-
-        from ..context import get_current_user
+    Example: stock_transfer(items=[{"pk": 1, "quantity": 5}, {"pk": 2}], location=3)
 
-        user = get_current_user()
-        try:
-            dest = StockLocation.objects.get(pk=location)
-        except StockLocation.DoesNotExist:
-            return {"error": f"Location {location} not found"}
-        for adj in items:
-            pk = adj.get("pk") or adj.get("id")
-            if not pk:
-                continue
-            try:
-                stock_item = StockItem.objects.get(pk=pk)
-                stock_item.move(dest, notes, user)
-            except StockItem.DoesNotExist:
-                return {"error": f"Stock item {pk} not found"}
-            except Exception as e:
-                return {"error": f"Failed to transfer stock item {pk}: {e}"}
-        return None
+    Runs as one transaction. Invalid entries are skipped and reported in error_details;
+    results list each item as 'moved' or 'split' (with the new item's pk).
 
-    err = await _transfer()
-    if err:
-        return to_json(err)
-    return "Stock transferred successfully."
+    Whole-item moves are written in bulk rather than with StockItem.move(), so
+    StockItem.save(), its post_save handlers and plugin events are not run for
+    moved items; their STOCK_MOVE tracking entries are still written. Splits go
+    through splitStock() as usual.
+    """
+    import time
+
+    from django.db import transaction
+    from stock.models import StockItemTracking, StockLocation
+
+    from ..context import get_current_user
+
+    started = time.perf_counter()
+    user = get_current_user()
+    try:
+        dest = StockLocation.objects.get(pk=location)
+    except StockLocation.DoesNotExist:
+        return {"error": f"Location {location} not found"}
+    if getattr(dest, "structural", False):
+        return {"error": f"Location {location} is structural and cannot hold stock items"}
+
+    move_code = _history_codes().STOCK_MOVE
+    results = []
+    transfers = _parse_adjustments(items, results, quantity_required=False)
+
+    try:
+        with transaction.atomic():
+            locked = _lock_items({pk for _, pk, _ in transfers}, in_stock=True)
+            seen = set()
+            moved = []
+            tracking = []
+            split = 0
+            for i, pk, qty in transfers:
+                item = locked.get(pk)
+                if item is None:
+                    results.append({"index": i, "pk": pk, "error": f"Stock item {pk} not found"})
+                    continue
+                if pk in seen:
+                    results.append({"index": i, "pk": pk, "error": f"Stock item {pk} is listed more than once"})
+                    continue
+                seen.add(pk)
+                if not item.mcp_in_stock:
+                    results.append({"index": i, "pk": pk, "error": f"Stock item {pk} is not in stock"})
+                    continue
+                if qty is not None and qty > item.quantity:
+                    results.append(
+                        {"index": i, "pk": pk, "error": f"Cannot transfer {qty} of stock item {pk}: only {item.quantity} in stock"}
+                    )
+                    continue
+
+                if qty is None or qty == item.quantity:
+                    item.location = dest
+                    moved.append(item)
+                    tracking.append(_tracking_entry(item, move_code, user, notes, {"location": dest.pk}))
+                    results.append({"index": i, "pk": pk, "action": "moved", "quantity": float(item.quantity)})
+                elif item.serialized:
+                    results.append(
+                        {"index": i, "pk": pk, "error": f"Stock item {pk} is serialized and cannot be split"}
+                    )
+                else:
+                    new_item = item.splitStock(qty, dest, user, notes=notes)
+                    split += 1
+                    results.append(
+                        {
+                            "index": i,
+                            "pk": pk,
+                            "action": "split",
+                            "quantity": float(qty),
+                            "new_pk": getattr(new_item, "pk", None),
+                        }
+                    )
+
+            _bulk_save_items(moved, ["location"])
+            StockItemTracking.objects.bulk_create(tracking)
+    except Exception as e:
+        return {"error": f"Failed to transfer stock, no items were moved: {e}"}
+
+    summary = bulk_summary(len(items), results, moved=len(moved), split=split)
+    summary["location"] = dest.pk
+    summary["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return summary
 
 
 @mcp.tool()
-async def delete_stock_item(id: int) -> str:
+@sync_tool("stock", "delete")
+def delete_stock_item(id: int) -> str:
     """Delete a stock item permanently."""
-    from ..permissions import check_permission
-    if perm_err := await check_permission('stock', 'delete'):
-        return perm_err
-
-    @sync_to_async
-    def _delete():
-        from stock.models import StockItem
-
-        try:
-            item = StockItem.objects.get(pk=id)
-        except StockItem.DoesNotExist:
-            return f"Stock item {id} not found."
-        item.delete()
-        return f"Stock item {id} deleted successfully."
-
-    return await _delete()
+    from stock.models import StockItem
+
+    try:
+        item = StockItem.objects.get(pk=id)
+    except StockItem.DoesNotExist:
+        return f"Stock item {id} not found."
+    item.delete()
+    return f"Stock item {id} deleted successfully."
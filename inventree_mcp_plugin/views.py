@@ -7,17 +7,28 @@ own token auth and only require IsAuthenticated (no model permissions needed).
 DRF's SessionAuthentication enforces CSRF checks internally (bypassing
 Django's csrf_exempt decorator), so we use a CSRF-exempt wrapper for
 session auth to allow external MCP clients to connect without CSRF tokens.
+
+ExportView streams large result sets (see export.py) with the same auth.
+MetricsView serves per-tool metrics (see tools/metrics.py) to staff users.
+Staff users can have a request's tool calls profiled with the X-MCP-Profile
+header (see tools/profiling.py).
 """
 
 import logging
 
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from mcp_server.views import MCPServerStreamableHttpView
 from rest_framework.authentication import SessionAuthentication
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
 
-from .context import set_current_user
+from .context import begin_request, end_request, get_request_context, set_current_user
+from .export import ExportError, export_role, export_rows, ndjson_stream, sse_stream
 from .mcp_server import mcp
+from .permissions import require_permission
+from .settings import get_bool_setting
+from .tools.metrics import render_prometheus
 
 # Trigger tool registration by importing the tools package
 from . import tools  # noqa: F401
@@ -37,6 +48,25 @@ class CsrfExemptSessionAuthentication(SessionAuthentication):
         return
 
 
+def _authentication_classes():
+    """InvenTree's token auth (when available), CSRF-exempt session auth and basic auth."""
+    from rest_framework.authentication import BasicAuthentication
+
+    try:
+        from users.authentication import ApiTokenAuthentication
+
+        return [
+            ApiTokenAuthentication,
+            CsrfExemptSessionAuthentication,
+            BasicAuthentication,
+        ]
+    except ImportError:
+        return [
+            CsrfExemptSessionAuthentication,
+            BasicAuthentication,
+        ]
+
+
 class MCPView(MCPServerStreamableHttpView):
     """MCP endpoint using InvenTree's auth and relaxed permissions."""
 
@@ -49,31 +79,96 @@ class MCPView(MCPServerStreamableHttpView):
     @classmethod
     def as_view(cls, **initkwargs):
         # Lazily set authentication classes from InvenTree's own auth
-        from rest_framework.authentication import BasicAuthentication
-
-        try:
-            from users.authentication import ApiTokenAuthentication
-
-            cls.authentication_classes = [
-                ApiTokenAuthentication,
-                CsrfExemptSessionAuthentication,
-                BasicAuthentication,
-            ]
-        except ImportError:
-            cls.authentication_classes = [
-                CsrfExemptSessionAuthentication,
-                BasicAuthentication,
-            ]
-
+        cls.authentication_classes = _authentication_classes()
         view = super().as_view(**initkwargs)
         view.csrf_exempt = True
         return csrf_exempt(view)
 
     def dispatch(self, request, *args, **kwargs):
-        # Store user in thread-local for tool functions that need it
+        # Open a request context (a contextvar) that tool functions read the
+        # user from; it follows the call into async code and worker threads.
+        user = None
         if hasattr(request, "user") and getattr(
             request.user, "is_authenticated", False
         ):
+            user = request.user
+
+        token = begin_request(user, request.headers.get("X-Request-Id", "")[:64])
+        try:
+            response = super().dispatch(request, *args, **kwargs)
+            ctx = get_request_context()
+            response["X-Request-Id"] = ctx.request_id
+            if ctx.profile_ids:
+                response["X-MCP-Profile-Id"] = ",".join(ctx.profile_ids)
+            return response
+        finally:
+            end_request(token)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # DRF has authenticated the request now (e.g. via API token)
+        if getattr(request.user, "is_authenticated", False):
             set_current_user(request.user)
+            if request.headers.get("X-MCP-Profile", "").lower() in ("1", "true", "yes"):
+                self._enable_profiling(request.user)
+
+    @staticmethod
+    def _enable_profiling(user):
+        """Profile this request's tool calls if the PROFILING setting is on and the user is staff."""
+        if not (user.is_staff or user.is_superuser):
+            logger.info("Ignoring X-MCP-Profile from non-staff user %s", user)
+        elif not get_bool_setting("PROFILING"):
+            logger.info("Ignoring X-MCP-Profile: the PROFILING plugin setting is off")
+        else:
+            get_request_context().profile = True
+
+
+class ExportView(APIView):
+    """Stream every row of a list resource as NDJSON, or as SSE if the client accepts only text/event-stream."""
+
+    authentication_classes = []  # Populated in as_view, like MCPView
+    permission_classes = [IsAuthenticated]
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        cls.authentication_classes = _authentication_classes()
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def get(self, request, resource):
+        token = begin_request(request.user, request.headers.get("X-Request-Id", "")[:64])
+        try:
+            request_id = get_request_context().request_id
+            if perm_err := require_permission(export_role(resource), "view"):
+                return HttpResponse(perm_err, content_type="application/json", status=403)
+            rows = export_rows(resource, request.query_params)
+        except ExportError as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        finally:
+            end_request(token)
+
+        accept = request.headers.get("Accept", "")
+        if "text/event-stream" in accept and "application/x-ndjson" not in accept:
+            response = StreamingHttpResponse(sse_stream(rows), content_type="text/event-stream")
+        else:
+            response = StreamingHttpResponse(ndjson_stream(rows), content_type="application/x-ndjson; charset=utf-8")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        response["X-Request-Id"] = request_id
+        return response
+
+
+class MetricsView(APIView):
+    """Per-tool call metrics in the Prometheus text format. Staff users only."""
+
+    authentication_classes = []  # Populated in as_view, like MCPView
+    permission_classes = [IsAuthenticated]
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        cls.authentication_classes = _authentication_classes()
+        return csrf_exempt(super().as_view(**initkwargs))
 
-        return super().dispatch(request, *args, **kwargs)
+    def get(self, request):
+        if not (request.user.is_staff or request.user.is_superuser):
+            return JsonResponse({"error": "Permission denied: staff access required"}, status=403)
+        return HttpResponse(render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8")
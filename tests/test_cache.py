@@ -0,0 +1,74 @@
+"""Result cache invalidation by the bulk write tools.
+
+Run in InvenTree's environment (see README, Development).
+"""
+
+import json
+import unittest
+from unittest import mock
+
+try:
+    from django.contrib.auth import get_user_model
+    from part.models import Part, PartParameter, PartParameterTemplate
+except ImportError as e:
+    raise unittest.SkipTest(f"InvenTree is not installed: {e}")
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase
+
+from inventree_mcp_plugin.context import begin_request, end_request
+from inventree_mcp_plugin.tools import cache
+from inventree_mcp_plugin.tools.parameters import bulk_set_part_parameters, get_part_parameters
+
+
+def call(tool, user, **kwargs):
+    """Call an MCP tool as `user` and decode its JSON result."""
+    token = begin_request(user)
+    try:
+        return json.loads(async_to_sync(tool)(**kwargs))
+    finally:
+        end_request(token)
+
+
+class BulkParameterInvalidationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_superuser("mcp-admin", "admin@example.com", "password")
+        cls.part = Part.objects.create(name="M3 screw", description="Test screw", component=True)
+        cls.thread = PartParameterTemplate.objects.create(name="Thread size")
+        cls.material = PartParameterTemplate.objects.create(name="Material")
+        PartParameter.objects.create(part=cls.part, template=cls.thread, data="M3")
+
+    def setUp(self):
+        self.store = cache._LocalStore(100, 300)
+        patcher = mock.patch.multiple(cache, _store=self.store, _store_ready=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cache.connect_signals()
+
+    def parameters(self):
+        result = call(get_part_parameters, self.user, part=self.part.pk)
+        return {row["template"]["pk"]: row["data"] for row in result["results"]}
+
+    def bulk_set(self, *assignments):
+        with self.captureOnCommitCallbacks(execute=True):
+            result = call(bulk_set_part_parameters, self.user, assignments=list(assignments))
+        self.assertEqual(result["errors"], 0, result)
+
+    def test_bulk_update_evicts_cached_parameters(self):
+        self.assertEqual(self.parameters(), {self.thread.pk: "M3"})
+        self.assertEqual(self.store.stats()["entries"], 1)
+
+        self.bulk_set({"part": self.part.pk, "template": self.thread.pk, "value": "M4"})
+
+        self.assertEqual(self.store.stats()["entries"], 0)
+        self.assertEqual(self.parameters(), {self.thread.pk: "M4"})
+
+    def test_bulk_create_evicts_cached_parameters(self):
+        self.parameters()
+        self.assertEqual(self.store.stats()["entries"], 1)
+
+        self.bulk_set({"part": self.part.pk, "template": self.material.pk, "value": "Steel"})
+
+        self.assertEqual(self.store.stats()["entries"], 0)
+        self.assertEqual(self.parameters(), {self.thread.pk: "M3", self.material.pk: "Steel"})
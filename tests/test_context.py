@@ -0,0 +1,98 @@
+"""The request context must never leak between concurrent requests."""
+
+import asyncio
+import random
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync, sync_to_async
+
+from inventree_mcp_plugin.context import (
+    begin_request,
+    end_request,
+    get_current_user,
+    get_request_context,
+    set_current_user,
+)
+
+REQUESTS = 200
+
+
+def _seen():
+    """What a tool body running in a worker thread observes."""
+    # Let other requests' work interleave with this one
+    time.sleep(random.random() / 1000)
+    ctx = get_request_context()
+    return get_current_user(), ctx.request_id if ctx is not None else None
+
+
+class RequestContextTests(unittest.TestCase):
+    def test_concurrent_requests_see_their_own_identity(self):
+        users = [SimpleNamespace(username=f"user{n}") for n in range(REQUESTS)]
+        in_thread = sync_to_async(_seen, thread_sensitive=False)
+        # The shared sync thread, where write tools run
+        in_sync_thread = sync_to_async(_seen)
+
+        async def request(n):
+            token = begin_request(users[n], f"request-{n}")
+            try:
+                await asyncio.sleep(random.random() / 1000)
+                seen = [await in_thread(), await in_sync_thread()]
+                # Concurrent tool calls within one request share its context
+                seen += await asyncio.gather(in_thread(), in_thread())
+                seen.append((get_current_user(), get_request_context().request_id))
+                return seen
+            finally:
+                end_request(token)
+
+        async def main():
+            return await asyncio.gather(*(request(n) for n in range(REQUESTS)))
+
+        results = asyncio.run(main())
+        for n, seen in enumerate(results):
+            for user, request_id in seen:
+                self.assertIs(user, users[n])
+                self.assertEqual(request_id, f"request-{n}")
+
+    def test_sync_views_in_threads(self):
+        # WSGI workers: each thread runs its own request and calls async code via async_to_sync
+        errors = []
+        barrier = threading.Barrier(16)
+
+        async def tool():
+            return await sync_to_async(_seen, thread_sensitive=False)()
+
+        def request(n):
+            user = SimpleNamespace(username=f"user{n}")
+            token = begin_request(None, f"thread-{n}")
+            try:
+                barrier.wait()
+                set_current_user(user)  # set after authentication, as MCPView.initial does
+                for _ in range(20):
+                    seen = async_to_sync(tool)()
+                    if seen != (user, f"thread-{n}"):
+                        errors.append((n, seen))
+            finally:
+                end_request(token)
+
+        threads = [threading.Thread(target=request, args=(n,)) for n in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_context_is_cleared_after_request(self):
+        token = begin_request(SimpleNamespace(username="alice"), "abc")
+        end_request(token)
+        self.assertIsNone(get_request_context())
+        self.assertIsNone(get_current_user())
+
+    def test_request_id_is_generated(self):
+        token = begin_request()
+        try:
+            self.assertEqual(len(get_request_context().request_id), 32)
+        finally:
+            end_request(token)
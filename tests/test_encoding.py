@@ -0,0 +1,111 @@
+"""Every JSON backend in tools.encoding must produce equivalent, valid JSON."""
+
+import datetime
+import decimal
+import json
+import unittest
+import uuid
+
+try:
+    from inventree_mcp_plugin.tools import encoding
+except ImportError as e:  # the tools package imports django-mcp-server
+    raise unittest.SkipTest(f"inventree_mcp_plugin.tools not importable: {e}")
+
+
+def _strict_loads(text):
+    """json.loads that rejects the non-standard NaN / Infinity tokens."""
+
+    def reject(token):
+        raise ValueError(f"invalid JSON token {token}")
+
+    return json.loads(text, parse_constant=reject)
+
+
+def _installed():
+    backends = {}
+    for backend in encoding.BACKENDS:
+        try:
+            backends[backend] = encoding.get_encoder(backend)
+        except ImportError:
+            pass
+    return backends
+
+
+# Identical bytes are expected for these (no Decimals, no UTC offsets)
+PAYLOAD = {
+    "pk": 12,
+    "name": "Résistance 10k – 0603",
+    "quantity": 2.5,
+    "ids": (1, 2, 3),
+    "tags": {"smd"},
+    "frozen": frozenset({7}),
+    "nan": float("nan"),
+    "limits": [float("inf"), float("-inf")],
+    "updated": datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+    "day": datetime.date(2024, 5, 1),
+    "uuid": uuid.UUID(int=1),
+    7: "integer key",
+    "nested": {"empty": [], "none": None, "flag": True},
+}
+
+# The same values are expected for these (msgspec keeps a Decimal's digits)
+DECIMALS = {
+    "quantity": decimal.Decimal("1.10"),
+    "big": decimal.Decimal("123456789.000001"),
+    "nan": decimal.Decimal("NaN"),
+    "inf": decimal.Decimal("-Infinity"),
+    "rows": [{"minimum_stock": decimal.Decimal("0")}],
+}
+
+
+class EncodingBackendTests(unittest.TestCase):
+    def setUp(self):
+        self.backends = _installed()
+
+    def test_identical_output(self):
+        expected = self.backends["json"][0](PAYLOAD)
+        _strict_loads(expected)
+        for backend, (dumps, dumpb, encode_into) in self.backends.items():
+            with self.subTest(backend=backend):
+                self.assertEqual(dumps(PAYLOAD), expected)
+                self.assertEqual(dumpb(PAYLOAD), expected.encode())
+                if encode_into is not None:
+                    buffer = bytearray(b"[")
+                    encode_into(PAYLOAD, buffer)
+                    self.assertEqual(bytes(buffer), b"[" + expected.encode())
+
+    def test_same_values_with_decimals(self):
+        expected = _strict_loads(self.backends["json"][0](DECIMALS))
+        self.assertEqual(expected["quantity"], 1.1)
+        self.assertIsNone(expected["nan"])
+        self.assertIsNone(expected["inf"])
+        for backend, (dumps, dumpb, _) in self.backends.items():
+            with self.subTest(backend=backend):
+                self.assertEqual(_strict_loads(dumps(DECIMALS)), expected)
+                self.assertEqual(_strict_loads(dumpb(DECIMALS)), expected)
+
+    def test_integers_beyond_64_bits(self):
+        data = {"big": 2**70, "nan": float("nan")}
+        for backend, (dumps, _, _) in self.backends.items():
+            with self.subTest(backend=backend):
+                self.assertEqual(dumps(data), '{"big":1180591620717411303424,"nan":null}')
+
+    def test_chunk_writer_output_is_valid(self):
+        writer = encoding.ChunkWriter()
+        writer.write({"pk": 1, "quantity": decimal.Decimal("NaN")})
+        writer.write({"pk": 2, "name": "NaN Infinity"}, b"data: ", b"\n\n")
+        chunk = writer.take().decode()
+        self.assertEqual(
+            chunk,
+            '{"pk":1,"quantity":null}\ndata: {"pk":2,"name":"NaN Infinity"}\n\n',
+        )
+        writer.write({"pk": 3})
+        self.assertEqual(writer.take(), b'{"pk":3}\n')
+
+    def test_dumps_sized_reports_utf8_bytes(self):
+        for data in (PAYLOAD, {"ascii": "only"}):
+            with self.subTest(data=data):
+                text, size = encoding.dumps_sized(data)
+                self.assertEqual(text, encoding.dumps(data))
+                self.assertEqual(size, len(text.encode()))
+                self.assertEqual(encoding.utf8_size(text), size)
@@ -0,0 +1,61 @@
+"""The icon registry cache file must never break or subvert icon validation."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    from inventree_mcp_plugin.tools import icons
+except ImportError as e:  # the tools package imports django-mcp-server
+    raise unittest.SkipTest(f"inventree_mcp_plugin.tools not importable: {e}")
+
+
+ICONS_JSON = {"tool": {"variants": {"outline": "<svg/>", "filled": "<svg/>"}}, "box": {"variants": {"outline": "<svg/>"}}}
+
+
+class IconCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source = os.path.join(tmp.name, "icons.json")
+        with open(self.source, "w") as f:
+            json.dump(ICONS_JSON, f)
+        self.cache_dir = os.path.join(tmp.name, "cache")
+        patcher = mock.patch.dict(os.environ, {"INVENTREE_MCP_CACHE_DIR": self.cache_dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def load(self):
+        icons._load_icons.cache_clear()
+        self.addCleanup(icons._load_icons.cache_clear)
+        with mock.patch.object(icons, "_find_icons_json", return_value=self.source):
+            return icons._load_icons()
+
+    def cache_file(self):
+        return icons._cache_path(self.cache_dir, self.source)
+
+    def test_cache_round_trip(self):
+        self.assertEqual(self.load().variants("tool"), ["filled", "outline"])
+        self.assertTrue(os.path.isfile(self.cache_file()))
+        self.assertEqual(os.stat(self.cache_dir).st_mode & 0o777, 0o700)
+        self.assertEqual(self.load().variants("tool"), ["filled", "outline"])
+
+    def test_wrong_shape_is_rebuilt(self):
+        self.load()
+        for header in ("[]", "{}", '{"variants": 5}', '{"variants": [1], "mtime_ns": 0, "size": 0, "sha256": ""}', "null"):
+            with self.subTest(header=header):
+                with open(self.cache_file(), "w") as f:
+                    f.write(f"{icons._CACHE_FORMAT}\n{header}\ntool\t1\n")
+                registry = self.load()
+                self.assertEqual(registry.variants("tool"), ["filled", "outline"])
+                self.assertIn("box", registry)
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "POSIX permissions")
+    def test_shared_directory_is_not_used(self):
+        os.makedirs(self.cache_dir)
+        os.chmod(self.cache_dir, 0o777)
+        self.assertIsNone(icons._cache_dir())
+        self.assertEqual(self.load().variants("box"), ["outline"])
+        self.assertFalse(os.path.exists(self.cache_file()))
@@ -0,0 +1,137 @@
+"""Bulk part tools: per-row validation and what reaches the database.
+
+Run in InvenTree's environment (see README, Development).
+"""
+
+import json
+import threading
+import unittest
+from collections import Counter
+
+try:
+    from django.contrib.auth import get_user_model
+    from part.models import Part
+except ImportError as e:
+    raise unittest.SkipTest(f"InvenTree is not installed: {e}")
+
+from asgiref.sync import async_to_sync
+from django.db import OperationalError, connections
+from django.test import TestCase, TransactionTestCase
+
+from inventree_mcp_plugin.context import begin_request, end_request
+from inventree_mcp_plugin.tools.parts import bulk_create_parts, bulk_update_parts
+
+
+def call(tool, user, **kwargs):
+    """Call an MCP tool as `user` and decode its JSON result."""
+    token = begin_request(user)
+    try:
+        return json.loads(async_to_sync(tool)(**kwargs))
+    finally:
+        end_request(token)
+
+
+class BulkUpdatePartsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_superuser("mcp-admin", "admin@example.com", "password")
+        cls.first = Part.objects.create(name="Bolt", IPN="BLT-1", description="First", component=True)
+        cls.second = Part.objects.create(name="Nut", IPN="NUT-1", description="Second", component=True)
+
+    def errors(self, result):
+        return {r["index"]: r["error"] for r in result.get("error_details", [])}
+
+    def test_rejected_row_is_not_written_by_a_repeat(self):
+        result = call(
+            bulk_update_parts,
+            self.user,
+            updates=[
+                {"id": self.first.pk, "fields": {"minimum_stock": -5}},
+                {"id": self.first.pk, "fields": {"description": "Changed"}},
+                {"id": self.second.pk, "fields": {"name": "Bolt", "IPN": "BLT-1"}},
+                {"id": self.second.pk, "fields": {"keywords": "hex"}},
+            ],
+        )
+        self.assertEqual(result["updated"], 0)
+        self.assertEqual(set(self.errors(result)), {0, 1, 2, 3})
+        self.assertIn("already updated by entry 0", self.errors(result)[1])
+
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+        self.assertEqual((self.first.minimum_stock, self.first.description), (0, "First"))
+        self.assertEqual((self.second.name, self.second.IPN, self.second.keywords), ("Nut", "NUT-1", ""))
+
+    def test_repeated_id_counts_once(self):
+        result = call(
+            bulk_update_parts,
+            self.user,
+            updates=[
+                {"id": self.first.pk, "fields": {"description": "Changed"}},
+                {"id": self.first.pk, "fields": {"description": "Changed again"}},
+            ],
+        )
+        self.assertEqual((result["updated"], result["errors"]), (1, 1))
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.description, "Changed")
+
+
+class BulkCreateTreeIdTests(TransactionTestCase):
+    """bulk_create_parts allocates MPTT tree ids itself; they must never be shared."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_superuser("mcp-admin", "admin@example.com", "password")
+
+    def assertUniqueTreeIds(self):
+        counts = Counter(Part.objects.values_list("tree_id", flat=True))
+        self.assertEqual([tree_id for tree_id, n in counts.items() if n > 1], [])
+
+    def test_interleaved_with_part_create(self):
+        call(bulk_create_parts, self.user, parts=[{"name": f"Bulk A{n}"} for n in range(5)])
+        single = Part.objects.create(name="Single", description="Saved normally")
+        result = call(bulk_create_parts, self.user, parts=[{"name": f"Bulk B{n}"} for n in range(5)])
+        self.assertEqual(result["created"], 5)
+        self.assertEqual(Part.objects.count(), 11)
+        self.assertUniqueTreeIds()
+        # the pks mapped back are the parts created
+        created = Part.objects.in_bulk([r["pk"] for r in result["results"]])
+        self.assertEqual(sorted(p.name for p in created.values()), [f"Bulk B{n}" for n in range(5)])
+        self.assertNotIn(single.pk, created)
+
+    def test_concurrent_with_part_create(self):
+        failures = []
+
+        def bulk(worker):
+            try:
+                for batch in range(3):
+                    parts = [{"name": f"Bulk {worker}-{batch}-{n}"} for n in range(10)]
+                    # A backend may refuse a write under contention (e.g. SQLite "database is locked");
+                    # that rolls the batch back and is fine. Shared tree ids are not.
+                    call(bulk_create_parts, self.user, parts=parts)
+            except Exception as e:
+                failures.append(e)
+            finally:
+                connections.close_all()
+
+        def single():
+            # One thread only: MPTT's own save() races with itself
+            try:
+                for n in range(20):
+                    try:
+                        Part.objects.create(name=f"Single {n}", description="Saved normally")
+                    except OperationalError:
+                        pass  # refused under contention, as above
+            except Exception as e:
+                failures.append(e)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=bulk, args=(worker,)) for worker in range(4)]
+        threads.append(threading.Thread(target=single))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(failures, [])
+        self.assertGreater(Part.objects.filter(name__startswith="Bulk").count(), 0)
+        self.assertUniqueTreeIds()
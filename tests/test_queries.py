@@ -0,0 +1,128 @@
+"""Query-count regression tests: list tools must not issue a query per row.
+
+Run in InvenTree's environment (see README, Development).
+"""
+
+import json
+import unittest
+from unittest import mock
+
+try:
+    from django.contrib.auth import get_user_model
+    from part.models import Part, PartCategory
+    from stock.models import StockItem, StockLocation
+except ImportError as e:
+    raise unittest.SkipTest(f"InvenTree is not installed: {e}")
+
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from inventree_mcp_plugin.context import begin_request, end_request
+from inventree_mcp_plugin.tools import cache
+from inventree_mcp_plugin.tools.categories import search_part_categories
+from inventree_mcp_plugin.tools.locations import search_stock_locations
+from inventree_mcp_plugin.tools.parts import search_parts
+from inventree_mcp_plugin.tools.stock import get_stock, get_stock_item, stock_transfer
+
+ROWS = 50
+
+
+def call(tool, user, **kwargs):
+    """Call an MCP tool as `user` and decode its JSON result."""
+    token = begin_request(user)
+    try:
+        return json.loads(async_to_sync(tool)(**kwargs))
+    finally:
+        end_request(token)
+
+
+class QueryCountTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_superuser("mcp-admin", "admin@example.com", "password")
+
+        cls.root_category = PartCategory.objects.create(name="Hardware", description="Mechanical parts")
+        categories = [
+            PartCategory.objects.create(name=f"Fasteners {n}", parent=cls.root_category) for n in range(ROWS)
+        ]
+
+        cls.root_location = StockLocation.objects.create(name="Warehouse")
+        locations = [StockLocation.objects.create(name=f"Shelf {n}", parent=cls.root_location) for n in range(ROWS)]
+
+        for n in range(ROWS):
+            part = Part.objects.create(
+                name=f"Widget {n}", description="Test widget", IPN=f"WID-{n:03}", category=categories[n], component=True
+            )
+            # Children and stock under every row, so per-row COUNTs would show up
+            PartCategory.objects.create(name=f"Screws {n}", parent=categories[n])
+            StockLocation.objects.create(name=f"Bin {n}", parent=locations[n])
+            for quantity in (1, 2):
+                StockItem.objects.create(part=part, location=locations[n], quantity=quantity)
+
+    def setUp(self):
+        # Measure the tools, not the result cache
+        patcher = mock.patch.multiple(cache, _store=None, _store_ready=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assertConstantQueries(self, tool, **kwargs):
+        """Assert `tool` issues as many queries for 1 row as for ROWS rows; returns that count."""
+        call(tool, self.user, limit=1, **kwargs)  # warm per-process caches (permissions, search backend)
+        counts = {}
+        for limit in (1, ROWS):
+            with CaptureQueriesContext(connection) as queries:
+                result = call(tool, self.user, limit=limit, **kwargs)
+            self.assertNotIn("error", result)
+            self.assertEqual(len(result["results"]), limit)
+            counts[limit] = len(queries)
+        self.assertEqual(
+            counts[1], counts[ROWS], f"{tool.__name__}: {counts[1]} queries for 1 row, {counts[ROWS]} for {ROWS}"
+        )
+        return counts[1]
+
+
+class ListToolQueryTests(QueryCountTestCase):
+    def test_search_parts(self):
+        self.assertConstantQueries(search_parts, search="widget")
+
+    def test_list_parts(self):
+        self.assertConstantQueries(search_parts, category=0)
+
+    def test_search_stock_locations(self):
+        self.assertConstantQueries(search_stock_locations, parent=self.root_location.pk)
+
+    def test_search_stock_locations_counts(self):
+        result = call(search_stock_locations, self.user, search="Shelf 7", limit=5)
+        shelf = next(r for r in result["results"] if r["name"] == "Shelf 7")
+        self.assertEqual(shelf["items"], 2)
+        self.assertEqual(shelf["sublocations"], 1)
+
+    def test_search_part_categories(self):
+        self.assertConstantQueries(search_part_categories, parent=self.root_category.pk)
+
+
+class StockDetailQueryTests(QueryCountTestCase):
+    def test_get_stock_detail(self):
+        self.assertConstantQueries(get_stock, detail=True)
+
+    def test_get_stock_item_matches_page(self):
+        page = call(get_stock, self.user, detail=True, limit=5)
+        for row in page["results"]:
+            self.assertEqual(call(get_stock_item, self.user, id=row["pk"]), row)
+
+
+class StockTransferQueryTests(QueryCountTestCase):
+    def transfer(self, items, location):
+        with CaptureQueriesContext(connection) as queries:
+            result = call(stock_transfer, self.user, items=[{"pk": item.pk} for item in items], location=location.pk)
+        self.assertEqual((result["moved"], result["errors"]), (len(items), 0), result)
+        return len(queries)
+
+    def test_stock_transfer(self):
+        items = list(StockItem.objects.order_by("pk")[: ROWS + 2])
+        self.transfer(items[:1], self.root_location)  # warm per-process caches
+        one = self.transfer(items[1:2], self.root_location)
+        many = self.transfer(items[2:], self.root_location)
+        self.assertEqual(one, many, f"stock_transfer: {one} queries for 1 item, {many} for {ROWS}")
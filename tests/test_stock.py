@@ -0,0 +1,58 @@
+"""Stock reporting tools: totals agree with the rows they summarize.
+
+Run in InvenTree's environment (see README, Development).
+"""
+
+import json
+import unittest
+
+try:
+    from django.contrib.auth import get_user_model
+    from part.models import Part
+    from stock.models import StockItem, StockLocation
+except ImportError as e:
+    raise unittest.SkipTest(f"InvenTree is not installed: {e}")
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase
+
+from inventree_mcp_plugin.context import begin_request, end_request
+from inventree_mcp_plugin.tools.stock import stock_summary
+
+
+def call(tool, user, **kwargs):
+    """Call an MCP tool as `user` and decode its JSON result."""
+    token = begin_request(user)
+    try:
+        return json.loads(async_to_sync(tool)(**kwargs))
+    finally:
+        end_request(token)
+
+
+class StockSummaryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_superuser("mcp-admin", "admin@example.com", "password")
+        cls.part = Part.objects.create(name="Resistor", description="10k", component=True)
+        cls.warehouse = StockLocation.objects.create(name="Warehouse")
+        cls.shelf = StockLocation.objects.create(name="Shelf", parent=cls.warehouse)
+        # Held directly at the root of the summary, in a child location and nowhere
+        StockItem.objects.create(part=cls.part, location=cls.warehouse, quantity=2)
+        StockItem.objects.create(part=cls.part, location=cls.shelf, quantity=3)
+        StockItem.objects.create(part=cls.part, location=None, quantity=4)
+
+    def summary(self, **kwargs):
+        result = call(stock_summary, self.user, group_by="location", **kwargs)
+        self.assertEqual(result["groups"], len(result["results"]), result)
+        return result
+
+    def test_stock_at_the_root_location_is_a_group(self):
+        result = self.summary(location=self.warehouse.pk)
+        direct = [r for r in result["results"] if r.get("direct")]
+        self.assertEqual([(r["location"], r["quantity"]) for r in direct], [(self.warehouse.pk, 2.0)])
+        self.assertEqual(result["total_quantity"], 5.0)
+
+    def test_stock_without_a_location_is_a_group(self):
+        result = self.summary()
+        self.assertIn({"location": None, "name": "(no location)", "quantity": 4.0, "items": 1, "parts": 1}, result["results"])
+        self.assertEqual(result["total_quantity"], 9.0)